@@ -360,6 +360,10 @@ def createApp():
     app.config['DEV_GROK_API_KEY'] = None if is_production else os.getenv('GROK_API_KEY')
     # Same dev-only fallback for the optional ElevenLabs key powering TTS.
     app.config['DEV_ELEVENLABS_API_KEY'] = None if is_production else os.getenv('ELEVENLABS_API_KEY')
+    # Render new narration / dialogue audio in the background as soon as it
+    # is persisted (see app/services/tts_prefetch.py) so playback starts
+    # from the cache. Set TTS_PREFETCH=0 to only synthesize on request.
+    app.config['TTS_PREFETCH_ENABLED'] = os.getenv('TTS_PREFETCH', '1') != '0'
     app.before_request(_csrf_protect)
     app.after_request(_csrf_set_cookie)
     app.after_request(_security_headers)
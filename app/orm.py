@@ -2,7 +2,7 @@ import os
 import random
 from datetime import datetime
 from dotenv import load_dotenv
-from sqlalchemy import create_engine, Column, Integer, Float, String, DateTime, ForeignKey, SmallInteger, BigInteger, Text, Boolean, Index
+from sqlalchemy import create_engine, Column, Integer, Float, String, DateTime, ForeignKey, SmallInteger, BigInteger, Text, Boolean, Index, UniqueConstraint
 from sqlalchemy.dialects import mysql
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship, sessionmaker
@@ -350,18 +350,35 @@ class QuestStep(Base):
 # NameLibrary: pre-seeded pool of names sourced from external libraries.
 # Populated once via scripts/seed_name_library.py and queried at world-building
 # time by NameService to assign names that match the seed's chosen themes.
+# The unique key lets the seeder dedupe in the database instead of in memory.
 class NameLibrary(Base):
     __tablename__ = 'NameLibrary'
+    __table_args__ = (UniqueConstraint('source', 'theme', 'gender', 'category', 'name',
+                                       name='uq_namelibrary_entry'),)
     id = Column(Integer, primary_key=True, autoincrement=True)
     source = Column(String(32), nullable=False, index=True)
     theme = Column(String(64), nullable=False, index=True)
     gender = Column(String(16), nullable=False, default='any', index=True)
     category = Column(String(16), nullable=False, default='first', index=True)
-    name = Column(String(128), nullable=False)
+    # Binary collation on MySQL so the unique key tells "Ael" from "ael"
+    # and "Aël"; the default *_ci collations would fold them together.
+    name = Column(String(128).with_variant(
+        mysql.VARCHAR(128, charset='utf8mb4', collation='utf8mb4_bin'), 'mysql'),
+        nullable=False)
     meaning = Column(Text)
     origin = Column(String(64))
     created_at = Column(DateTime, default=datetime.now)
 
+# NameLibrarySeedProgress: per-source checkpoint for scripts/seed_name_library.py.
+# ``rows_done`` counts the source's rows already written (committed in the same
+# transaction as the rows), so an interrupted run resumes after them.
+class NameLibrarySeedProgress(Base):
+    __tablename__ = 'NameLibrarySeedProgress'
+    source = Column(String(32), primary_key=True)
+    rows_done = Column(BigInteger, nullable=False, default=0)
+    completed = Column(Boolean, nullable=False, default=False)
+    updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now)
+
 # TranscriptEntry: chronological log of every text shown in the game UI for a
 # seed (world-building progress, narration, player input, combat output, etc.).
 # Persisted so the narrative panel can be replayed on refresh/resume. The id
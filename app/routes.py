@@ -7,31 +7,42 @@ import json
 import base64
 import queue
 import threading
+import time
 import uuid
+import weakref
+from contextlib import nullcontext
 from functools import wraps
 from werkzeug.security import generate_password_hash, check_password_hash
 
-from flask import Blueprint, jsonify, render_template, current_app, request, send_from_directory, session, Response, stream_with_context, abort
-from sqlalchemy import func
+from flask import Blueprint, jsonify, render_template, current_app, request, send_file, send_from_directory, session, Response, stream_with_context, abort
+from sqlalchemy import func, select
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import joinedload
 from openai import OpenAI
 
 from app.orm import (
-    Seed, User, Settings, Character, Location, LocationConnection,
-    GeographicFeature, Event, EventCharacter, Quest, CharacterItem, Item,
+    Seed, User, Settings, Character, Location,
+    Event, EventCharacter, Quest, CharacterItem, Item,
     CharacterSkill, Skill, CharacterStatus, Status, CharacterRelationship,
     TranscriptEntry, Scenario,
 )
 from app.services import transcript_service
+from app.services import character_index
+from app.services import context_cache
 from app.services import elevenlabs_service
 from app.services import time_service
 from app.services import dice_service
+from app.services import map_cache
 from app.services import travel_service
+from app.services import tts_prefetch
 from app.services import world_simulation
-from app.services.gpt_service import GPTService
+from app.services.json_stream import StringFieldStream
+from app.services.gpt_service import GPTService, pooled_async_client
 from app.services.name_service import NameService
 from app.world_building.world_building import WorldBuilder
-from app.world_building.schemas import TurnResponseOut, ActionAdjudicationOut
+from app.world_building.schemas import (
+    ActionAdjudicationOut, SuggestedActionsOut, TurnResponseOut,
+)
 from app.prompt_templates import STEREOTYPE_ANALYSIS, WORLD_BUILDING, ARBITER_ADJUDICATE
 from app import scenarios as _scenarios
 
@@ -61,6 +72,29 @@ world_builder = None
 # Store progress queues for each session
 progress_queues = {}
 
+# Deferred turn follow-ups (simulation news + suggestions) waiting for the
+# client to open ``/api/seed/<id>/turn/followup/<token>``. Each value holds
+# the owning seed id, the result queue and its creation time so abandoned
+# follow-ups can be pruned.
+turn_followups = {}
+# How long an unclaimed follow-up is kept, and how long the follow-up
+# stream waits for the background worker before giving up.
+TURN_FOLLOWUP_TTL_SECONDS = 300
+TURN_FOLLOWUP_WAIT_SECONDS = 120
+# Per-seed locks. A turn holds the seed's turn lock from reading
+# ``current_turn`` until it has bumped it; a deferred follow-up takes it
+# only around the simulator's writes, so the next turn never waits on the
+# follow-up's LLM calls. The follow-up lock keeps two follow-ups of one
+# seed from simulating the same tick. Weak values: a seed's locks go
+# away once no request is using them.
+_seed_turn_locks = weakref.WeakValueDictionary()
+_seed_followup_locks = weakref.WeakValueDictionary()
+_seed_locks_guard = threading.Lock()
+# How long ``tts_for_entry`` waits on a background prefetch that is already
+# rendering the same line before rendering it itself; waiting avoids
+# billing the line twice. Prefetches still queued are not waited for.
+TTS_PREFETCH_WAIT_SECONDS = 30
+
 
 def login_required(f):
     """Reject unauthenticated callers when LOGIN_REQUIRED is enabled.
@@ -166,14 +200,17 @@ def _seed_owned_by_caller(db_session, seed_id):
     signed-in user.
     """
     seed = db_session.query(Seed).filter(Seed.id == seed_id).first()
-    if seed is None:
+    if seed is None or not _caller_owns(seed.user_id):
         return None
+    return seed
+
+
+def _caller_owns(owner_id):
+    """Ownership half of ``_seed_owned_by_caller`` for an already-known owner."""
     if not current_app.config.get('LOGIN_REQUIRED'):
-        return seed
+        return True
     user_id = session.get('user_id')
-    if user_id is None or seed.user_id is None or seed.user_id != user_id:
-        return None
-    return seed
+    return user_id is not None and owner_id is not None and owner_id == user_id
 
 
 def _seed_id_owned_by_caller(db_session, seed_id):
@@ -289,6 +326,7 @@ def initialize_world_building_stream():
     seed_data = data.get('seed_data')
     grok_api_key = _extract_grok_api_key()
     elevenlabs_api_key = _extract_elevenlabs_api_key()
+    user_id = session.get('user_id')
 
     # Capture the real app object and config values up front so the background
     # thread does not depend on the request-bound current_app proxy.
@@ -352,12 +390,21 @@ def initialize_world_building_stream():
                 # of blocking on the whole opening passage at once.
                 intro_narration = results.pop('intro_narration', None) if isinstance(results, dict) else None
                 if intro_narration:
+                    intro_entries = []
                     for paragraph in _split_paragraphs(intro_narration):
-                        transcript_service.add_entry(
+                        row = transcript_service.add_entry(
                             session_factory, seed_id,
                             transcript_service.KIND_NARRATION, paragraph,
                             speaker='Narrator',
                         )
+                        if row is not None:
+                            intro_entries.append({
+                                'id': row.id, 'kind': row.kind,
+                                'speaker': row.speaker, 'text': row.text,
+                            })
+                    # The player hears the opening first, so voice it now.
+                    _prefetch_entry_audio(db_session, seed_id, intro_entries,
+                                          api_key=elevenlabs_api_key, user_id=user_id)
 
                 q.put({'type': 'complete', 'results': results})
             except Exception:
@@ -461,6 +508,15 @@ def save_settings():
         current_app.logger.exception('save_settings failed')
         return jsonify({'status': 'error', 'message': 'Failed to save settings.'}), 500
 
+# Columns ``/api/seeds`` may be sorted by (``?sort=``).
+SEED_SORT_COLUMNS = {
+    'created_at': Seed.created_at,
+    'updated_at': Seed.updated_at,
+    'current_turn': Seed.current_turn,
+    'seed_id': Seed.id,
+}
+
+
 @main.route('/api/seeds', methods=['GET'])
 @login_required
 def list_seeds():
@@ -470,31 +526,60 @@ def list_seeds():
     user only ever sees their own saves. Tests build their own Flask app
     without ``LOGIN_REQUIRED`` and have no session user; the filter is
     skipped there to keep the existing fixtures working.
+
+    Optional query params: ``sort`` (one of ``SEED_SORT_COLUMNS``, default
+    ``created_at``), ``order`` (``asc`` / ``desc``, default ``desc``),
+    ``limit`` and ``offset``. Without ``limit`` every seed is returned.
     """
+    sort = request.args.get('sort', 'created_at')
+    order = request.args.get('order', 'desc')
+    try:
+        limit_arg = _int_query_arg('limit')
+        offset = _int_query_arg('offset', 0)
+    except ValueError:
+        return jsonify({'error': 'Invalid pagination parameters.'}), 400
+    if sort not in SEED_SORT_COLUMNS or order not in ('asc', 'desc'):
+        return jsonify({'error': 'Invalid sort parameters.'}), 400
+    if (limit_arg is not None and limit_arg < 1) or offset < 0:
+        return jsonify({'error': 'Invalid pagination parameters.'}), 400
+
     Session = current_app.config['SESSION_FACTORY']
     db_session = Session()
     try:
-        query = db_session.query(Seed)
+        # The main character's name comes from a correlated subquery, so
+        # the listing is one round-trip no matter how many saves the user
+        # has, and only the listed seeds' characters are looked at.
+        main_name = (
+            select(func.min(Character.name))
+            .where(Character.seed_id == Seed.id,
+                   Character.main_character.is_(True))
+            .scalar_subquery()
+        )
+        query = db_session.query(Seed, main_name)
         if current_app.config.get('LOGIN_REQUIRED'):
             user_id = session.get('user_id')
             # Defensive: login_required already enforces session presence.
             # The == filter naturally excludes orphan (NULL user_id) rows.
             query = query.filter(Seed.user_id == user_id)
-        seeds = query.order_by(Seed.created_at.desc()).all()
-        result = []
-        for seed in seeds:
-            main_char = (
-                db_session.query(Character)
-                .filter(Character.seed_id == seed.id, Character.main_character == True)
-                .first()
-            )
-            result.append({
+        column = SEED_SORT_COLUMNS[sort]
+        if order == 'desc':
+            query = query.order_by(column.desc(), Seed.id.desc())
+        else:
+            query = query.order_by(column.asc(), Seed.id.asc())
+        if offset:
+            query = query.offset(offset)
+        if limit_arg is not None:
+            query = query.limit(limit_arg)
+        result = [
+            {
                 'seed_id': seed.id,
                 'created_at': seed.created_at.isoformat() if seed.created_at else None,
                 'updated_at': seed.updated_at.isoformat() if seed.updated_at else None,
                 'current_turn': seed.current_turn,
-                'main_character_name': main_char.name if main_char else None,
-            })
+                'main_character_name': main_character_name,
+            }
+            for seed, main_character_name in query.all()
+        ]
         return jsonify({'seeds': result}), 200
     except Exception:
         current_app.logger.exception('list_seeds failed')
@@ -578,6 +663,7 @@ def get_world(seed_id):
         if main_character:
             mc_relationship_rows = (
                 db_session.query(CharacterRelationship)
+                .options(joinedload(CharacterRelationship.related_character))
                 .filter(CharacterRelationship.character_id == main_character.id)
                 .all()
             )
@@ -620,6 +706,10 @@ def get_world(seed_id):
 
             stats = _build_stats(main_character)
 
+            # Each row's catalog entry is joined in up front: touching
+            # ``ci.item`` / ``cs.skill`` / ``cst.status`` lazily would cost a
+            # round-trip per distinct row, so page load would scale with
+            # the size of the inventory.
             items = [
                 {
                     'id': ci.id,
@@ -627,6 +717,7 @@ def get_world(seed_id):
                     'description': _item_description(ci),
                 }
                 for ci in db_session.query(CharacterItem)
+                .options(joinedload(CharacterItem.item))
                 .filter(CharacterItem.character_id == main_character.id)
                 .all()
             ]
@@ -638,6 +729,7 @@ def get_world(seed_id):
                     'description': _skill_description(cs),
                 }
                 for cs in db_session.query(CharacterSkill)
+                .options(joinedload(CharacterSkill.skill))
                 .filter(CharacterSkill.character_id == main_character.id)
                 .all()
             ]
@@ -649,6 +741,7 @@ def get_world(seed_id):
                     'description': _status_description(cst),
                 }
                 for cst in db_session.query(CharacterStatus)
+                .options(joinedload(CharacterStatus.status))
                 .filter(CharacterStatus.character_id == main_character.id)
                 .all()
             ]
@@ -675,7 +768,9 @@ def get_world(seed_id):
             for q in db_session.query(Quest).filter(Quest.seed_id == seed_id).all()
         ]
 
-        transcript = transcript_service.list_for_seed(db_session, seed_id)
+        # Only the latest window ships with the world; the client pages
+        # further back through /api/seed/<id>/transcript as the player scrolls.
+        transcript_page = transcript_service.page_for_seed(db_session, seed_id)
 
         # Resume an in-flight scenario on page load so the structured panel
         # remounts where the player left off. ``None`` means free-form turn.
@@ -714,7 +809,8 @@ def get_world(seed_id):
             'relationships': relationships,
             'stats': stats,
             'quests': quests,
-            'transcript': transcript,
+            'transcript': transcript_page['entries'],
+            'transcript_has_more': transcript_page['has_more'],
             'scenario': scenario_view,
             'current_location': current_location_view,
             'destinations': destinations,
@@ -726,6 +822,52 @@ def get_world(seed_id):
         db_session.close()
 
 
+# Upper bound on ``limit`` for a single transcript page request.
+TRANSCRIPT_MAX_PAGE_SIZE = 200
+
+
+def _int_query_arg(name, default=None):
+    """Integer query parameter; raises ``ValueError`` when it isn't one.
+
+    ``request.args.get(type=int)`` silently turns ``?limit=abc`` into the
+    default, which hides client bugs behind a plausible-looking response.
+    """
+    value = request.args.get(name)
+    if value is None or value == '':
+        return default
+    return int(value)
+
+
+@main.route('/api/seed/<int:seed_id>/transcript', methods=['GET'])
+@login_required
+def get_transcript(seed_id):
+    """Return one keyset page of the seed's transcript.
+
+    Query params: ``before_id`` / ``after_id`` (exclusive id cursors) and
+    ``limit`` (default ``TRANSCRIPT_PAGE_SIZE``). Responds with
+    ``{"entries": [...], "has_more": bool}``, entries oldest first.
+    """
+    try:
+        before_id = _int_query_arg('before_id')
+        after_id = _int_query_arg('after_id')
+        limit = _int_query_arg('limit', transcript_service.TRANSCRIPT_PAGE_SIZE)
+    except ValueError:
+        return jsonify({'error': 'Invalid paging parameters'}), 400
+    limit = max(1, min(limit, TRANSCRIPT_MAX_PAGE_SIZE))
+
+    Session = current_app.config['SESSION_FACTORY']
+    db_session = Session()
+    try:
+        if _seed_owned_by_caller(db_session, seed_id) is None:
+            return jsonify({'error': 'Seed not found'}), 404
+        return jsonify(transcript_service.page_for_seed(
+            db_session, seed_id,
+            before_id=before_id, after_id=after_id, limit=limit,
+        )), 200
+    finally:
+        db_session.close()
+
+
 @main.route('/api/world/<int:seed_id>/map', methods=['GET'])
 @login_required
 @grok_api_key_required
@@ -738,76 +880,32 @@ def get_world_map(seed_id):
     so the player can see settlements they haven't visited yet alongside
     the ones they have. Sub-locations are returned with their parent_id
     so the frontend can drill into a settlement on click.
+
+    The serialized payload is cached per seed (``map_cache``) with a
+    strong ETag, so a repeat open is served -- or answered with a 304 --
+    without a database round trip.
     """
     Session = current_app.config['SESSION_FACTORY']
     db_session = Session()
     try:
-        seed = _seed_owned_by_caller(db_session, seed_id)
-        if not seed:
+        bind = db_session.get_bind()
+        payload = map_cache.get(bind, seed_id)
+        if payload is None:
+            seed = _seed_owned_by_caller(db_session, seed_id)
+            if not seed:
+                return jsonify({'error': 'Seed not found'}), 404
+            payload = map_cache.load(db_session, bind, seed_id, seed.user_id)
+        elif not _caller_owns(payload.owner_id):
             return jsonify({'error': 'Seed not found'}), 404
 
-        all_locs = (
-            db_session.query(Location)
-            .filter(Location.seed_id == seed_id)
-            .all()
-        )
-        locations = [
-            {
-                'id': loc.id,
-                'name': loc.name,
-                'description': loc.description or '',
-                'longitude': loc.longitude,
-                'latitude': loc.latitude,
-                'type': loc.type,
-                'climate': loc.climate,
-                'terrain': loc.terrain,
-                'parent_id': loc.parent_id,
-            }
-            for loc in all_locs
-        ]
-
-        connections = [
-            {
-                'id': c.id,
-                'from_location_id': c.from_location_id,
-                'to_location_id': c.to_location_id,
-                'name': c.name or '',
-                'type': c.type or 'road',
-            }
-            for c in db_session.query(LocationConnection)
-            .filter(LocationConnection.seed_id == seed_id)
-            .all()
-        ]
-
-        # Natural geography (forests, rivers, mountain ranges, lakes, ...).
-        # Geometry is stored as JSON text so the frontend can hand the list
-        # straight to Leaflet; a malformed row is dropped rather than 500'd
-        # because the rest of the map should still render.
-        features = []
-        for f in (
-            db_session.query(GeographicFeature)
-            .filter(GeographicFeature.seed_id == seed_id)
-            .all()
-        ):
-            try:
-                points = json.loads(f.geometry) if f.geometry else []
-            except (ValueError, TypeError):
-                continue
-            features.append({
-                'id': f.id,
-                'name': f.name or '',
-                'type': f.type or 'forest',
-                'description': f.description or '',
-                'points': points,
-                'closed': bool(f.closed),
-            })
-
-        return jsonify({
-            'seed_id': seed_id,
-            'locations': locations,
-            'connections': connections,
-            'features': features,
-        }), 200
+        if request.if_none_match.contains(payload.etag):
+            resp = Response(status=304)
+        else:
+            resp = Response(payload.body, mimetype='application/json')
+        resp.set_etag(payload.etag)
+        # Revalidate every open: the geography can change under the ETag.
+        resp.headers['Cache-Control'] = 'private, no-cache'
+        return resp
     except Exception:
         current_app.logger.exception('get_world_map failed for seed_id=%s', seed_id)
         return jsonify({'error': 'Failed to load world map.'}), 500
@@ -815,6 +913,28 @@ def get_world_map(seed_id):
         db_session.close()
 
 
+# Transcript kinds folded into the per-turn context; world-building progress
+# lines and system notices are left out so the prompt budget goes to the
+# story beats the player has actually seen.
+TURN_STORY_KINDS = frozenset({
+    transcript_service.KIND_NARRATION,
+    transcript_service.KIND_PLAYER_INPUT,
+    transcript_service.KIND_DIALOGUE,
+    transcript_service.KIND_COMBAT,
+    transcript_service.KIND_QUEST,
+})
+
+
+def _loc(loc):
+    return {
+        'name': loc.name,
+        'description': loc.description or '',
+        'type': loc.type,
+        'climate': loc.climate,
+        'terrain': loc.terrain,
+    }
+
+
 def _build_turn_context(db_session, seed_id):
     """Collect the per-turn payload sent to the LLM.
 
@@ -822,90 +942,112 @@ def _build_turn_context(db_session, seed_id):
     locations and the recent transcript history (story beats only). Returns
     ``None`` when the seed has no main character or no locations yet, which
     indicates world-building hasn't finished.
-    """
-    main_character = (
-        db_session.query(Character)
-        .filter(Character.seed_id == seed_id, Character.main_character == True)
-        .first()
-    )
-    if not main_character:
-        return None
-
-    locations = (
-        db_session.query(Location)
-        .filter(Location.seed_id == seed_id, Location.parent_id.is_(None))
-        .all()
-    )
-    if not locations:
-        return None
 
-    character_payload = {
-        'name': main_character.name,
-        'race': main_character.race,
-        'level': main_character.level,
-        'current_health': main_character.current_health,
-        'max_health': main_character.max_health,
-    }
+    The slow-moving parts (character, locations, roster, transcript tail)
+    come from ``context_cache`` and are only queried on a miss; the clock
+    and off-screen news are read fresh every time.
+    """
+    cached = context_cache.for_seed(db_session, seed_id)
+    with cached.lock:
+        if cached.character is None:
+            main_character = (
+                db_session.query(Character)
+                .filter(Character.seed_id == seed_id, Character.main_character == True)
+                .first()
+            )
+            if not main_character:
+                return None
+            cached.character = {
+                'name': main_character.name,
+                'race': main_character.race,
+                'level': main_character.level,
+                'current_health': main_character.current_health,
+                'max_health': main_character.max_health,
+            }
+            cached.current_location = None
+        else:
+            main_character = None
+
+        if cached.locations is None:
+            locations = (
+                db_session.query(Location)
+                .filter(Location.seed_id == seed_id, Location.parent_id.is_(None))
+                .all()
+            )
+            if not locations:
+                return None
+            cached.locations = [dict(_loc(l), id=l.id) for l in locations]
+
+        # The "starting_location" prompt slot historically meant locations[0];
+        # with the travel system in play it now means the MC's CURRENT
+        # location, falling back to locations[0] for legacy seeds whose
+        # ``current_location_id`` was never set. The prompt key name is
+        # preserved so existing templates keep working.
+        if cached.current_location is None:
+            if main_character is None:
+                main_character = (
+                    db_session.query(Character)
+                    .filter(Character.seed_id == seed_id,
+                            Character.main_character == True)
+                    .first()
+                )
+            current_loc = travel_service.resolve_current_location(
+                db_session, seed_id, main_character)
+            if current_loc is None:
+                cached.current_location = dict(cached.locations[0], parent_id=None)
+            else:
+                cached.current_location = dict(
+                    _loc(current_loc), id=current_loc.id,
+                    parent_id=current_loc.parent_id)
+
+        # Pull the trailing transcript and drop world-building progress lines so
+        # the prompt focuses on the actual story beats the player has seen.
+        if cached.transcript is None or cached.transcript.maxlen != TURN_TRANSCRIPT_HISTORY:
+            recent = transcript_service.tail_for_seed(
+                db_session, seed_id, TURN_STORY_KINDS, TURN_TRANSCRIPT_HISTORY)
+            cached.set_transcript(
+                [(e['id'], e['speaker'] or e['kind'], e['text']) for e in recent],
+                TURN_STORY_KINDS, TURN_TRANSCRIPT_HISTORY,
+            )
 
-    def _loc(loc):
-        return {
-            'name': loc.name,
-            'description': loc.description or '',
-            'type': loc.type,
-            'climate': loc.climate,
-            'terrain': loc.terrain,
-        }
+        # Compact roster of every NPC the world already knows about. The LLM
+        # uses this to (a) attribute dialogue to existing characters by their
+        # canonical name and (b) decide whether a character needs to be newly
+        # introduced via the 'new_characters' field of the structured response.
+        if cached.npcs is None:
+            cached.npcs = [
+                context_cache.roster_entry(c) for c in (
+                    db_session.query(Character)
+                    .filter(Character.seed_id == seed_id,
+                            Character.main_character == False)
+                    .all()
+                )
+            ]
 
-    # The "starting_location" prompt slot historically meant locations[0];
-    # with the travel system in play it now means the MC's CURRENT
-    # location, falling back to locations[0] for legacy seeds whose
-    # ``current_location_id`` was never set. The prompt key name is
-    # preserved so existing templates keep working.
-    current_loc = travel_service.resolve_current_location(
-        db_session, seed_id, main_character) or locations[0]
-    starting_location = _loc(current_loc)
-    other_locations = [
-        _loc(l) for l in locations
-        if l.id != current_loc.id and l.id != getattr(current_loc, 'parent_id', None)
-    ]
+        character_payload = dict(cached.character)
+        current = cached.current_location
+        starting_location = {k: v for k, v in current.items() if k not in ('id', 'parent_id')}
+        other_locations = [
+            {k: v for k, v in l.items() if k != 'id'} for l in cached.locations
+            if l['id'] != current['id'] and l['id'] != current['parent_id']
+        ]
+        current_loc_id = current['id']
+        transcript_lines = [f"[{prefix}] {text}" for _, prefix, text in cached.transcript]
+        npcs = list(cached.npcs)
 
-    # Pull the trailing transcript and drop world-building progress lines so
-    # the prompt focuses on the actual story beats the player has seen.
-    full_transcript = transcript_service.list_for_seed(db_session, seed_id)
-    story_kinds = {
-        transcript_service.KIND_NARRATION,
-        transcript_service.KIND_PLAYER_INPUT,
-        transcript_service.KIND_DIALOGUE,
-        transcript_service.KIND_COMBAT,
-        transcript_service.KIND_QUEST,
-    }
-    recent = [e for e in full_transcript if e['kind'] in story_kinds][-TURN_TRANSCRIPT_HISTORY:]
-    transcript_lines = []
-    for entry in recent:
-        prefix = entry['speaker'] or entry['kind']
-        transcript_lines.append(f"[{prefix}] {entry['text']}")
     transcript_text = '\n'.join(transcript_lines) if transcript_lines else '(no prior beats)'
 
-    # Compact roster of every NPC the world already knows about. The LLM
-    # uses this to (a) attribute dialogue to existing characters by their
-    # canonical name and (b) decide whether a character needs to be newly
-    # introduced via the 'new_characters' field of the structured response.
-    npcs = (
-        db_session.query(Character)
-        .filter(Character.seed_id == seed_id, Character.main_character == False)
-        .all()
-    )
     if npcs:
         existing_lines = []
         for c in npcs:
-            bits = [c.name]
-            if c.race:
-                bits.append(c.race)
-            if c.gender is True:
+            bits = [c['name']]
+            if c['race']:
+                bits.append(c['race'])
+            if c['gender'] is True:
                 bits.append('male')
-            elif c.gender is False:
+            elif c['gender'] is False:
                 bits.append('female')
-            if c.alive is False:
+            if c['alive'] is False:
                 bits.append('deceased')
             existing_lines.append(' - ' + ', '.join(bits))
         existing_characters_text = '\n'.join(existing_lines)
@@ -920,7 +1062,7 @@ def _build_turn_context(db_session, seed_id):
     # hand. Events at the MC's current location are filtered out -- the
     # player saw those play out, they're not "news from afar".
     offscreen = world_simulation.recent_offscreen_events(
-        db_session, seed_id, current_loc.id, limit=4)
+        db_session, seed_id, current_loc_id, limit=4)
     if offscreen:
         ev_lines = []
         for ev in offscreen:
@@ -943,10 +1085,27 @@ def _build_turn_context(db_session, seed_id):
 
 
 def _make_gpt_service():
-    """Build a GPTService bound to the per-request Grok API key."""
+    """Build a GPTService bound to the per-request Grok API key.
+
+    The sync client is created per request; the async client comes from the
+    process-wide pool so concurrent fan-outs reuse warm connections.
+    """
     api_key = _extract_grok_api_key()
     client = OpenAI(api_key=api_key, base_url="https://api.x.ai/v1")
-    return GPTService(client, current_app.config['min_grok'])
+    async_client = pooled_async_client(api_key, "https://api.x.ai/v1")
+    return GPTService(client, current_app.config['min_grok'],
+                      async_openai=async_client)
+
+
+def _suggestions_call(context):
+    """The ``get_structured`` keyword arguments for the suggestion prompt."""
+    return {'prompt': WORLD_BUILDING['SUGGEST_ACTIONS'].format(**context),
+            'schema': SuggestedActionsOut, 'max_attempts': 1, 'temperature': 0.9}
+
+
+def _clean_suggestions(payload):
+    raw = payload.suggestions if payload is not None else []
+    return [str(s).strip() for s in raw if str(s).strip()][:4]
 
 
 def _generate_suggestions(gpt_service, context):
@@ -956,11 +1115,7 @@ def _generate_suggestions(gpt_service, context):
     UX nicety: callers should never abort a turn because this fails.
     """
     try:
-        prompt = WORLD_BUILDING['SUGGEST_ACTIONS'].format(**context)
-        text = gpt_service.get_response(prompt, json_mode=True, temperature=0.9)
-        data = GPTService._parse_json_payload(text) or {}
-        raw = data.get('suggestions') or []
-        return [str(s).strip() for s in raw if str(s).strip()][:4]
+        return _clean_suggestions(gpt_service.get_structured(**_suggestions_call(context)))
     except Exception as e:
         print(f'Suggestion generation failed: {e}')
         return []
@@ -1013,13 +1168,8 @@ def _create_dynamic_character(db_session, seed_id, payload, *,
     # If the LLM tries to "introduce" a character whose name already
     # exists for this seed, treat it as a no-op so dialogue lines that
     # reference the existing character resolve to the canonical row.
-    existing = (
-        db_session.query(Character)
-        .filter(Character.seed_id == seed_id,
-                func.lower(Character.name) == llm_name.lower())
-        .first()
-    )
-    if existing:
+    names = character_index.for_seed(db_session, seed_id)
+    if names.has_name(llm_name):
         return None
 
     name = llm_name
@@ -1028,7 +1178,8 @@ def _create_dynamic_character(db_session, seed_id, payload, *,
             themes = name_service.get_themes_for_seed(seed_id)
             if themes:
                 seeded = name_service.random_name(
-                    themes, gender=payload.gender, category='first')
+                    themes, gender=payload.gender, category='first',
+                    seed_id=seed_id)
                 if seeded:
                     name = seeded
         except Exception as e:
@@ -1038,15 +1189,8 @@ def _create_dynamic_character(db_session, seed_id, payload, *,
     # The library is a finite pool, so a popular theme can produce
     # collisions across consecutive turns; fall back to the LLM name when
     # the override would clash with an existing character on this seed.
-    if name != llm_name:
-        collision = (
-            db_session.query(Character)
-            .filter(Character.seed_id == seed_id,
-                    func.lower(Character.name) == name.lower())
-            .first()
-        )
-        if collision:
-            name = llm_name
+    if name != llm_name and names.has_name(name):
+        name = llm_name
 
     voice_id = None
     if elevenlabs_api_key:
@@ -1090,6 +1234,12 @@ def _create_dynamic_character(db_session, seed_id, payload, *,
     db_session.add(char)
     db_session.commit()
     db_session.refresh(char)
+    context_cache.note_character_added(db_session.get_bind(), seed_id, char)
+    # When the library renamed the character, the LLM's name stays an
+    # alias so the dialogue it wrote for that name still finds the row.
+    character_index.note_character_added(
+        db_session.get_bind(), seed_id, char,
+        aliases=(llm_name,) if name != llm_name else ())
 
     # Seed an MC <-> NPC acquaintance row so the new character isn't read
     # back as an "unknown" stranger by the world payload (familiarity == 0
@@ -1147,19 +1297,21 @@ def _split_paragraphs(text):
     return [p for p in parts if p]
 
 
-def _resolve_dialogue_speaker(db_session, seed_id, raw_speaker, name_lookup):
+def _resolve_dialogue_speaker(db_session, seed_id, raw_speaker):
     """Map a dialogue speaker string to its canonical Character.name.
 
-    The LLM occasionally drops case or trailing whitespace; ``name_lookup``
-    is a {lower(name): canonical_name} dict prebuilt from the seed's
-    characters (including ones created earlier in this turn) so we don't
-    re-query the DB per line. Falls back to the trimmed raw value when
-    nothing matches; the TTS layer will then default to the narrator voice.
+    The LLM occasionally drops case or trailing whitespace, or calls a
+    character by their first name or by the name it gave them before the
+    name library renamed them; the seed's cached ``CharacterIndex``
+    covers all of those without a query. Falls back to the trimmed raw
+    value when nothing matches; the TTS layer will then default to the
+    narrator voice.
     """
     cleaned = (raw_speaker or '').strip()
     if not cleaned:
         return ''
-    return name_lookup.get(cleaned.lower(), cleaned)
+    ref = character_index.for_seed(db_session, seed_id).find(cleaned)
+    return ref.name if ref is not None else cleaned
 
 
 def _arbiter_adjudicate(gpt_service, context):
@@ -1194,24 +1346,48 @@ def _default_ruling():
     )
 
 
+def _write_transcript_entry(session_factory, seed_id, kind, text, *, turn,
+                           speaker=None, meta=None, view=None, batch=None):
+    """Persist one transcript line now, or queue it on ``batch``.
+
+    Returns the JSON-friendly entry dict for the turn response (``view``
+    when given), or ``None`` when an immediate write failed. Queued dicts
+    get their ``id`` when the batch is flushed.
+    """
+    if view is None:
+        view = {'id': None, 'kind': kind, 'speaker': speaker, 'text': text}
+    if batch is not None:
+        return batch.add(kind, text, turn=turn, speaker=speaker, meta=meta,
+                         view=view)
+    entry = transcript_service.add_entry(
+        session_factory, seed_id, kind, text,
+        turn=turn, speaker=speaker, meta=meta,
+    )
+    if entry is None:
+        return None
+    view['id'] = entry.id
+    return view
+
+
 def _resolve_check(db_session, seed_id, character, ruling, *,
-                   session_factory, current_turn):
+                   session_factory, current_turn, batch=None):
     """Roll the check the Arbiter asked for and persist Arbiter + dice transcript lines.
 
     Returns ``(check_result, transcript_entries)`` where ``check_result``
     is a ``CheckResult`` (or ``None`` when the ruling didn't ask for a
     check) and ``transcript_entries`` is the JSON-friendly list of new
-    entries to surface to the frontend in the turn response.
+    entries to surface to the frontend in the turn response. With a
+    ``batch`` the lines are queued on it instead of written immediately.
     """
     entries = []
     # Arbiter ruling line first so the player sees WHY a roll is happening
     # before they see the dice land. Empty reasons are skipped.
     reason = (ruling.reason or '').strip()
     if reason:
-        arbiter_entry = transcript_service.add_entry(
+        arbiter_entry = _write_transcript_entry(
             session_factory, seed_id,
             transcript_service.KIND_ARBITER, reason,
-            turn=current_turn, speaker='Arbiter',
+            turn=current_turn, speaker='Arbiter', batch=batch,
             meta={
                 'requires_check': bool(ruling.requires_check),
                 'ability': ruling.ability,
@@ -1223,12 +1399,7 @@ def _resolve_check(db_session, seed_id, character, ruling, *,
             },
         )
         if arbiter_entry is not None:
-            entries.append({
-                'id': arbiter_entry.id,
-                'kind': transcript_service.KIND_ARBITER,
-                'speaker': 'Arbiter',
-                'text': reason,
-            })
+            entries.append(arbiter_entry)
     if not ruling.requires_check or character is None:
         return None, entries
 
@@ -1239,15 +1410,13 @@ def _resolve_check(db_session, seed_id, character, ruling, *,
         description=reason,
     )
     line = dice_service.format_check(result)
-    dice_entry = transcript_service.add_entry(
+    dice_entry = _write_transcript_entry(
         session_factory, seed_id,
         transcript_service.KIND_DICE, line,
         turn=current_turn, speaker='Arbiter',
-        meta=result.to_meta(),
-    )
-    if dice_entry is not None:
-        entries.append({
-            'id': dice_entry.id,
+        meta=result.to_meta(), batch=batch,
+        view={
+            'id': None,
             'kind': transcript_service.KIND_DICE,
             'speaker': 'Arbiter',
             'text': line,
@@ -1255,7 +1424,10 @@ def _resolve_check(db_session, seed_id, character, ruling, *,
             # d20 overlay with the actual face / verdict / colour ramp
             # without having to re-parse ``line``.
             'meta': result.to_meta(),
-        })
+        },
+    )
+    if dice_entry is not None:
+        entries.append(dice_entry)
     return result, entries
 
 
@@ -1296,6 +1468,353 @@ def _format_arbiter_outcome(ruling, check_result):
     return ' | '.join(bits) + '\n' + verdict
 
 
+def _start_triggered_scenario(db_session, seed_id, trigger, *, current_turn,
+                              session_factory, gpt_service):
+    """Start the scenario the narrator asked for; return its view or ``None``."""
+    if trigger is None:
+        return None
+    handler = _scenarios.get_handler(trigger.kind)
+    if handler is None:
+        return None
+    try:
+        started = handler.start(
+            db_session, seed_id, trigger,
+            current_turn=current_turn,
+            session_factory=session_factory,
+            gpt_service=gpt_service,
+        )
+    except Exception as e:
+        db_session.rollback()
+        print(f"Scenario start failed for kind '{trigger.kind}': {e}")
+        return None
+    if started is None:
+        return None
+    return _scenarios.scenario_view(db_session, started)
+
+
+def _run_turn_followup(db_session, seed_id, gpt_service, context, *,
+                       session_factory, with_suggestions, emit=None,
+                       write_lock=None):
+    """Run the post-turn simulation tick and suggestion refresh concurrently.
+
+    Both LLM prompts go out together through
+    ``GPTService.run_structured_many`` on the pooled async client, so the
+    follow-up costs the slower of the two calls rather than their sum; the
+    simulator's writes then happen on the calling thread. Both read the
+    same ``context`` snapshot. Returns ``(sim_entries, suggestions)``;
+    when ``emit`` is given each result is also pushed to it. Never raises.
+
+    ``write_lock`` (the seed's turn lock, for a deferred follow-up) is
+    held only while the simulator writes.
+    """
+    # ``simulation_call`` returns no call when not enough in-world time
+    # has elapsed, so a flurry of one-minute beats won't stack up calls.
+    sim_seed, sim_call = None, None
+    try:
+        sim_seed, sim_call = world_simulation.simulation_call(
+            db_session, seed_id, context=dict(context))
+    except Exception as e:
+        current_app.logger.warning(
+            "world_simulation tick failed on seed %s: %s", seed_id, e)
+    calls = [call for call in (
+        sim_call, _suggestions_call(dict(context)) if with_suggestions else None,
+    ) if call is not None]
+
+    results = []
+    if calls:
+        try:
+            results = gpt_service.run_structured_many(calls)
+        except Exception as e:
+            current_app.logger.warning(
+                "Turn follow-up LLM calls failed on seed %s: %s", seed_id, e)
+            results = [None] * len(calls)
+    results = iter(results)
+
+    # Any persisted news is returned so the caller can hand it to the
+    # player alongside the turn that triggered it.
+    sim_entries = []
+    if sim_call is not None:
+        try:
+            with write_lock or nullcontext():
+                _, sim_entries = world_simulation.apply_simulation(
+                    db_session, seed_id, sim_seed, next(results),
+                    session_factory=session_factory,
+                )
+        except Exception as e:
+            db_session.rollback()
+            current_app.logger.warning(
+                "world_simulation tick failed on seed %s: %s", seed_id, e)
+    if emit is not None and sim_entries:
+        emit({'type': 'entries', 'entries': sim_entries})
+
+    suggestions = []
+    if with_suggestions:
+        suggestions = _clean_suggestions(next(results))
+        if emit is not None:
+            emit({'type': 'suggestions', 'suggestions': suggestions})
+    return sim_entries or [], suggestions
+
+
+def _seed_lock(locks, seed_id):
+    with _seed_locks_guard:
+        lock = locks.get(seed_id)
+        if lock is None:
+            lock = locks[seed_id] = threading.Lock()
+        return lock
+
+
+def _seed_turn_lock(seed_id):
+    return _seed_lock(_seed_turn_locks, seed_id)
+
+
+def _seed_followup_lock(seed_id):
+    return _seed_lock(_seed_followup_locks, seed_id)
+
+
+def _release_once(lock):
+    """Return a callable releasing ``lock``; calls after the first are no-ops."""
+    state = {'held': True}
+    guard = threading.Lock()
+
+    def release():
+        with guard:
+            if not state['held']:
+                return
+            state['held'] = False
+        lock.release()
+    return release
+
+
+def _prune_turn_followups():
+    cutoff = time.monotonic() - TURN_FOLLOWUP_TTL_SECONDS
+    for token, pending in list(turn_followups.items()):
+        if pending['created'] < cutoff:
+            turn_followups.pop(token, None)
+
+
+def _defer_turn_followup(seed_id, gpt_service, context, *, session_factory,
+                         with_suggestions):
+    """Run ``_run_turn_followup`` on a background thread.
+
+    Results are queued for the follow-up stream; returns the token + URL the
+    client uses to collect them.
+    """
+    app = current_app._get_current_object()
+    _prune_turn_followups()
+    token = str(uuid.uuid4())
+    q = queue.Queue()
+    turn_followups[token] = {'seed_id': seed_id, 'queue': q,
+                             'created': time.monotonic()}
+
+    # Looked up now so the locks stay referenced while the thread runs.
+    turn_lock = _seed_turn_lock(seed_id)
+    followup_lock = _seed_followup_lock(seed_id)
+
+    def run_followup():
+        with app.app_context(), followup_lock:
+            db_session = session_factory()
+            try:
+                _run_turn_followup(
+                    db_session, seed_id, gpt_service, context,
+                    session_factory=session_factory,
+                    with_suggestions=with_suggestions, emit=q.put,
+                    write_lock=turn_lock,
+                )
+                q.put({'type': 'complete'})
+            except Exception:
+                db_session.rollback()
+                current_app.logger.exception(
+                    'turn follow-up failed for seed_id=%s', seed_id)
+                q.put({'type': 'error', 'message': 'Turn follow-up failed.'})
+            finally:
+                db_session.close()
+                q.put(None)
+
+    threading.Thread(target=run_followup, daemon=True).start()
+    return {'token': token,
+            'url': f'/api/seed/{seed_id}/turn/followup/{token}'}
+
+
+def _open_turn(db_session, seed_id, action, seed_data, *, session_factory):
+    """Shared opening of the turn endpoints.
+
+    Checks ownership and the scenario gate, persists the player's input and
+    builds the LLM context. Returns ``(seed, turn, context, None)`` or
+    ``(None, None, None, (payload, status))`` when the turn cannot start.
+    """
+    seed = _seed_owned_by_caller(db_session, seed_id)
+    if not seed:
+        return None, None, None, ({'success': False, 'message': 'Seed not found.'}, 404)
+
+    # If a scenario is in flight, the free-form turn loop is gated --
+    # the player must drive it to a resolution (or abort it) through
+    # the scenario routes before the narrator picks up the story.
+    active = _scenarios.active_scenario_for(db_session, seed_id)
+    if active is not None:
+        return None, None, None, ({
+            'success': False,
+            'message': 'A scenario is in progress; resolve it first.',
+            'scenario': _scenarios.scenario_view(db_session, active),
+        }, 409)
+
+    turn = seed.current_turn or 1
+
+    # Persist the player's input first so it shows up in the transcript
+    # even if the LLM call below fails.
+    transcript_service.add_entry(
+        session_factory, seed_id,
+        transcript_service.KIND_PLAYER_INPUT, action,
+        turn=turn, speaker='You',
+    )
+
+    context = _build_turn_context(db_session, seed_id)
+    if context is None:
+        return None, None, None, ({
+            'success': False,
+            'message': 'World is not ready yet; finish world building first.'
+        }, 409)
+    context['seed_data'] = seed_data
+    context['player_action'] = action
+    return seed, turn, context, None
+
+
+def _adjudicate_turn(db_session, seed_id, gpt_service, context, turn, *,
+                     session_factory, batch=None):
+    """Run the Arbiter pass and roll its check.
+
+    Returns ``(ruling, arbiter_entries)`` and fills
+    ``context['arbiter_outcome']`` for the narration prompt.
+    """
+    # Phase 3: Arbiter adjudication runs FIRST. The Arbiter picks an
+    # ability + DC + time cost, the substrate rolls the dice
+    # deterministically, and the verdict is then handed to the narrator
+    # so the prose always matches the mechanical result. Both the
+    # Arbiter ruling line and the dice roll land in the transcript ahead
+    # of the narration so the player sees them in the order they happened.
+    ruling, ruling_err = _arbiter_adjudicate(gpt_service, context)
+    if ruling_err:
+        current_app.logger.warning(
+            "Arbiter adjudication fell back to auto-success on seed %s: %s",
+            seed_id, ruling_err,
+        )
+    main_character = (
+        db_session.query(Character)
+        .filter(Character.seed_id == seed_id,
+                Character.main_character == True)  # noqa: E712
+        .first()
+    )
+    check_result, arbiter_entries = _resolve_check(
+        db_session, seed_id, main_character, ruling,
+        session_factory=session_factory, current_turn=turn, batch=batch,
+    )
+    context['arbiter_outcome'] = _format_arbiter_outcome(ruling, check_result)
+    return ruling, arbiter_entries
+
+
+def _persist_turn_cast(db_session, seed_id, seed, turn_payload):
+    """Persist the turn's newly introduced characters.
+
+    Returns the ``(Character, llm_name)`` pairs that were created. Each
+    one is added to the seed's ``CharacterIndex`` (under the LLM's name
+    too when it was renamed), which is what dialogue lines are resolved
+    against.
+    """
+    # Newly introduced characters land before dialogue so lines that
+    # reference them resolve to the correct (just-created) Character row.
+    # ``name_service`` lets the dynamic-character path draw names from
+    # the seed's NameLibrary subset, mirroring world-build behavior so
+    # mid-game NPCs share the same naming aesthetic as their peers.
+    elevenlabs_api_key = _extract_elevenlabs_api_key()
+    current_dt = seed.current_date_time
+    name_service = NameService(db_session)
+    created_characters = []
+    for new_char in turn_payload.new_characters:
+        original_name = (getattr(new_char, 'name', '') or '').strip()
+        char = _create_dynamic_character(
+            db_session, seed_id, new_char,
+            elevenlabs_api_key=elevenlabs_api_key,
+            current_dt=current_dt,
+            name_service=name_service,
+        )
+        if char is not None:
+            created_characters.append((char, original_name))
+    return created_characters
+
+
+def _persist_narration_paragraph(session_factory, seed_id, turn, paragraph, *,
+                                 batch=None):
+    """Persist one narrator paragraph; return its entry dict or ``None``."""
+    # Each paragraph lands as its own entry so TTS playback can stream
+    # paragraph-by-paragraph instead of blocking on a single long
+    # synthesis call.
+    return _write_transcript_entry(
+        session_factory, seed_id,
+        transcript_service.KIND_NARRATION, paragraph,
+        turn=turn, speaker='Narrator', batch=batch,
+    )
+
+
+def _persist_turn_dialogue(db_session, seed_id, turn, turn_payload, *,
+                           session_factory, batch=None):
+    """Persist per-character dialogue lines; return their entry dicts."""
+    # Attributed individually so the frontend renders + voices each one as
+    # the speaking character.
+    entries = []
+    for line in turn_payload.dialogue:
+        text = (line.text or '').strip()
+        if not text:
+            continue
+        speaker = _resolve_dialogue_speaker(db_session, seed_id, line.speaker)
+        dialogue_entry = _write_transcript_entry(
+            session_factory, seed_id,
+            transcript_service.KIND_DIALOGUE, text,
+            turn=turn, speaker=speaker or None, batch=batch,
+            view={'id': None, 'kind': transcript_service.KIND_DIALOGUE,
+                  'speaker': speaker, 'text': text},
+        )
+        if dialogue_entry is not None:
+            entries.append(dialogue_entry)
+    return entries
+
+
+def _close_turn(db_session, seed_id, seed, turn, ruling, turn_payload, context, *,
+                gpt_service, session_factory):
+    """Advance the turn + clock, then start any scenario the narrator asked for.
+
+    Returns ``(scenario_view, followup_context)``; the context is a fresh
+    snapshot taken after the commit for the simulator and suggestions.
+    """
+    # Bump the turn counter only after a successful narration so failed
+    # turns can be retried without skipping ahead. The world clock
+    # advances by the Arbiter's adjudicated cost (the Arbiter is the
+    # source of truth for time); the narrator no longer estimates time
+    # itself. Falls back to the default per-turn pace if the Arbiter's
+    # value is missing or non-positive so the clock keeps ticking either way.
+    seed.current_turn = turn + 1
+    time_cost = int(getattr(ruling, 'time_cost_minutes', 0) or 0)
+    if time_cost <= 0:
+        time_cost = time_service.DEFAULT_TURN_MINUTES
+    time_service.advance_time(db_session, seed, time_cost)
+    seed.updated_at = datetime.datetime.now()
+    db_session.commit()
+
+    # One context snapshot, taken after the turn landed, feeds both the
+    # simulator and the suggestion refresh.
+    followup_context = _build_turn_context(db_session, seed_id) or context
+    followup_context['seed_data'] = context.get('seed_data', '')
+
+    # If the narrator asked to hand off to a structured scenario, spin
+    # one up now so the response carries it back to the client. Failures
+    # here are non-fatal: the standard turn already landed, the player
+    # just gets the trigger as a hint to retry / pick differently.
+    scenario_view = _start_triggered_scenario(
+        db_session, seed_id, getattr(turn_payload, 'scenario_trigger', None),
+        current_turn=seed.current_turn,
+        session_factory=session_factory, gpt_service=gpt_service,
+    )
+    return scenario_view, followup_context
+
+
 @main.route('/api/seed/<int:seed_id>/turn', methods=['POST'])
 @login_required
 @grok_api_key_required
@@ -1308,6 +1827,10 @@ def submit_turn(seed_id):
     lines, and any newly introduced characters), persists each piece as a
     separate transcript entry attributed to the right speaker, and returns
     the full ordered batch of new entries alongside a fresh suggestion list.
+
+    With ``"defer_followup": true`` in the body the response comes back as
+    soon as the narration is persisted; simulation news and suggestions are
+    then streamed from the ``followup.url`` it carries.
     """
     data = request.get_json(silent=True) or {}
     action = (data.get('action') or '').strip()
@@ -1319,67 +1842,26 @@ def submit_turn(seed_id):
     Session = current_app.config['SESSION_FACTORY']
     session_factory = Session
     db_session = Session()
+    turn_lock = _seed_turn_lock(seed_id)
+    turn_lock.acquire()
 
     try:
-        seed = _seed_owned_by_caller(db_session, seed_id)
-        if not seed:
-            return jsonify({'success': False, 'message': 'Seed not found.'}), 404
-
-        # If a scenario is in flight, the free-form turn loop is gated --
-        # the player must drive it to a resolution (or abort it) through
-        # the scenario routes before the narrator picks up the story.
-        active = _scenarios.active_scenario_for(db_session, seed_id)
-        if active is not None:
-            return jsonify({
-                'success': False,
-                'message': 'A scenario is in progress; resolve it first.',
-                'scenario': _scenarios.scenario_view(db_session, active),
-            }), 409
-
-        turn = seed.current_turn or 1
-
-        # Persist the player's input first so it shows up in the transcript
-        # even if the LLM call below fails.
-        transcript_service.add_entry(
-            session_factory, seed_id,
-            transcript_service.KIND_PLAYER_INPUT, action,
-            turn=turn, speaker='You',
+        seed, turn, context, error = _open_turn(
+            db_session, seed_id, action, seed_data,
+            session_factory=session_factory,
         )
+        if error is not None:
+            return jsonify(error[0]), error[1]
 
-        context = _build_turn_context(db_session, seed_id)
-        if context is None:
-            return jsonify({
-                'success': False,
-                'message': 'World is not ready yet; finish world building first.'
-            }), 409
-        context['seed_data'] = seed_data
-        context['player_action'] = action
-
+        # Everything this turn writes to the transcript is queued on one
+        # batch and flushed in a single transaction once the narration is
+        # in; the player's own input was already written by ``_open_turn``.
+        batch = transcript_service.TranscriptBatch(session_factory, seed_id, turn=turn)
         gpt_service = _make_gpt_service()
-
-        # Phase 3: Arbiter adjudication runs FIRST. The Arbiter picks an
-        # ability + DC + time cost, the substrate rolls the dice
-        # deterministically, and the verdict is then handed to the narrator
-        # so the prose always matches the mechanical result. Both the
-        # Arbiter ruling line and the dice roll land in the transcript ahead
-        # of the narration so the player sees them in the order they happened.
-        ruling, ruling_err = _arbiter_adjudicate(gpt_service, context)
-        if ruling_err:
-            current_app.logger.warning(
-                "Arbiter adjudication fell back to auto-success on seed %s: %s",
-                seed_id, ruling_err,
-            )
-        main_character = (
-            db_session.query(Character)
-            .filter(Character.seed_id == seed_id,
-                    Character.main_character == True)  # noqa: E712
-            .first()
-        )
-        check_result, arbiter_entries = _resolve_check(
-            db_session, seed_id, main_character, ruling,
-            session_factory=session_factory, current_turn=turn,
+        ruling, _ = _adjudicate_turn(
+            db_session, seed_id, gpt_service, context, turn,
+            session_factory=session_factory, batch=batch,
         )
-        context['arbiter_outcome'] = _format_arbiter_outcome(ruling, check_result)
 
         narration_prompt = WORLD_BUILDING['CONTINUE_NARRATIVE'].format(**context)
         try:
@@ -1388,177 +1870,59 @@ def submit_turn(seed_id):
                 max_attempts=2, temperature=1.0,
             )
         except Exception as e:
+            # The roll still happened; keep it in the transcript.
+            batch.flush()
             return jsonify({'success': False, 'message': f'Narration failed: {e}'}), 502
         if turn_payload is None:
+            batch.flush()
             return jsonify({'success': False,
                             'message': 'Narration failed: invalid LLM payload.'}), 502
 
         narration = (turn_payload.narration or '').strip()
-        # Arbiter ruling + dice entries come first so they precede the
-        # narration in the transcript order the frontend renders.
-        entries = list(arbiter_entries)
-
-        # 1) Newly introduced characters land first so dialogue lines that
-        # reference them resolve to the correct (just-created) Character row.
-        # ``name_service`` lets the dynamic-character path draw names from
-        # the seed's NameLibrary subset, mirroring world-build behavior so
-        # mid-game NPCs share the same naming aesthetic as their peers.
-        elevenlabs_api_key = _extract_elevenlabs_api_key()
-        current_dt = seed.current_date_time
-        name_service = NameService(db_session)
-        created_characters = []
-        # Track the LLM-supplied names alongside each persisted Character so
-        # dialogue lines that reference the original name still resolve to
-        # the (possibly renamed) row's canonical name.
-        for new_char in turn_payload.new_characters:
-            original_name = (getattr(new_char, 'name', '') or '').strip()
-            char = _create_dynamic_character(
-                db_session, seed_id, new_char,
-                elevenlabs_api_key=elevenlabs_api_key,
-                current_dt=current_dt,
-                name_service=name_service,
-            )
-            if char is not None:
-                created_characters.append((char, original_name))
-
-        # Build a lookup of every character name in this seed (including
-        # the MC and the ones created above) so dialogue speakers map to
-        # canonical names. The first-name alias catches the common LLM
-        # habit of calling characters by their given name only, which
-        # would otherwise leave the TTS layer unable to resolve a voice.
-        name_lookup = {}
-        for c in (
-            db_session.query(Character)
-            .filter(Character.seed_id == seed_id)
-            .all()
-        ):
-            full = (c.name or '').strip()
-            if not full:
-                continue
-            name_lookup[full.lower()] = full
-            first = full.split()[0].lower()
-            name_lookup.setdefault(first, full)
-
-        # When a dynamic character was renamed by the library override,
-        # alias the LLM-supplied name (and its first-name token) so the
-        # dialogue lines the LLM produced for the original name still map
-        # to the persisted character.
-        for char, original_name in created_characters:
-            if not original_name:
-                continue
-            if original_name.lower() == (char.name or '').lower():
-                continue
-            name_lookup.setdefault(original_name.lower(), char.name)
-            original_first = original_name.split()[0].lower() if original_name else ''
-            if original_first:
-                name_lookup.setdefault(original_first, char.name)
-
-        # 2) Narrator prose (if any). Each paragraph lands as its own entry
-        # so TTS playback can stream paragraph-by-paragraph instead of
-        # blocking on a single long synthesis call.
+
+        created_characters = _persist_turn_cast(
+            db_session, seed_id, seed, turn_payload)
+
+        # Arbiter ruling + dice entries were queued first so they precede
+        # the narration in the transcript order the frontend renders.
         for paragraph in _split_paragraphs(narration):
-            narration_entry = transcript_service.add_entry(
-                session_factory, seed_id,
-                transcript_service.KIND_NARRATION, paragraph,
-                turn=turn, speaker='Narrator',
-            )
-            if narration_entry is not None:
-                entries.append({
-                    'id': narration_entry.id,
-                    'kind': transcript_service.KIND_NARRATION,
-                    'speaker': 'Narrator',
-                    'text': paragraph,
-                })
-
-        # 3) Per-character dialogue lines, attributed individually so the
-        # frontend renders + voices each one as the speaking character.
-        for line in turn_payload.dialogue:
-            text = (line.text or '').strip()
-            if not text:
-                continue
-            speaker = _resolve_dialogue_speaker(
-                db_session, seed_id, line.speaker, name_lookup,
-            )
-            dialogue_entry = transcript_service.add_entry(
-                session_factory, seed_id,
-                transcript_service.KIND_DIALOGUE, text,
-                turn=turn, speaker=speaker or None,
-            )
-            if dialogue_entry is not None:
-                entries.append({
-                    'id': dialogue_entry.id,
-                    'kind': transcript_service.KIND_DIALOGUE,
-                    'speaker': speaker,
-                    'text': text,
-                })
-
-        # Bump the turn counter only after a successful narration so failed
-        # turns can be retried without skipping ahead. The world clock
-        # advances by the Arbiter's adjudicated cost (the Arbiter is the
-        # source of truth for time); the narrator no longer estimates time
-        # itself. Falls back to the default per-turn pace if the Arbiter's
-        # value is missing or non-positive so the clock keeps ticking either way.
-        seed.current_turn = turn + 1
-        time_cost = int(getattr(ruling, 'time_cost_minutes', 0) or 0)
-        if time_cost <= 0:
-            time_cost = time_service.DEFAULT_TURN_MINUTES
-        time_service.advance_time(db_session, seed, time_cost)
-        seed.updated_at = datetime.datetime.now()
-        db_session.commit()
+            _persist_narration_paragraph(session_factory, seed_id, turn, paragraph,
+                                         batch=batch)
+        _persist_turn_dialogue(
+            db_session, seed_id, turn, turn_payload,
+            session_factory=session_factory, batch=batch,
+        )
+        entries = batch.flush()
+        _prefetch_entry_audio(db_session, seed_id, entries,
+                              api_key=_extract_elevenlabs_api_key(),
+                              user_id=session.get('user_id'))
 
-        # Phase 5: now that the world clock has advanced, give the
-        # autonomous simulator a chance to draft fresh off-screen news.
-        # ``maybe_simulate`` is a no-op when not enough in-world time has
-        # elapsed, so a flurry of one-minute beats won't stack up calls.
-        # Failures are swallowed inside the service; any persisted news
-        # gets appended to the transcript entries the player sees this
-        # turn so the response carries the gossip with it.
-        try:
-            sim_context = _build_turn_context(db_session, seed_id) or context
-            sim_context['seed_data'] = seed_data
-            _, sim_entries = world_simulation.maybe_simulate(
-                db_session, seed_id, gpt_service,
-                context=sim_context, session_factory=session_factory,
-            )
-            if sim_entries:
-                entries.extend(sim_entries)
-        except Exception as e:
-            current_app.logger.warning(
-                "world_simulation tick failed on seed %s: %s", seed_id, e)
+        scenario_view, followup_context = _close_turn(
+            db_session, seed_id, seed, turn, ruling, turn_payload, context,
+            gpt_service=gpt_service, session_factory=session_factory,
+        )
 
-        # If the narrator asked to hand off to a structured scenario, spin
-        # one up now so the response carries it back to the client. Failures
-        # here are non-fatal: the standard turn already landed, the player
-        # just gets the trigger as a hint to retry / pick differently.
-        scenario_view = None
-        trigger = getattr(turn_payload, 'scenario_trigger', None)
-        if trigger is not None:
-            handler = _scenarios.get_handler(trigger.kind)
-            if handler is not None:
-                try:
-                    started = handler.start(
-                        db_session, seed_id, trigger,
-                        current_turn=seed.current_turn,
-                        session_factory=session_factory,
-                        gpt_service=gpt_service,
-                    )
-                except Exception as e:
-                    db_session.rollback()
-                    started = None
-                    print(f"Scenario start failed for kind '{trigger.kind}': {e}")
-                if started is not None:
-                    scenario_view = _scenarios.scenario_view(db_session, started)
-
-        # Refresh suggestions against the now-updated transcript so the next
-        # batch reflects what just happened. Failure here is non-fatal.
-        # Skip suggestions while a scenario is active -- the player's next
-        # input must go through the scenario action endpoint, not a free
-        # action prompt.
+        # Phase 5: give the autonomous simulator a chance to draft fresh
+        # off-screen news and refresh the suggestions, concurrently. Skip
+        # suggestions while a scenario is active -- the player's next input
+        # must go through the scenario action endpoint, not a free action
+        # prompt. With ``defer_followup`` the turn returns now and both
+        # results are streamed from the follow-up endpoint instead.
         suggestions = []
-        if scenario_view is None:
-            refreshed_context = _build_turn_context(db_session, seed_id) or context
-            refreshed_context['seed_data'] = seed_data
-            suggestions = _generate_suggestions(gpt_service, refreshed_context)
+        followup = None
+        if data.get('defer_followup'):
+            followup = _defer_turn_followup(
+                seed_id, gpt_service, followup_context,
+                session_factory=session_factory,
+                with_suggestions=scenario_view is None,
+            )
+        else:
+            sim_entries, suggestions = _run_turn_followup(
+                db_session, seed_id, gpt_service, followup_context,
+                session_factory=session_factory,
+                with_suggestions=scenario_view is None,
+            )
+            entries.extend(sim_entries)
 
         # ``narration`` / ``narration_id`` are kept for backwards compatibility
         # with older frontends; new code should iterate ``entries`` instead.
@@ -1580,6 +1944,7 @@ def submit_turn(seed_id):
             'turn': seed.current_turn,
             'clock': time_service.serialize_clock(seed),
             'scenario': scenario_view,
+            'followup': followup,
         }), 200
     except Exception:
         db_session.rollback()
@@ -1587,6 +1952,252 @@ def submit_turn(seed_id):
         return jsonify({'success': False, 'message': 'Turn failed; please retry.'}), 500
     finally:
         db_session.close()
+        turn_lock.release()
+
+
+def _take_paragraphs(buffer):
+    """Split completed paragraphs off the front of streamed narration.
+
+    Returns ``(paragraphs, rest)``; ``rest`` is the unfinished tail that
+    must wait for more text. Paragraph boundaries match ``_split_paragraphs``
+    so a streamed turn persists exactly the entries a buffered one would.
+    """
+    paragraphs = []
+    while True:
+        match = re.search(r'\n\s*\n', buffer)
+        if match is None:
+            return paragraphs, buffer
+        paragraph = buffer[:match.start()].strip()
+        if paragraph:
+            paragraphs.append(paragraph)
+        buffer = buffer[match.end():]
+
+
+def _sse(item):
+    return f"data: {json.dumps(item)}\n\n"
+
+
+@main.route('/api/seed/<int:seed_id>/turn/stream', methods=['POST'])
+@login_required
+@grok_api_key_required
+@limit("60 per minute")
+def submit_turn_stream(seed_id):
+    """Streaming variant of ``submit_turn`` delivered as Server-Sent Events.
+
+    Events, in order: ``entry`` for the Arbiter ruling and dice roll,
+    ``narration_delta`` chunks while the narrator writes, an ``entry`` per
+    narration paragraph as soon as it is complete (already persisted, so it
+    carries an id for TTS), ``entry`` per dialogue line, a ``turn`` summary
+    (new characters, turn, clock, scenario), the follow-up ``entries`` /
+    ``suggestions`` events and finally ``complete``. Failures after the
+    stream has started arrive as an ``error`` event.
+    """
+    data = request.get_json(silent=True) or {}
+    action = (data.get('action') or '').strip()
+    seed_data = data.get('seed_data') or ''
+
+    if not action:
+        return jsonify({'success': False, 'message': 'Action is required.'}), 400
+
+    Session = current_app.config['SESSION_FACTORY']
+    session_factory = Session
+    db_session = Session()
+    # Held from reading ``current_turn`` in ``_open_turn`` until
+    # ``_close_turn`` has bumped it, like ``submit_turn``. The generator
+    # owns the release once the response is built; ``call_on_close``
+    # covers a stream that is never started.
+    turn_lock = _seed_turn_lock(seed_id)
+    turn_lock.acquire()
+    release_turn = _release_once(turn_lock)
+
+    try:
+        seed, turn, context, error = _open_turn(
+            db_session, seed_id, action, seed_data,
+            session_factory=session_factory,
+        )
+    except Exception:
+        db_session.rollback()
+        db_session.close()
+        release_turn()
+        current_app.logger.exception('submit_turn_stream failed for seed_id=%s', seed_id)
+        return jsonify({'success': False, 'message': 'Turn failed; please retry.'}), 500
+    if error is not None:
+        db_session.close()
+        release_turn()
+        return jsonify(error[0]), error[1]
+    elevenlabs_api_key = _extract_elevenlabs_api_key()
+    user_id = session.get('user_id')
+
+    def generate():
+        try:
+            gpt_service = _make_gpt_service()
+            ruling, arbiter_entries = _adjudicate_turn(
+                db_session, seed_id, gpt_service, context, turn,
+                session_factory=session_factory,
+            )
+            for entry in arbiter_entries:
+                yield _sse({'type': 'entry', 'entry': entry})
+
+            # Stream the narrator's JSON, forwarding the ``narration`` field
+            # as it decodes and persisting each paragraph once it closes.
+            narration_prompt = WORLD_BUILDING['CONTINUE_NARRATIVE'].format(**context)
+            field = StringFieldStream('narration')
+            raw_parts = []
+            pending = ''
+            streamed = False
+            try:
+                for chunk in gpt_service.stream_response(
+                        narration_prompt, json_mode=True, temperature=1.0):
+                    raw_parts.append(chunk)
+                    delta = field.feed(chunk)
+                    if not delta:
+                        continue
+                    streamed = True
+                    yield _sse({'type': 'narration_delta', 'text': delta})
+                    paragraphs, pending = _take_paragraphs(pending + delta)
+                    for paragraph in paragraphs:
+                        entry = _persist_narration_paragraph(
+                            session_factory, seed_id, turn, paragraph)
+                        if entry is not None:
+                            _prefetch_entry_audio(db_session, seed_id, [entry],
+                                                  api_key=elevenlabs_api_key,
+                                                  user_id=user_id)
+                            yield _sse({'type': 'entry', 'entry': entry})
+            except Exception as e:
+                current_app.logger.warning(
+                    "Narration stream failed on seed %s: %s", seed_id, e)
+
+            turn_payload = None
+            payload_data = GPTService._parse_json_payload(''.join(raw_parts)) if raw_parts else None
+            if payload_data is not None:
+                try:
+                    turn_payload = TurnResponseOut.model_validate(payload_data)
+                except Exception as e:
+                    print(f'Streamed turn payload failed validation: {e}')
+
+            if turn_payload is None and streamed:
+                # The prose already reached the player; keep it and drop
+                # only the structured extras that failed to parse.
+                turn_payload = TurnResponseOut(narration=field.text)
+            elif turn_payload is None:
+                # Nothing was shown yet, so a buffered retry is invisible.
+                turn_payload = gpt_service.get_structured(
+                    narration_prompt, TurnResponseOut,
+                    max_attempts=2, temperature=1.0,
+                )
+                if turn_payload is None:
+                    db_session.rollback()
+                    yield _sse({'type': 'error',
+                                'message': 'Narration failed: invalid LLM payload.'})
+                    return
+                pending = turn_payload.narration or ''
+
+            for paragraph in _split_paragraphs(pending):
+                entry = _persist_narration_paragraph(session_factory, seed_id, turn, paragraph)
+                if entry is not None:
+                    _prefetch_entry_audio(db_session, seed_id, [entry],
+                                          api_key=elevenlabs_api_key, user_id=user_id)
+                    yield _sse({'type': 'entry', 'entry': entry})
+
+            # Narration paragraphs were written one by one so each could be
+            # voiced as soon as it closed; dialogue arrives all at once, so
+            # its lines share a single transcript write.
+            created_characters = _persist_turn_cast(
+                db_session, seed_id, seed, turn_payload)
+            batch = transcript_service.TranscriptBatch(session_factory, seed_id, turn=turn)
+            _persist_turn_dialogue(
+                db_session, seed_id, turn, turn_payload,
+                session_factory=session_factory, batch=batch)
+            dialogue = batch.flush()
+            _prefetch_entry_audio(db_session, seed_id, dialogue,
+                                  api_key=elevenlabs_api_key, user_id=user_id)
+            for entry in dialogue:
+                yield _sse({'type': 'entry', 'entry': entry})
+
+            scenario_view, followup_context = _close_turn(
+                db_session, seed_id, seed, turn, ruling, turn_payload, context,
+                gpt_service=gpt_service, session_factory=session_factory,
+            )
+            yield _sse({
+                'type': 'turn',
+                'narration': (turn_payload.narration or field.text).strip(),
+                'new_characters': [
+                    {'id': c.id, 'name': c.name, 'race': c.race}
+                    for c, _ in created_characters
+                ],
+                'turn': seed.current_turn,
+                'clock': time_service.serialize_clock(seed),
+                'scenario': scenario_view,
+            })
+
+            # Same follow-up worker the deferred JSON turn uses, drained
+            # inline so news + suggestions ride this stream.
+            release_turn()
+            followup = _defer_turn_followup(
+                seed_id, gpt_service, followup_context,
+                session_factory=session_factory,
+                with_suggestions=scenario_view is None,
+            )
+            pending_followup = turn_followups.pop(followup['token'], None)
+            q = pending_followup['queue']
+            while True:
+                try:
+                    item = q.get(timeout=TURN_FOLLOWUP_WAIT_SECONDS)
+                except queue.Empty:
+                    yield _sse({'type': 'error', 'message': 'Turn follow-up timed out.'})
+                    break
+                if item is None:
+                    break
+                yield _sse(item)
+        except Exception:
+            db_session.rollback()
+            current_app.logger.exception('submit_turn_stream failed for seed_id=%s', seed_id)
+            yield _sse({'type': 'error', 'message': 'Turn failed; please retry.'})
+        finally:
+            db_session.close()
+            release_turn()
+
+    response = Response(stream_with_context(generate()), mimetype='text/event-stream')
+    response.call_on_close(release_turn)
+    return response
+
+
+@main.route('/api/seed/<int:seed_id>/turn/followup/<token>', methods=['GET'])
+@login_required
+def stream_turn_followup(seed_id, token):
+    """Stream a deferred turn's simulation news and suggestions as SSE.
+
+    Emits ``suggestions`` and ``entries`` events in whichever order they
+    finish, then ``complete`` (or ``error``). A token can be consumed once.
+    """
+    _prune_turn_followups()
+    pending = turn_followups.get(token)
+    if pending is None or pending['seed_id'] != seed_id:
+        return jsonify({'error': 'Follow-up not found'}), 404
+
+    Session = current_app.config['SESSION_FACTORY']
+    db_session = Session()
+    try:
+        if _seed_owned_by_caller(db_session, seed_id) is None:
+            return jsonify({'error': 'Seed not found'}), 404
+    finally:
+        db_session.close()
+
+    turn_followups.pop(token, None)
+    q = pending['queue']
+
+    def generate():
+        while True:
+            try:
+                item = q.get(timeout=TURN_FOLLOWUP_WAIT_SECONDS)
+            except queue.Empty:
+                yield f"data: {json.dumps({'type': 'error', 'message': 'Turn follow-up timed out.'})}\n\n"
+                break
+            if item is None:
+                break
+            yield f"data: {json.dumps(item)}\n\n"
+
+    return Response(stream_with_context(generate()), mimetype='text/event-stream')
 
 
 @main.route('/api/seed/<int:seed_id>/travel', methods=['POST'])
@@ -1598,7 +2209,11 @@ def submit_travel(seed_id):
 
     Body: ``{"destination_id": <int>}``. The destination must appear in
     ``travel_service.reachable_destinations`` for the MC's current
-    location -- arbitrary teleporting is rejected. The world clock is
+    location -- arbitrary teleporting is rejected -- unless the body also
+    sets ``"fastest_route": true``, in which case any destination connected
+    through the travel graph is accepted and the MC takes the fastest
+    multi-hop path there (``route`` in the response lists the legs). The
+    world clock is
     bumped by the deterministic ``travel_minutes`` cost (no arbiter call,
     no narration round-trip; this is the cheap, predictable path), and
     a transcript line lands describing the trip so the next narration /
@@ -1648,7 +2263,12 @@ def submit_travel(seed_id):
         destinations = travel_service.reachable_destinations(
             db_session, seed_id, from_loc)
         match = next((d for d in destinations if d['id'] == dest_id), None)
-        if match is None:
+        route = None
+        if data.get('fastest_route'):
+            # Even a direct neighbour may be quicker through another stop,
+            # so the fastest-route request always runs the search.
+            route = travel_service.find_route(db_session, seed_id, from_loc, dest_id)
+        if match is None and route is None:
             return jsonify({'success': False,
                             'message': 'Destination is not reachable from here.'}), 409
 
@@ -1658,27 +2278,35 @@ def submit_travel(seed_id):
             return jsonify({'success': False,
                             'message': 'Destination not found.'}), 404
 
-        minutes = int(match['minutes'] or 0)
+        minutes = int((route or match)['minutes'] or 0)
         mc.current_location_id = to_loc.id
         time_service.advance_time(db_session, seed, minutes)
         seed.updated_at = datetime.datetime.now()
 
         # Transcript line + structured meta so the prompt history reflects
         # the move and the frontend can render a distinct "travel" pill.
-        line = (f"You travel from {from_loc.name} to {to_loc.name} "
+        via = [hop['name'] for hop in route['hops'][:-1]] if route else []
+        via_text = f" via {', '.join(via)}" if via else ''
+        line = (f"You travel from {from_loc.name} to {to_loc.name}{via_text} "
                 f"(~{minutes} minutes).")
+        travel_meta = {
+            'kind': 'travel',
+            'from_id': from_loc.id, 'from_name': from_loc.name,
+            'to_id': to_loc.id, 'to_name': to_loc.name,
+            'minutes': minutes,
+        }
+        if route:
+            travel_meta['route'] = [hop['id'] for hop in route['hops']]
         travel_entry = transcript_service.add_entry(
             session_factory, seed_id,
             transcript_service.KIND_NARRATION, line,
             turn=seed.current_turn or 1, speaker='Narrator',
-            meta={
-                'kind': 'travel',
-                'from_id': from_loc.id, 'from_name': from_loc.name,
-                'to_id': to_loc.id, 'to_name': to_loc.name,
-                'minutes': minutes,
-            },
+            meta=travel_meta,
         )
         db_session.commit()
+        context_cache.invalidate(
+            db_session.get_bind(), seed_id,
+            context_cache.PART_CHARACTER, context_cache.PART_CURRENT_LOCATION)
 
         entries = []
         if travel_entry is not None:
@@ -1725,6 +2353,7 @@ def submit_travel(seed_id):
                 'parent_id': to_loc.parent_id,
             },
             'destinations': new_destinations,
+            'route': route['hops'] if route else None,
             'entries': entries,
         }), 200
     except Exception:
@@ -2222,6 +2851,34 @@ def _tts_cache_dir():
     return base
 
 
+def _prefetch_entry_audio(db_session, seed_id, entries, *, api_key, user_id):
+    """Queue background TTS for the narration / dialogue among ``entries``.
+
+    ``entries`` are transcript entry dicts as the routes return them; only
+    persisted ones (with an id) are voiced. A no-op unless the app sets
+    ``TTS_PREFETCH_ENABLED`` and the caller has an ElevenLabs key. Never
+    raises: prefetching is an optimisation on top of ``tts_for_entry``.
+    """
+    if not api_key or not current_app.config.get('TTS_PREFETCH_ENABLED'):
+        return
+    try:
+        voices = {}
+        lines = []
+        for entry in entries:
+            if (entry.get('kind') not in (transcript_service.KIND_NARRATION,
+                                          transcript_service.KIND_DIALOGUE)
+                    or entry.get('id') is None or not entry.get('text')):
+                continue
+            speaker = entry.get('speaker')
+            if speaker not in voices:
+                voices[speaker] = _resolve_voice_id_for_speaker(db_session, seed_id, speaker)
+            lines.append((voices[speaker], entry['text']))
+        if lines:
+            tts_prefetch.prefetch(api_key, user_id, _tts_cache_dir(), lines)
+    except Exception:
+        current_app.logger.exception('TTS prefetch failed for seed_id=%s', seed_id)
+
+
 def _resolve_voice_id_for_speaker(db_session, seed_id, speaker):
     """Map a transcript entry's speaker to a Character.voice_id.
 
@@ -2229,27 +2886,15 @@ def _resolve_voice_id_for_speaker(db_session, seed_id, speaker):
     unknown, or the matching Character has no voice_id assigned (e.g.
     the world was built before an ElevenLabs key was bound). Matching
     is case-insensitive and falls back to the first name so dialogue
-    written as just "Lyra" still resolves to "Lyra Aldun".
+    written as just "Lyra" still resolves to "Lyra Aldun". Names come
+    from the seed's cached ``CharacterIndex``, so replaying a scene costs
+    no character queries.
     """
     if not speaker or speaker.strip().lower() in {'narrator', 'you', 'system'}:
         return elevenlabs_service.NARRATOR_VOICE_ID
-    cleaned = speaker.strip()
-    char = (
-        db_session.query(Character)
-        .filter(Character.seed_id == seed_id,
-                func.lower(Character.name) == cleaned.lower())
-        .first()
-    )
-    if char is None:
-        first = cleaned.split()[0].lower()
-        char = (
-            db_session.query(Character)
-            .filter(Character.seed_id == seed_id,
-                    func.lower(Character.name).like(f'{first} %'))
-            .first()
-        )
-    if char and char.voice_id:
-        return char.voice_id
+    ref = character_index.for_seed(db_session, seed_id).find_speaker(speaker)
+    if ref is not None and ref.voice_id:
+        return ref.voice_id
     return elevenlabs_service.NARRATOR_VOICE_ID
 
 
@@ -2260,11 +2905,12 @@ def tts_for_entry(seed_id, entry_id):
     """Return mp3 audio for a single transcript entry.
 
     Resolves the speaker on the entry to a Character voice id (or the
-    narrator default), then delegates to the ElevenLabs service which
-    transparently caches results on disk so repeat requests for the same
-    line don't bill the user's quota a second time. Returns 404 when the
-    entry doesn't belong to the seed and 503 when no audio could be
-    produced (no key + cold cache, or upstream failure).
+    narrator default). A cached rendering is served from disk with Range
+    and ETag support; otherwise the ElevenLabs stream is forwarded as it
+    arrives while the service tees it into the on-disk cache, so repeat
+    requests for the same line don't bill the user's quota a second time.
+    Returns 404 when the entry doesn't belong to the seed and 503 when no
+    audio could be produced (no key + cold cache, or upstream failure).
     """
     Session = current_app.config['SESSION_FACTORY']
     db_session = Session()
@@ -2281,23 +2927,43 @@ def tts_for_entry(seed_id, entry_id):
             return jsonify({'success': False, 'message': 'Entry not found.'}), 404
 
         voice_id = _resolve_voice_id_for_speaker(db_session, seed_id, entry.speaker)
-        api_key = _extract_elevenlabs_api_key()
-        audio = elevenlabs_service.synthesize(
-            api_key, voice_id, entry.text, cache_dir=_tts_cache_dir(),
-        )
-        if not audio:
-            return jsonify({
-                'success': False,
-                'message': 'TTS unavailable (missing key or upstream error).'
-            }), 503
-        resp = Response(audio, mimetype='audio/mpeg')
-        # Browser-side cache: entry text + voice are immutable so the
-        # client can safely keep the rendering for the session lifetime.
-        resp.headers['Cache-Control'] = 'private, max-age=86400'
-        return resp
+        text = entry.text
     finally:
         db_session.close()
 
+    # Entry text + voice are immutable, so the audio is content-addressed:
+    # the cache key doubles as a strong ETag and the browser can keep the
+    # rendering for the session lifetime.
+    etag = elevenlabs_service.audio_cache_key(voice_id, text)
+    if request.if_none_match.contains(etag):
+        resp = Response(status=304)
+    else:
+        cache_dir = _tts_cache_dir()
+        path = elevenlabs_service.cached_audio_path(voice_id, text, cache_dir)
+        if not path and tts_prefetch.wait_for(voice_id, text, TTS_PREFETCH_WAIT_SECONDS):
+            path = elevenlabs_service.cached_audio_path(voice_id, text, cache_dir)
+        if path:
+            # Streams from disk and answers Range requests, so seeking in a
+            # long narration paragraph doesn't re-send the whole file.
+            resp = send_file(path, mimetype='audio/mpeg', conditional=True, etag=etag)
+        else:
+            audio = elevenlabs_service.stream_synthesis(
+                _extract_elevenlabs_api_key(), voice_id, text, cache_dir=cache_dir,
+            )
+            if audio is None:
+                return jsonify({
+                    'success': False,
+                    'message': 'TTS unavailable (missing key or upstream error).'
+                }), 503
+            # The status line goes out before the upstream stream has
+            # finished, so a cut-off body must not be cached or validated;
+            # the next request is served from the disk cache instead.
+            resp = Response(audio, mimetype='audio/mpeg', direct_passthrough=True)
+            resp.headers['Cache-Control'] = 'no-store'
+            return resp
+    resp.headers['Cache-Control'] = 'private, max-age=86400'
+    return resp
+
 
 @main.route('/auth/check', methods=['GET'])
 def check_auth():
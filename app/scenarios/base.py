@@ -17,6 +17,8 @@ import json
 from abc import ABC, abstractmethod
 
 from app.orm import Character, Scenario, ScenarioParticipant
+from app.services import character_index, context_cache
+from app.services.seed_cache import bind_for
 
 
 KIND_DIALOGUE = 'dialogue'
@@ -96,6 +98,11 @@ def resolve(db_session, scenario, status, summary, *, current_turn=None):
     scenario.updated_at = scenario.resolved_at
     db_session.add(scenario)
     db_session.flush()
+    # Battles and trades change HP / who is alive; let the next turn
+    # context re-read the MC and the roster.
+    context_cache.invalidate(
+        bind_for(db_session), scenario.seed_id,
+        context_cache.PART_CHARACTER, context_cache.PART_NPCS)
 
 
 def scenario_view(db_session, scenario):
@@ -112,37 +119,18 @@ def lookup_characters_by_name(db_session, seed_id, names):
 
     Names that don't match any row in the seed are dropped silently; the
     handler can decide whether the remaining list is enough to start the
-    scenario or whether it should bail out.
+    scenario or whether it should bail out. Names are matched against the
+    seed's cached ``CharacterIndex`` (first-name aliases only when no full
+    name matched), so only the matched rows are loaded.
     """
-    cleaned = [(n or '').strip() for n in (names or []) if (n or '').strip()]
-    if not cleaned:
+    refs = character_index.for_seed(db_session, seed_id).find_all(names)
+    if not refs:
         return []
-    lowered = {n.lower() for n in cleaned}
-    rows = (
-        db_session.query(Character)
-        .filter(Character.seed_id == seed_id)
-        .all()
-    )
-    by_name = {(c.name or '').lower(): c for c in rows if c.name}
-    out = []
-    for name in cleaned:
-        c = by_name.get(name.lower())
-        if c is not None and c not in out:
-            out.append(c)
-    # Also catch first-name aliases if nothing matched.
-    if not out:
-        first_lookup = {}
-        for c in rows:
-            if not c.name:
-                continue
-            first = c.name.split()[0].lower()
-            first_lookup.setdefault(first, c)
-        for name in cleaned:
-            c = first_lookup.get(name.split()[0].lower() if name else '')
-            if c is not None and c not in out:
-                out.append(c)
-    _ = lowered  # silence linter; kept for future per-name validation
-    return out
+    rows = {
+        c.id: c for c in
+        db_session.query(Character).filter(Character.id.in_([r.id for r in refs])).all()
+    }
+    return [rows[r.id] for r in refs if r.id in rows]
 
 
 # --- Handler contract ------------------------------------------------------
@@ -39,8 +39,9 @@ from pydantic import BaseModel, Field
 
 from app.orm import Character, CharacterItem
 from app.prompt_templates import SCENARIO_PROMPTS
-from app.services import transcript_service
+from app.services import context_cache, transcript_service
 from app.services.dice_service import format_check, perform_check
+from app.services.seed_cache import bind_for
 
 from .base import (
     KIND_BATTLE, ScenarioHandler, add_participant, load_state,
@@ -372,6 +373,10 @@ class BattleHandler(ScenarioHandler):
             c.current_health = int(new_hp)
             db_session.add(c)
         db_session.flush()
+        if characters:
+            context_cache.invalidate(
+                bind_for(db_session), characters[0].seed_id,
+                context_cache.PART_CHARACTER)
 
     def _npc_action(self, db_session, scenario, npc, player, state, gpt_service):
         """Pick a verb + flavour for ``npc`` (LLM with heuristic fallback)."""
@@ -0,0 +1,157 @@
+# character_index.py
+"""Per-seed index of character names for speaker resolution.
+
+TTS playback maps every transcript speaker to a ``Character.voice_id``,
+dialogue attribution maps the LLM's speaker strings to canonical
+character names, and scenarios resolve the narrator's participant names
+to rows. All of them used to query or scan ``Character`` -- TTS with an
+exact ``lower(name)`` match followed by a ``LIKE 'first %'`` scan that no
+index can serve, each turn by loading every character in the seed. The
+names change only when characters are created, so the seed's names are
+loaded once into a ``CharacterIndex`` and the write paths keep it current:
+
+  * ``routes._create_dynamic_character`` adds the new character (and the
+    LLM's name for it as an alias when the library renamed it),
+  * ``CharacterBuilder`` adds the protagonist and every NPC it persists.
+
+Entries are plain ``CharacterRef`` tuples (never ORM rows), so they are
+safe to share across sessions and threads.
+"""
+from __future__ import annotations
+
+import threading
+from typing import NamedTuple, Optional
+
+from app.orm import Character
+from app.services.seed_cache import SeedCache, bind_for
+
+
+class CharacterRef(NamedTuple):
+    id: int
+    name: str
+    voice_id: Optional[str]
+
+
+class CharacterIndex:
+    """Lower-cased name lookups for one seed's characters.
+
+    ``by_name`` holds every full name. ``by_first`` holds the first word of
+    every multi-word name, so "Lyra" finds "Lyra Aldun"; single-word names
+    are already full-name keys. ``aliases`` holds other names a character
+    is known by (the LLM's name for a character the name library renamed).
+    Lookups try them in that order. When two characters share a key the
+    one created first wins, as the old ``.first()`` queries did.
+    """
+
+    def __init__(self, characters=()):
+        self.lock = threading.RLock()
+        self.by_name = {}
+        self.by_first = {}
+        self.aliases = {}
+        for character in characters:
+            self.add(character)
+
+    def add(self, character):
+        name = (character.name or '').strip()
+        if not name:
+            return
+        ref = CharacterRef(character.id, name, character.voice_id)
+        with self.lock:
+            self.by_name.setdefault(name.lower(), ref)
+            words = name.lower().split()
+            if len(words) > 1:
+                self.by_first.setdefault(words[0], ref)
+
+    def add_alias(self, alias, ref):
+        """Let ``alias`` (and its first word) find ``ref`` when nothing else does."""
+        words = (alias or '').strip().lower().split()
+        if not words:
+            return
+        with self.lock:
+            self.aliases.setdefault(' '.join(words), ref)
+            self.aliases.setdefault(words[0], ref)
+
+    def has_name(self, name):
+        """Whether a character's full name is ``name`` (case-insensitive)."""
+        with self.lock:
+            return (name or '').strip().lower() in self.by_name
+
+    def find(self, name):
+        """The character called ``name``, or known by it as a first name or alias."""
+        key = (name or '').strip().lower()
+        if not key:
+            return None
+        with self.lock:
+            return (self.by_name.get(key) or self.by_first.get(key)
+                    or self.aliases.get(key))
+
+    def find_speaker(self, speaker):
+        """Match a transcript speaker: full name, else its first word.
+
+        "Lyra" and "Lyra the Bold" both resolve to "Lyra Aldun", mirroring
+        the ``LIKE 'first %'`` fallback this replaces.
+        """
+        key = (speaker or '').strip().lower()
+        if not key:
+            return None
+        with self.lock:
+            ref = self.by_name.get(key)
+            if ref is None:
+                ref = self.by_first.get(key.split()[0])
+            return ref
+
+    def find_all(self, names):
+        """Resolve ``names`` to distinct refs, in order; unknown names are dropped.
+
+        Full names are tried first; only when none of them match is each
+        name's first word tried as a first name, so "Captain Mira" still
+        finds "Mira Vale" without letting a first-name hit crowd out an
+        exact one.
+        """
+        cleaned = [n.strip().lower() for n in (names or []) if (n or '').strip()]
+        out = []
+        with self.lock:
+            for name in cleaned:
+                ref = self.by_name.get(name)
+                if ref is not None and ref not in out:
+                    out.append(ref)
+            if not out:
+                for name in cleaned:
+                    first = name.split()[0]
+                    ref = self.by_name.get(first) or self.by_first.get(first)
+                    if ref is not None and ref not in out:
+                        out.append(ref)
+        return out
+
+
+_indexes = SeedCache()
+
+
+def for_seed(db_session, seed_id):
+    """Return the seed's ``CharacterIndex``, loading it on first use."""
+    bind = bind_for(db_session)
+    index = _indexes.get(bind, seed_id)
+    if index is None:
+        index = CharacterIndex(
+            db_session.query(Character.id, Character.name, Character.voice_id)
+            .filter(Character.seed_id == seed_id)
+            .order_by(Character.id)
+            .all()
+        )
+        _indexes.set(bind, seed_id, index)
+    return index
+
+
+def note_character_added(bind, seed_id, character, *, aliases=()):
+    """Add a freshly committed character to the cached index, if loaded.
+
+    ``character`` may be a row or anything with ``id``, ``name`` and
+    ``voice_id`` (such as a ``CharacterRef`` captured before commit).
+    """
+    index = _indexes.get(bind, seed_id)
+    if index is None:
+        return
+    index.add(character)
+    ref = CharacterRef(character.id, (character.name or '').strip(), character.voice_id)
+    for alias in aliases:
+        index.add_alias(alias, ref)
@@ -0,0 +1,107 @@
+# context_cache.py
+"""Per-seed cache of the building blocks of the turn context.
+
+``routes._build_turn_context`` needs the main character, the top-level
+locations, the MC's current location, the NPC roster and the trailing
+story transcript. Those change through a small set of write paths, so
+instead of re-querying all of them on every build the parts are cached
+here and kept current by those writers:
+
+  * ``transcript_service.add_entry`` appends to the cached transcript tail,
+  * ``routes._create_dynamic_character`` appends to the cached roster,
+  * travel invalidates the character + current location,
+  * scenario HP writes / resolution invalidate the character + roster,
+  * world building drops the whole entry once the world is persisted.
+
+Parts are plain dicts / lists (never ORM rows), so they are safe to share
+across sessions.
+"""
+from __future__ import annotations
+
+import threading
+from collections import deque
+
+from app.services.seed_cache import SeedCache, bind_for
+
+PART_CHARACTER = 'character'
+PART_CURRENT_LOCATION = 'current_location'
+PART_LOCATIONS = 'locations'
+PART_NPCS = 'npcs'
+PART_TRANSCRIPT = 'transcript'
+
+_PARTS = (PART_CHARACTER, PART_CURRENT_LOCATION, PART_LOCATIONS,
+          PART_NPCS, PART_TRANSCRIPT)
+
+_cache = SeedCache()
+
+
+class SeedContext:
+    """Cached context parts for one seed; ``None`` means "not loaded"."""
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.character = None
+        self.current_location = None
+        self.locations = None
+        self.npcs = None
+        # deque of (entry_id, speaker_or_kind, text) story beats, newest
+        # last. Loaders hold ``lock`` while querying so a concurrent writer
+        # either lands in the query or is appended after it; the id check
+        # in ``note_transcript_entry`` drops the overlap.
+        self.transcript = None
+        self.transcript_kinds = frozenset()
+
+    def set_transcript(self, beats, kinds, limit):
+        self.transcript = deque(beats, maxlen=limit)
+        self.transcript_kinds = frozenset(kinds)
+
+
+def for_seed(db_session, seed_id):
+    """Return the ``SeedContext`` for ``seed_id`` (a throwaway one if unbound)."""
+    return _cache.get_or_create(bind_for(db_session), seed_id, SeedContext)
+
+
+def note_transcript_entry(bind, seed_id, entry_id, kind, speaker, text):
+    """Patch a freshly committed transcript line into the cached tail."""
+    ctx = _cache.get(bind, seed_id)
+    if ctx is None:
+        return
+    with ctx.lock:
+        if ctx.transcript is None or kind not in ctx.transcript_kinds:
+            return
+        if ctx.transcript and ctx.transcript[-1][0] >= entry_id:
+            return
+        ctx.transcript.append((entry_id, speaker or kind, text))
+
+
+def note_character_added(bind, seed_id, character):
+    """Patch a newly persisted NPC into the cached roster."""
+    ctx = _cache.get(bind, seed_id)
+    if ctx is None:
+        return
+    with ctx.lock:
+        if character.main_character:
+            ctx.character = None
+            ctx.current_location = None
+        elif ctx.npcs is not None and all(n['id'] != character.id for n in ctx.npcs):
+            ctx.npcs.append(roster_entry(character))
+
+
+def invalidate(bind, seed_id, *parts):
+    """Forget the given parts (all of them when none are named)."""
+    ctx = _cache.get(bind, seed_id)
+    if ctx is None:
+        return
+    with ctx.lock:
+        for part in (parts or _PARTS):
+            setattr(ctx, part, None)
+
+
+def roster_entry(character):
+    return {
+        'id': character.id,
+        'name': character.name,
+        'race': character.race,
+        'gender': character.gender,
+        'alive': character.alive,
+    }
@@ -6,12 +6,17 @@ Two responsibilities:
   1. Voice search at world-building time. ``find_voice_for_character`` maps
      a character's traits (gender, race, age) to one of the voices in the
      caller's ElevenLabs library via ``GET /v2/voices``. Returns the chosen
-     voice id or ``None`` when nothing matches / the call fails.
+     voice id or ``None`` when nothing matches / the call fails. The
+     library is cached per API key for a few minutes, so a world build
+     downloads it once rather than once per character.
 
   2. Text-to-speech at playback time. ``synthesize`` returns the raw mp3
      bytes for a piece of text rendered with a given voice id, with an
      on-disk cache keyed by (voice_id, text-hash) so the same line is never
-     re-billed against the user's quota.
+     re-billed against the user's quota. ``cached_audio_path`` and
+     ``stream_synthesis`` are the unbuffered pair the HTTP route uses: the
+     first lets a hit be served straight from disk, the second forwards a
+     miss chunk by chunk while filling the cache.
 
 Every public function is forgiving: missing keys, network errors, and
 malformed responses all return ``None`` rather than raising, because TTS
@@ -22,6 +27,10 @@ from __future__ import annotations
 import hashlib
 import logging
 import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime
 from typing import Optional
 
@@ -39,16 +48,34 @@ _VOICES_URL = f"{_API_BASE}/v2/voices"
 _TTS_URL_TMPL = f"{_API_BASE}/v1/text-to-speech/{{voice_id}}"
 _DEFAULT_MODEL = "eleven_multilingual_v2"
 _DEFAULT_TIMEOUT = 30
+# Read size for ``stream_synthesis``: small enough that the first audio
+# reaches the client quickly, large enough to keep syscalls cheap.
+_STREAM_CHUNK_BYTES = 16 * 1024
 
 # On-disk cache caps for ``synthesize``. The cache is unbounded by default
 # in scope (one mp3 per (voice_id, text-hash) tuple), so a long-running
 # server eventually accumulates an arbitrary amount of audio. These caps
-# trigger a mtime-based LRU sweep after every successful write so the
+# trigger an LRU eviction after every successful write so the
 # directory cannot grow without bound. Both ceilings are enforced; the
 # stricter one wins on any given sweep.
 _DEFAULT_CACHE_MAX_BYTES = 256 * 1024 * 1024  # 256 MiB
 _DEFAULT_CACHE_MAX_FILES = 1000
 
+# In-process cache of each key's voice library for ``find_voice_for_character``.
+# A world build resolves a voice for every NPC, and without this each
+# lookup re-downloaded the same library (up to ``max_pages`` requests).
+# Libraries change rarely, so a few minutes of staleness is harmless; a
+# failed fetch is remembered briefly so a bad key doesn't hammer the API.
+_LIBRARY_TTL_SECONDS = 600
+_LIBRARY_FAILURE_TTL_SECONDS = 30
+
+_library_lock = threading.Lock()
+# sha256(api_key) -> (expires_at, _VoiceIndex or None)
+_libraries = {}
+# sha256(api_key) -> lock held while that key's library is being fetched,
+# so concurrent lookups wait for one download instead of each starting one.
+_library_fetch_locks = {}
+
 
 def _gender_label(gender):
     # Character.gender is the legacy boolean (True=male, False=female,
@@ -128,13 +155,11 @@ def _normalize_age_label(value):
     return v or None
 
 
-def _tokenize(text):
-    """Split a free-text hint into lowercase keyword tokens for scoring."""
-    if not text:
-        return []
+def _alnum_runs(text):
+    """Split ``text`` into its maximal alphanumeric runs (no stopwords dropped)."""
     out = []
     cur = []
-    for ch in str(text).lower():
+    for ch in text:
         if ch.isalnum():
             cur.append(ch)
         elif cur:
@@ -142,6 +167,14 @@ def _tokenize(text):
             cur = []
     if cur:
         out.append("".join(cur))
+    return out
+
+
+def _tokenize(text):
+    """Split a free-text hint into lowercase keyword tokens for scoring."""
+    if not text:
+        return []
+    out = _alnum_runs(str(text).lower())
     # Drop trivial stopwords so a verbose description doesn't drown out
     # the few words that actually carry voice character.
     stop = {"a", "an", "the", "with", "and", "of", "in", "on", "to", "is",
@@ -149,47 +182,160 @@ def _tokenize(text):
     return [t for t in out if t and t not in stop]
 
 
-def _score_voice(voice, *, want_gender, want_age, terms):
-    """Rank a library voice against the desired traits.
+def _bits(mask):
+    """Yield the indexes of the set bits in ``mask``, lowest first."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+class _VoiceIndex:
+    """Scoring index over one voice library.
 
-    Returns a non-negative score, or ``-1`` when ``want_gender`` is set
-    and the voice's gender label disagrees (hard disqualification so a
-    male character never gets a female voice when the library has
-    enough labelled options).
+    Voice ``i`` is bit ``i`` in every mask. Gender and age labels map to
+    the mask of voices carrying them, and every alphanumeric token of a
+    voice's name / description / labels maps to the voices that contain
+    it, so a lookup touches only the voices a trait or term selects
+    instead of re-reading every voice's labels per attempt.
     """
-    labels = voice.get("labels") or {}
-    label_gender = (labels.get("gender") or "").strip().lower() or None
-    label_age = _normalize_age_label(labels.get("age"))
-
-    score = 0
-    if want_gender:
-        if label_gender is None:
-            score -= 5
-        elif label_gender == want_gender:
-            score += 100
-        else:
-            return -1
-    if want_age:
-        if label_age == want_age:
-            score += 40
-        elif label_age:
-            score -= 5
-
-    if terms:
-        haystack_parts = [
-            voice.get("name") or "",
-            voice.get("description") or "",
-            labels.get("descriptive") or "",
-            labels.get("description") or "",
-            labels.get("use_case") or "",
-            labels.get("accent") or "",
-            labels.get("language") or "",
-        ]
-        haystack = " ".join(haystack_parts).lower()
+
+    def __init__(self, voices):
+        self.voice_ids = []
+        self.gender_masks = {}
+        self.age_masks = {}
+        self.unlabelled_gender = 0
+        self.unlabelled_age = 0
+        self.postings = {}
+        # term -> mask; a term is a substring match, so it is resolved
+        # against the token vocabulary once and remembered.
+        self._term_masks = {}
+        for voice in voices:
+            voice_id = voice.get("voice_id")
+            if not voice_id or voice_id == NARRATOR_VOICE_ID:
+                continue
+            bit = 1 << len(self.voice_ids)
+            self.voice_ids.append(voice_id)
+            labels = voice.get("labels") or {}
+            gender = (labels.get("gender") or "").strip().lower() or None
+            if gender is None:
+                self.unlabelled_gender |= bit
+            else:
+                self.gender_masks[gender] = self.gender_masks.get(gender, 0) | bit
+            age = _normalize_age_label(labels.get("age"))
+            if age is None:
+                self.unlabelled_age |= bit
+            else:
+                self.age_masks[age] = self.age_masks.get(age, 0) | bit
+            haystack = " ".join([
+                voice.get("name") or "",
+                voice.get("description") or "",
+                labels.get("descriptive") or "",
+                labels.get("description") or "",
+                labels.get("use_case") or "",
+                labels.get("accent") or "",
+                labels.get("language") or "",
+            ]).lower()
+            for token in _alnum_runs(haystack):
+                self.postings[token] = self.postings.get(token, 0) | bit
+
+    def term_mask(self, term):
+        """Voices whose text contains ``term`` (as a substring, like before)."""
+        mask = self._term_masks.get(term)
+        if mask is None:
+            mask = 0
+            for token, voices in self.postings.items():
+                if term in token:
+                    mask |= voices
+            self._term_masks[term] = mask
+        return mask
+
+    def best_candidates(self, want_gender, want_age, terms):
+        """Score every voice for all four relaxation tiers in one pass.
+
+        Tiers are: full traits, then without free text, then without age,
+        then without gender. Returns the ``(score, index)`` pairs of the
+        first tier that has any voice scoring ``>= 0``, best first.
+        """
+        n = len(self.voice_ids)
+        gender_score = [0] * n
+        if want_gender:
+            # ``None`` marks a hard mismatch: a labelled, different gender.
+            gender_score = [None] * n
+            for i in _bits(self.gender_masks.get(want_gender, 0)):
+                gender_score[i] = 100
+            for i in _bits(self.unlabelled_gender):
+                gender_score[i] = -5
+        age_score = [0] * n
+        if want_age:
+            labelled = 0
+            for mask in self.age_masks.values():
+                labelled |= mask
+            for i in _bits(labelled):
+                age_score[i] = -5
+            for i in _bits(self.age_masks.get(want_age, 0)):
+                age_score[i] = 40
+        term_score = [0] * n
         for term in terms:
-            if term and term in haystack:
-                score += 10
-    return score
+            if term:
+                for i in _bits(self.term_mask(term)):
+                    term_score[i] += 10
+
+        tiers = ([], [], [], [])
+        for i in range(n):
+            g = gender_score[i]
+            if g is not None:
+                a = age_score[i]
+                for tier, score in zip(tiers, (g + a + term_score[i], g + a, g)):
+                    if score >= 0:
+                        tier.append((score, i))
+            tiers[3].append((0, i))
+        for tier in tiers:
+            if tier:
+                tier.sort(key=lambda t: (-t[0], t[1]))
+                return tier
+        return []
+
+
+def _library_key(api_key):
+    # Hash so raw secrets never sit in the cache's dict keys.
+    return hashlib.sha256(api_key.encode("utf-8")).hexdigest()
+
+
+def _library_for(api_key):
+    """Return the ``_VoiceIndex`` for ``api_key``, fetching at most once per TTL.
+
+    The narrator voice and voices without an id are dropped at index
+    time. Returns ``None`` when the library could not be fetched.
+    """
+    key = _library_key(api_key)
+    with _library_lock:
+        entry = _libraries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+        fetch_lock = _library_fetch_locks.setdefault(key, threading.Lock())
+    with fetch_lock:
+        with _library_lock:
+            entry = _libraries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                return entry[1]
+        voices = _fetch_library_voices(api_key)
+        if voices is None:
+            indexed, ttl = None, _LIBRARY_FAILURE_TTL_SECONDS
+        else:
+            indexed, ttl = _VoiceIndex(voices), _LIBRARY_TTL_SECONDS
+        with _library_lock:
+            _libraries[key] = (time.monotonic() + ttl, indexed)
+        return indexed
+
+
+def clear_voice_library_cache(api_key=None):
+    """Forget the cached library for ``api_key`` (every key when omitted)."""
+    with _library_lock:
+        if api_key is None:
+            _libraries.clear()
+        else:
+            _libraries.pop(_library_key(api_key), None)
 
 
 def find_voice_for_character(api_key, *, gender=None, date_of_birth=None,
@@ -199,20 +345,17 @@ def find_voice_for_character(api_key, *, gender=None, date_of_birth=None,
     The /v2/voices endpoint silently ignores ``gender``/``age`` query
     params (those only work on /v1/shared-voices), and its ``search``
     parameter only matches voice name / description / labels. So we pull
-    the library once and score each voice client-side against the
-    character's gender, age bucket, race, and any free-text hint. The
-    narrator voice is excluded so dialogue never collapses onto it.
-    Returns the best-scoring voice id or ``None`` on any failure.
+    the library once per key (see ``_library_for``) and score the indexed
+    voices client-side against the character's gender, age bucket, race, and any
+    free-text hint. The narrator voice is excluded so dialogue never
+    collapses onto it. Returns the best-scoring voice id or ``None`` on
+    any failure.
     """
     if not api_key:
         return None
 
-    voices = _fetch_library_voices(api_key)
-    if voices is None:
-        return None
-    voices = [v for v in voices
-              if v.get("voice_id") and v.get("voice_id") != NARRATOR_VOICE_ID]
-    if not voices:
+    index = _library_for(api_key)
+    if index is None or not index.voice_ids:
         return None
 
     want_gender = _gender_label(gender)
@@ -222,82 +365,160 @@ def find_voice_for_character(api_key, *, gender=None, date_of_birth=None,
     # Progressively relax: full traits, then drop free text, then drop
     # age, then drop gender. The first attempt that yields any candidate
     # wins so a verbose hint never leaves a character voiceless.
-    attempts = [
-        (want_gender, want_age, terms),
-        (want_gender, want_age, []),
-        (want_gender, None, []),
-        (None, None, []),
-    ]
-    for w_gender, w_age, w_terms in attempts:
-        scored = []
-        for v in voices:
-            s = _score_voice(v, want_gender=w_gender, want_age=w_age,
-                             terms=w_terms)
-            if s >= 0:
-                scored.append((s, v))
-        if not scored:
-            continue
-        scored.sort(key=lambda t: t[0], reverse=True)
-        top_score = scored[0][0]
-        # Tie-break across the top tier so two characters with identical
-        # traits don't all collapse onto the same voice. The seed mixes
-        # every input so different characters land on different voices.
-        top = [v for s, v in scored if s >= top_score - 5]
-        seed_key = "|".join([
-            want_gender or "",
-            want_age or "",
-            date_of_birth.isoformat() if isinstance(date_of_birth, datetime) else "",
-            (race or "").lower(),
-            (search_text or "").lower(),
-        ])
-        idx = int(hashlib.sha256(seed_key.encode("utf-8")).hexdigest(), 16) % len(top)
-        return top[idx].get("voice_id")
-    return None
+    scored = index.best_candidates(want_gender, want_age, terms)
+    if not scored:
+        return None
+    top_score = scored[0][0]
+    # Tie-break across the top tier so two characters with identical
+    # traits don't all collapse onto the same voice. The seed mixes
+    # every input so different characters land on different voices.
+    top = [i for s, i in scored if s >= top_score - 5]
+    seed_key = "|".join([
+        want_gender or "",
+        want_age or "",
+        date_of_birth.isoformat() if isinstance(date_of_birth, datetime) else "",
+        (race or "").lower(),
+        (search_text or "").lower(),
+    ])
+    idx = int(hashlib.sha256(seed_key.encode("utf-8")).hexdigest(), 16) % len(top)
+    return index.voice_ids[top[idx]]
+
+
+def audio_cache_key(voice_id, text):
+    """Content address of a rendering: the same (voice, text) always maps here.
+
+    Used as the cache file's stem and as the HTTP ETag for the audio.
+    """
+    digest = hashlib.sha256(text.encode("utf-8")).hexdigest()[:32]
+    safe_voice = "".join(c for c in (voice_id or "default") if c.isalnum() or c in "-_")
+    return f"{safe_voice}_{digest}"
 
 
 def _cache_path(cache_dir, voice_id, text):
-    digest = hashlib.sha256(text.encode("utf-8")).hexdigest()[:32]
-    safe_voice = "".join(c for c in (voice_id or "default") if c.isalnum() or c in "-_")
-    return os.path.join(cache_dir, f"{safe_voice}_{digest}.mp3")
+    return os.path.join(cache_dir, f"{audio_cache_key(voice_id, text)}.mp3")
 
 
-def _evict_cache_if_needed(cache_dir, max_bytes, max_files):
-    """LRU-evict mp3 files in ``cache_dir`` until both caps are satisfied.
+class _TTSCacheIndex:
+    """In-memory index of one TTS cache directory: recency order and sizes.
 
-    Sweep is best-effort: filesystem races (a file being deleted between
-    the listdir and the unlink) are swallowed because the cache is
-    advisory. Only entries with a ``.mp3`` extension are considered so a
-    sibling file in the same directory cannot be wiped by mistake.
+    Built from a single directory scan the first time the directory is
+    used in this process (the files and their mtimes are the persistent
+    record, so a restart rebuilds the same order), then kept current by
+    ``synthesize``: hits are a dict lookup, writes add to a running byte
+    total, and eviction pops the least recently used entries instead of
+    listing and stat-ing every mp3 after each write.
     """
-    try:
-        names = os.listdir(cache_dir)
-    except OSError:
-        return
-    entries = []
-    total = 0
-    for name in names:
-        if not name.endswith('.mp3'):
-            continue
-        path = os.path.join(cache_dir, name)
+
+    def __init__(self, cache_dir):
+        self.cache_dir = cache_dir
+        self._lock = threading.Lock()
+        # path -> size in bytes, least recently used first.
+        self._entries = OrderedDict()
+        self.total_bytes = 0
+        self._scan()
+
+    def _scan(self):
         try:
-            st = os.stat(path)
+            names = os.listdir(self.cache_dir)
         except OSError:
-            continue
-        entries.append((st.st_mtime, st.st_size, path))
-        total += st.st_size
-    count = len(entries)
-    if total <= max_bytes and count <= max_files:
-        return
-    entries.sort(key=lambda e: e[0])  # oldest mtime first
-    for _, size, path in entries:
-        if total <= max_bytes and count <= max_files:
-            break
+            return
+        found = []
+        for name in names:
+            # Only mp3s are managed, so a sibling file in the same
+            # directory can never be wiped by eviction.
+            if not name.endswith('.mp3'):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            found.append((st.st_mtime, path, st.st_size))
+        found.sort()
+        for _, path, size in found:
+            self._entries[path] = size
+            self.total_bytes += size
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, path):
+        with self._lock:
+            return path in self._entries
+
+    def touch(self, path):
+        """Mark ``path`` as just used, in memory and on disk (its mtime)."""
+        with self._lock:
+            if path in self._entries:
+                self._entries.move_to_end(path)
         try:
-            os.remove(path)
+            os.utime(path, None)
         except OSError:
-            continue
-        total -= size
-        count -= 1
+            pass
+
+    def record(self, path, size):
+        with self._lock:
+            self.total_bytes += size - self._entries.pop(path, 0)
+            self._entries[path] = size
+
+    def forget(self, path):
+        with self._lock:
+            self.total_bytes -= self._entries.pop(path, 0)
+
+    def evict(self, max_bytes, max_files):
+        """Delete least recently used files until both caps are satisfied.
+
+        Best-effort: a file already gone from disk is simply dropped from
+        the index, because the cache is advisory.
+        """
+        while True:
+            with self._lock:
+                if self.total_bytes <= max_bytes and len(self._entries) <= max_files:
+                    return
+                path, size = self._entries.popitem(last=False)
+                self.total_bytes -= size
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+
+
+_cache_index_lock = threading.Lock()
+_cache_indexes = {}
+
+
+def _cache_index_for(cache_dir):
+    """Return the process-wide ``_TTSCacheIndex`` for ``cache_dir``."""
+    key = os.path.abspath(cache_dir)
+    with _cache_index_lock:
+        index = _cache_indexes.get(key)
+        if index is None:
+            index = _cache_indexes[key] = _TTSCacheIndex(key)
+        return index
+
+
+def cached_audio_path(voice_id, text, cache_dir):
+    """Return the cached mp3 path for ``(voice_id, text)``, or ``None`` on a miss.
+
+    A hit counts as a use for LRU purposes. A file dropped in after the
+    index was built is adopted; the extra stat only happens on a miss,
+    which is about to cost an API call anyway.
+    """
+    if not text or not cache_dir:
+        return None
+    index = _cache_index_for(cache_dir)
+    path = _cache_path(index.cache_dir, voice_id or NARRATOR_VOICE_ID, text)
+    if path not in index and os.path.isfile(path):
+        try:
+            index.record(path, os.path.getsize(path))
+        except OSError:
+            pass
+    if path not in index:
+        return None
+    # Touch on hit so a frequently-replayed line doesn't get evicted by a
+    # burst of new lines.
+    index.touch(path)
+    return path
 
 
 def synthesize(api_key, voice_id, text, *, cache_dir=None,
@@ -311,28 +532,23 @@ def synthesize(api_key, voice_id, text, *, cache_dir=None,
     successful synthesis is written to disk and subsequent calls with the
     same (voice_id, text) tuple return the cached bytes without hitting
     the API. The cache is bounded by ``cache_max_bytes`` and
-    ``cache_max_files``; oldest-by-mtime entries are evicted after every
-    successful write that pushes the directory over either limit.
+    ``cache_max_files``; least recently used entries (tracked by
+    ``_TTSCacheIndex``) are evicted after every successful write that
+    pushes the directory over either limit.
     """
     if not text:
         return None
     voice_id = voice_id or NARRATOR_VOICE_ID
 
-    if cache_dir:
-        path = _cache_path(cache_dir, voice_id, text)
-        if os.path.isfile(path):
+    index = _cache_index_for(cache_dir) if cache_dir else None
+    if index is not None:
+        path = _cache_path(index.cache_dir, voice_id, text)
+        if cached_audio_path(voice_id, text, cache_dir):
             try:
                 with open(path, "rb") as fh:
-                    data = fh.read()
-                # Touch on hit so a frequently-replayed line doesn't get
-                # evicted by a burst of new lines.
-                try:
-                    os.utime(path, None)
-                except OSError:
-                    pass
-                return data
+                    return fh.read()
             except OSError:
-                pass
+                index.forget(path)
 
     if not api_key:
         return None
@@ -356,12 +572,99 @@ def synthesize(api_key, voice_id, text, *, cache_dir=None,
         return None
 
     audio = r.content
-    if cache_dir and audio:
+    if index is not None and audio:
         try:
-            os.makedirs(cache_dir, exist_ok=True)
-            with open(_cache_path(cache_dir, voice_id, text), "wb") as fh:
+            os.makedirs(index.cache_dir, exist_ok=True)
+            with open(path, "wb") as fh:
                 fh.write(audio)
-            _evict_cache_if_needed(cache_dir, cache_max_bytes, cache_max_files)
+            index.record(path, len(audio))
+            index.evict(cache_max_bytes, cache_max_files)
         except OSError as e:
             log.info("ElevenLabs TTS cache write failed: %s", e)
     return audio
+
+
+def stream_synthesis(api_key, voice_id, text, *, cache_dir=None,
+                     model_id=_DEFAULT_MODEL,
+                     cache_max_bytes=_DEFAULT_CACHE_MAX_BYTES,
+                     cache_max_files=_DEFAULT_CACHE_MAX_FILES):
+    """Start rendering ``text`` and return an iterator over the mp3 bytes.
+
+    Unlike ``synthesize`` nothing is buffered: chunks are yielded as
+    ElevenLabs sends them, so the caller can forward audio to the client
+    before the render finishes. When ``cache_dir`` is given the chunks are
+    also written to a temporary file that replaces the cache entry only
+    once the whole body has arrived; an aborted or failed stream leaves
+    the cache untouched. Returns ``None`` when the request cannot be
+    started (missing key, network error, non-2xx response). Does not
+    consult the cache -- see ``cached_audio_path``.
+    """
+    if not text or not api_key:
+        return None
+    voice_id = voice_id or NARRATOR_VOICE_ID
+    try:
+        r = requests.post(
+            _TTS_URL_TMPL.format(voice_id=voice_id),
+            json={"text": text, "model_id": model_id},
+            headers={
+                "xi-api-key": api_key,
+                "accept": "audio/mpeg",
+                "Content-Type": "application/json",
+            },
+            timeout=_DEFAULT_TIMEOUT,
+            stream=True,
+        )
+    except requests.RequestException as e:
+        log.info("ElevenLabs TTS request failed: %s", e)
+        return None
+    if not r.ok:
+        log.info("ElevenLabs TTS returned %s", r.status_code)
+        r.close()
+        return None
+    index = _cache_index_for(cache_dir) if cache_dir else None
+    return _tee_audio(r, index, voice_id, text, cache_max_bytes, cache_max_files)
+
+
+def _tee_audio(r, index, voice_id, text, cache_max_bytes, cache_max_files):
+    part = fh = None
+    if index is not None:
+        try:
+            os.makedirs(index.cache_dir, exist_ok=True)
+            fd, part = tempfile.mkstemp(dir=index.cache_dir, suffix=".mp3.part")
+            fh = os.fdopen(fd, "wb")
+        except OSError as e:
+            log.info("ElevenLabs TTS cache write failed: %s", e)
+            part = None
+    size = 0
+    complete = False
+    try:
+        for chunk in r.iter_content(chunk_size=_STREAM_CHUNK_BYTES):
+            if not chunk:
+                continue
+            if fh is not None:
+                try:
+                    fh.write(chunk)
+                except OSError as e:
+                    log.info("ElevenLabs TTS cache write failed: %s", e)
+                    fh.close()
+                    fh = None
+            size += len(chunk)
+            yield chunk
+        complete = True
+    except requests.RequestException as e:
+        log.info("ElevenLabs TTS stream failed: %s", e)
+    finally:
+        r.close()
+        if fh is not None:
+            fh.close()
+        if part is not None:
+            try:
+                if complete and size and fh is not None:
+                    path = _cache_path(index.cache_dir, voice_id, text)
+                    os.replace(part, path)
+                    index.record(path, size)
+                    index.evict(cache_max_bytes, cache_max_files)
+                else:
+                    os.remove(part)
+            except OSError as e:
+                log.info("ElevenLabs TTS cache write failed: %s", e)
@@ -1,13 +1,99 @@
 # gpt_service.py
+import asyncio
+import hashlib
 import json
+import threading
+from collections import OrderedDict
+
+import httpx
+from openai import AsyncOpenAI
+
+
+# Shared transport for the async mode. Every AsyncOpenAI client in the pool
+# rides one ``httpx.AsyncClient`` per API key so keep-alive connections to
+# the provider are reused across requests instead of re-handshaking TLS on
+# every call. All pooled clients are driven from a single background event
+# loop: httpx connections are bound to the loop that opened them, so the
+# loop must outlive any one request.
+_POOL_LIMITS = httpx.Limits(max_connections=32, max_keepalive_connections=16,
+                            keepalive_expiry=60.0)
+_POOL_TIMEOUT = httpx.Timeout(180.0, connect=10.0)
+# Upper bound on distinct API keys kept warm at once; the least recently
+# used client is closed when a new key pushes the pool past this size.
+_POOL_MAX_KEYS = 64
+
+_pool_lock = threading.Lock()
+_async_clients = OrderedDict()
+_loop = None
+_loop_thread = None
+
+
+def _background_loop():
+    """Return the shared event loop, starting its daemon thread on first use."""
+    global _loop, _loop_thread
+    with _pool_lock:
+        if _loop is None or _loop.is_closed():
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(target=loop.run_forever,
+                                      name='gpt-service-loop', daemon=True)
+            thread.start()
+            _loop, _loop_thread = loop, thread
+        return _loop
+
+
+def run_coroutine(coro, timeout=None):
+    """Run ``coro`` on the shared event loop and block until it finishes.
+
+    This is the bridge sync Flask views use to await the async API. It must
+    not be called from the loop thread itself (that would deadlock), which
+    in practice means never from inside another coroutine.
+    """
+    loop = _background_loop()
+    if threading.current_thread() is _loop_thread:
+        raise RuntimeError('run_coroutine called from the GPT service loop thread')
+    return asyncio.run_coroutine_threadsafe(coro, loop).result(timeout)
+
+
+def pooled_async_client(api_key, base_url):
+    """Return the shared ``AsyncOpenAI`` client for ``(api_key, base_url)``.
+
+    Clients are keyed by a hash of the key so raw secrets never sit in the
+    pool's dict keys. Returns ``None`` when no key is supplied.
+    """
+    if not api_key:
+        return None
+    pool_key = (hashlib.sha256(api_key.encode('utf-8')).hexdigest(), base_url)
+    evicted = None
+    with _pool_lock:
+        client = _async_clients.get(pool_key)
+        if client is not None:
+            _async_clients.move_to_end(pool_key)
+            return client
+        client = AsyncOpenAI(
+            api_key=api_key, base_url=base_url,
+            http_client=httpx.AsyncClient(limits=_POOL_LIMITS, timeout=_POOL_TIMEOUT),
+        )
+        _async_clients[pool_key] = client
+        if len(_async_clients) > _POOL_MAX_KEYS:
+            _, evicted = _async_clients.popitem(last=False)
+    if evicted is not None:
+        try:
+            asyncio.run_coroutine_threadsafe(evicted.close(), _background_loop())
+        except Exception as e:
+            print(f'Failed to close evicted async client: {e}')
+    return client
 
 
 class GPTService:
-    def __init__(self, openai, model):
+    def __init__(self, openai, model, async_openai=None):
         self.openai = openai
         self.model = model
+        # Optional ``AsyncOpenAI`` client (normally from
+        # ``pooled_async_client``). Without it the async API still works by
+        # pushing the blocking client onto a worker thread.
+        self.async_openai = async_openai
 
-    def get_response(self, prompt, json_mode=False, temperature=None):
+    def _completion_kwargs(self, prompt, json_mode, temperature):
         kwargs = {
             'model': self.model,
             'messages': [{'role': 'user', 'content': prompt}],
@@ -16,9 +102,34 @@ class GPTService:
             kwargs['response_format'] = {'type': 'json_object'}
         if temperature is not None:
             kwargs['temperature'] = temperature
+        return kwargs
+
+    def get_response(self, prompt, json_mode=False, temperature=None):
+        kwargs = self._completion_kwargs(prompt, json_mode, temperature)
         response = self.openai.chat.completions.create(**kwargs)
         return response.choices[0].message.content.strip()
 
+    def stream_response(self, prompt, json_mode=False, temperature=None):
+        """Yield the completion text in deltas as the model produces it.
+
+        Like ``get_structured``, a provider that rejects JSON mode is retried
+        once without it; that fallback only applies before any text arrived.
+        """
+        kwargs = self._completion_kwargs(prompt, json_mode, temperature)
+        try:
+            stream = self.openai.chat.completions.create(stream=True, **kwargs)
+        except Exception:
+            if not json_mode:
+                raise
+            kwargs.pop('response_format', None)
+            stream = self.openai.chat.completions.create(stream=True, **kwargs)
+        for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = getattr(chunk.choices[0].delta, 'content', None)
+            if delta:
+                yield delta
+
     def get_structured(self, prompt, schema, max_attempts=2, temperature=None):
         """Call the LLM and validate the response against a Pydantic schema.
 
@@ -59,6 +170,53 @@ class GPTService:
         print(f'get_structured exhausted retries; last error: {last_error}')
         return None
 
+    async def aget_response(self, prompt, json_mode=False, temperature=None):
+        """Awaitable counterpart of ``get_response``."""
+        if self.async_openai is None:
+            return await asyncio.to_thread(self.get_response, prompt, json_mode, temperature)
+        kwargs = self._completion_kwargs(prompt, json_mode, temperature)
+        response = await self.async_openai.chat.completions.create(**kwargs)
+        return response.choices[0].message.content.strip()
+
+    async def aget_structured(self, prompt, schema, max_attempts=2, temperature=None):
+        """Awaitable counterpart of ``get_structured``; same retry contract."""
+        last_error = None
+        for attempt in range(1, max_attempts + 1):
+            try:
+                try:
+                    text = await self.aget_response(prompt, json_mode=True, temperature=temperature)
+                except Exception:
+                    text = await self.aget_response(prompt, temperature=temperature)
+
+                data = self._parse_json_payload(text)
+                if data is None:
+                    last_error = 'no JSON could be extracted from response'
+                    continue
+
+                return schema.model_validate(data)
+            except Exception as e:
+                last_error = e
+                print(f'aget_structured attempt {attempt}/{max_attempts} failed: {e}')
+                continue
+        print(f'aget_structured exhausted retries; last error: {last_error}')
+        return None
+
+    async def get_structured_many(self, calls):
+        """Run several independent ``get_structured`` calls concurrently.
+
+        ``calls`` is an iterable of dicts holding ``aget_structured`` keyword
+        arguments (``prompt``, ``schema`` and optionally ``max_attempts`` /
+        ``temperature``). Returns the results in the same order; a call that
+        exhausts its retries yields ``None`` without affecting its siblings.
+        """
+        return list(await asyncio.gather(
+            *(self.aget_structured(**call) for call in calls)
+        ))
+
+    def run_structured_many(self, calls, timeout=None):
+        """Blocking wrapper around ``get_structured_many`` for sync callers."""
+        return run_coroutine(self.get_structured_many(calls), timeout=timeout)
+
     @staticmethod
     def _parse_json_payload(text):
         try:
@@ -68,5 +226,3 @@ class GPTService:
         except Exception as e:
             print(f'Failed to parse JSON payload: {e}')
             return None
-
-
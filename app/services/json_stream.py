@@ -0,0 +1,133 @@
+# json_stream.py
+"""Incremental extraction of one string field from a streamed JSON object.
+
+The turn narrator answers with a JSON object whose ``narration`` field is
+long-form prose. Waiting for the closing brace before showing any of it
+makes time-to-first-text equal to the full completion latency, so the
+streaming turn endpoint feeds completion deltas through
+``StringFieldStream`` and forwards the decoded characters as they arrive.
+
+Only a top-level key is matched; the same key nested deeper (e.g. inside a
+``dialogue`` line) is ignored. Any text before the first ``{`` (markdown
+fences, chatter) is skipped, mirroring ``GPTService._parse_json_payload``.
+"""
+
+_SIMPLE_ESCAPES = {
+    '"': '"', '\\': '\\', '/': '/',
+    'b': '\b', 'f': '\f', 'n': '\n', 'r': '\r', 't': '\t',
+}
+
+
+class StringFieldStream:
+    """Feed raw JSON text in chunks; get back newly decoded field text.
+
+    ``feed`` returns the characters of the target field's value decoded so
+    far in that chunk (possibly ``''``). ``text`` holds everything decoded
+    and ``done`` flips once the value's closing quote has been seen.
+    """
+
+    def __init__(self, field):
+        self.field = field
+        self.text = ''
+        self.done = False
+        self._depth = 0
+        self._in_string = False
+        self._escape = None      # pending escape sequence, e.g. '\\u00'
+        self._string_buf = []    # key being read at depth 1
+        self._reading_key = False
+        self._capturing = False
+        self._expect = None      # 'key' | 'colon' | 'value' at depth 1
+        self._last_key = None
+        self._high_surrogate = None
+
+    def feed(self, chunk):
+        if self.done or not chunk:
+            return ''
+        out = []
+        for ch in chunk:
+            if self._in_string:
+                self._string_char(ch, out)
+                if self.done:
+                    break
+                continue
+            if ch == '"':
+                self._in_string = True
+                self._escape = None
+                if self._depth == 1 and self._expect == 'key':
+                    self._reading_key = True
+                    self._string_buf = []
+                elif (self._depth == 1 and self._expect == 'value'
+                      and self._last_key == self.field):
+                    self._capturing = True
+                continue
+            if ch in '{[':
+                self._depth += 1
+                if self._depth == 1:
+                    self._expect = 'key' if ch == '{' else None
+            elif ch in '}]':
+                self._depth -= 1
+            elif self._depth == 1:
+                if ch == ':' and self._expect == 'colon':
+                    self._expect = 'value'
+                elif ch == ',':
+                    self._expect = 'key'
+                elif not ch.isspace() and self._expect == 'value':
+                    # Non-string value (number, literal); wait for the comma.
+                    self._expect = None
+        decoded = ''.join(out)
+        self.text += decoded
+        return decoded
+
+    def _string_char(self, ch, out):
+        if self._escape is not None:
+            self._escape += ch
+            decoded = self._decode_escape()
+            if decoded is None:
+                return
+            self._escape = None
+            self._emit(decoded, out)
+            return
+        if ch == '\\':
+            self._escape = ''
+            return
+        if ch == '"':
+            self._close_string()
+            return
+        self._emit(ch, out)
+
+    def _decode_escape(self):
+        """Return the decoded text once the pending escape is complete."""
+        seq = self._escape
+        if seq[0] != 'u':
+            return _SIMPLE_ESCAPES.get(seq[0], seq[0])
+        if len(seq) < 5:
+            return None
+        try:
+            code = int(seq[1:5], 16)
+        except ValueError:
+            return ''
+        if 0xD800 <= code <= 0xDBFF:
+            self._high_surrogate = code
+            return ''
+        if 0xDC00 <= code <= 0xDFFF and self._high_surrogate is not None:
+            code = 0x10000 + ((self._high_surrogate - 0xD800) << 10) + (code - 0xDC00)
+        self._high_surrogate = None
+        return chr(code)
+
+    def _emit(self, text, out):
+        if self._capturing:
+            out.append(text)
+        elif self._reading_key:
+            self._string_buf.append(text)
+
+    def _close_string(self):
+        self._in_string = False
+        if self._reading_key:
+            self._reading_key = False
+            self._last_key = ''.join(self._string_buf)
+            self._expect = 'colon'
+        elif self._capturing:
+            self._capturing = False
+            self.done = True
+        elif self._depth == 1 and self._expect == 'value':
+            self._expect = None
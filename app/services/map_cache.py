@@ -0,0 +1,118 @@
+# map_cache.py
+"""Per-seed cache of the serialized ``/api/world/<seed_id>/map`` payload.
+
+The map widget asks for the whole geography -- every ``Location``,
+``LocationConnection`` and ``GeographicFeature``, with each feature's
+JSON geometry re-parsed -- every time it opens, yet those rows are
+written once, by ``LocationBuilder.persist_locations`` at world-build
+time, which calls ``invalidate`` after its commit. Any future writer of
+a seed's geography must do the same.
+
+The cached ``MapPayload`` holds the response body exactly as it is sent
+plus a strong ETag (a digest of that body), so a repeat open is answered
+from memory -- with a 304 when the browser still has it. It also keeps
+the seed's owner so the route can check access without reading ``Seeds``
+(a seed's owner never changes).
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import NamedTuple, Optional
+
+from app.orm import GeographicFeature, Location, LocationConnection
+from app.services.seed_cache import SeedCache
+
+
+class MapPayload(NamedTuple):
+    body: bytes
+    etag: str
+    owner_id: Optional[int]
+
+
+_payloads = SeedCache()
+
+
+def get(bind, seed_id):
+    """Return the cached ``MapPayload`` for the seed, or ``None``."""
+    return _payloads.get(bind, seed_id)
+
+
+def load(db_session, bind, seed_id, owner_id):
+    """Serialize the seed's geography, cache it and return the ``MapPayload``."""
+    body = json.dumps(build_map(db_session, seed_id),
+                      separators=(',', ':')).encode('utf-8')
+    payload = MapPayload(body, hashlib.sha256(body).hexdigest()[:32], owner_id)
+    _payloads.set(bind, seed_id, payload)
+    return payload
+
+
+def invalidate(bind, seed_id):
+    """Drop the cached payload so the next request re-reads the geography."""
+    _payloads.pop(bind, seed_id)
+
+
+def build_map(db_session, seed_id):
+    """Return the map payload dict: locations, connections and features."""
+    locations = [
+        {
+            'id': loc.id,
+            'name': loc.name,
+            'description': loc.description or '',
+            'longitude': loc.longitude,
+            'latitude': loc.latitude,
+            'type': loc.type,
+            'climate': loc.climate,
+            'terrain': loc.terrain,
+            'parent_id': loc.parent_id,
+        }
+        for loc in db_session.query(Location)
+        .filter(Location.seed_id == seed_id)
+        .order_by(Location.id)
+        .all()
+    ]
+
+    connections = [
+        {
+            'id': c.id,
+            'from_location_id': c.from_location_id,
+            'to_location_id': c.to_location_id,
+            'name': c.name or '',
+            'type': c.type or 'road',
+        }
+        for c in db_session.query(LocationConnection)
+        .filter(LocationConnection.seed_id == seed_id)
+        .order_by(LocationConnection.id)
+        .all()
+    ]
+
+    # Natural geography (forests, rivers, mountain ranges, lakes, ...).
+    # Geometry is stored as JSON text so the frontend can hand the list
+    # straight to Leaflet; a malformed row is dropped rather than 500'd
+    # because the rest of the map should still render.
+    features = []
+    for f in (
+        db_session.query(GeographicFeature)
+        .filter(GeographicFeature.seed_id == seed_id)
+        .order_by(GeographicFeature.id)
+        .all()
+    ):
+        try:
+            points = json.loads(f.geometry) if f.geometry else []
+        except (ValueError, TypeError):
+            continue
+        features.append({
+            'id': f.id,
+            'name': f.name or '',
+            'type': f.type or 'forest',
+            'description': f.description or '',
+            'points': points,
+            'closed': bool(f.closed),
+        })
+
+    return {
+        'seed_id': seed_id,
+        'locations': locations,
+        'connections': connections,
+        'features': features,
+    }
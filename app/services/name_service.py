@@ -12,19 +12,136 @@ The service is responsible for three things:
 
 If the table is empty, or the LLM returns no usable themes, every lookup
 returns ``None`` and callers fall back to whatever name the LLM produced.
+
+Draws never touch ``NameLibrary`` per name. The first draw for a
+(source, theme) loads that theme's names once into tuples split by
+(gender, category) -- ``_theme_pools``, shared by every request -- and
+each seed only remembers the names it has been given (``_seed_draws``),
+so a draw is a random index into a tuple and a seed does not hand out
+the same library name twice until its pools run dry. Only the most
+recently used seeds are remembered; a seed that comes back after being
+evicted starts from the names its characters already carry.
+
+The theme catalog is cached the same way (``theme_catalog``), together
+with the prompt text listing it. ``NameLibrary`` only changes when
+``scripts/seed_name_library`` runs -- from the command line, the release
+step, or the startup seeding thread -- and the seeder calls
+``bump_library_version`` as each source finishes, which drops the catalog
+and the pools. A seeder run in another process is only seen here after a
+restart, like any other out-of-band schema or data change.
 """
 from __future__ import annotations
 
 import json
 import random
-from typing import List, Optional
+import threading
+from typing import List, NamedTuple, Optional
 
-from sqlalchemy import func
+from sqlalchemy import tuple_
 
-from app.orm import NameLibrary, Seed
+from app.orm import Character, NameLibrary, Seed
 from app.prompt_templates import WORLD_BUILDING
+from app.services.seed_cache import SeedCache, bind_for
 from app.world_building.schemas import NamingThemeSelectionOut
 
+# (source, theme) -> {(gender, category): tuple of names}. Keyed like a
+# SeedCache so each engine (one per test) has its own pools.
+_theme_pools = SeedCache()
+# _CATALOG_KEY -> ThemeCatalog, in a SeedCache for the per-engine keying.
+_catalogs = SeedCache()
+_CATALOG_KEY = 'catalog'
+# Bumped whenever NameLibrary is written; loads that started under an
+# older version are not cached.
+_library_version = 0
+_version_lock = threading.Lock()
+
+
+def library_version():
+    return _library_version
+
+
+def bump_library_version():
+    """Mark NameLibrary as changed: drop the cached catalog and name pools.
+
+    Seeds keep the names they were given, so reloaded pools still skip them.
+    """
+    global _library_version
+    with _version_lock:
+        _library_version += 1
+        _catalogs.clear()
+        _theme_pools.clear()
+
+
+class ThemeCatalog(NamedTuple):
+    """The (source, theme) pairs in NameLibrary and their prompt listing."""
+    pairs: tuple
+    prompt: str
+
+    @classmethod
+    def from_themes(cls, themes, limit):
+        pairs = tuple((t['source'], t['theme']) for t in themes)
+        prompt = "\n".join(f"- {source}/{theme}" for source, theme in pairs[:limit])
+        return cls(pairs, prompt)
+
+    def as_dicts(self):
+        return [{"source": s, "theme": t} for s, t in self.pairs]
+
+
+def _store_if_current(cache, bind, key, value, version):
+    with _version_lock:
+        if version == _library_version:
+            cache.set(bind, key, value)
+
+
+# Seeds whose draws and themes stay in memory; older ones are rebuilt
+# from the database when they are played again.
+_MAX_CACHED_SEEDS = 256
+# seed_id -> _SeedDraws
+_seed_draws = SeedCache(max_seeds=_MAX_CACHED_SEEDS)
+# seed_id -> the seed's parsed naming themes. ``assign_themes_to_seed`` is
+# the only writer of ``Seed.naming_themes``, so it keeps this current.
+_seed_themes = SeedCache(max_seeds=_MAX_CACHED_SEEDS)
+
+
+class _SeedDraws:
+    """The names one seed has been handed, for no-repeat draws.
+
+    A draw picks uniformly across the shared pools and retries when it
+    lands on a name in ``used``, so a seed costs memory in proportion to
+    the names it drew, not to the size of its pools. Only once
+    ``_DRAW_ATTEMPTS`` picks in a row are taken -- the pools are nearly
+    used up -- does it scan them for whatever is left.
+    """
+
+    _DRAW_ATTEMPTS = 32
+
+    def __init__(self, used=()):
+        self.lock = threading.Lock()
+        self.used = set(used)
+
+    def draw(self, pools):
+        """Return a name from ``pools`` (``[(key, names), ...]``) not drawn yet."""
+        total = sum(len(names) for _, names in pools)
+        if not total:
+            return None
+        with self.lock:
+            for _ in range(self._DRAW_ATTEMPTS):
+                pick = random.randrange(total)
+                for _, names in pools:
+                    if pick < len(names):
+                        break
+                    pick -= len(names)
+                name = names[pick]
+                if name not in self.used:
+                    self.used.add(name)
+                    return name
+            left = list({name for _, names in pools for name in names} - self.used)
+            if not left:
+                return None
+            name = random.choice(left)
+            self.used.add(name)
+            return name
+
 
 class NameService:
     # Kept small so the prompt stays readable; each entry is one line.
@@ -37,15 +154,27 @@ class NameService:
     # ------------------------------------------------------------------ #
     # Theme discovery + selection                                         #
     # ------------------------------------------------------------------ #
+    def theme_catalog(self) -> ThemeCatalog:
+        """Return the cached ``ThemeCatalog``, reading NameLibrary on a miss."""
+        bind = bind_for(self.session)
+        catalog = _catalogs.get(bind, _CATALOG_KEY)
+        if catalog is None:
+            version = library_version()
+            rows = (
+                self.session.query(NameLibrary.source, NameLibrary.theme)
+                .distinct()
+                .order_by(NameLibrary.source, NameLibrary.theme)
+                .all()
+            )
+            catalog = ThemeCatalog.from_themes(
+                [{"source": s, "theme": t} for s, t in rows],
+                self._MAX_THEMES_IN_PROMPT)
+            _store_if_current(_catalogs, bind, _CATALOG_KEY, catalog, version)
+        return catalog
+
     def list_available_themes(self) -> List[dict]:
         """Return every (source, theme) pair present in NameLibrary."""
-        rows = (
-            self.session.query(NameLibrary.source, NameLibrary.theme)
-            .distinct()
-            .order_by(NameLibrary.source, NameLibrary.theme)
-            .all()
-        )
-        return [{"source": s, "theme": t} for s, t in rows]
+        return self.theme_catalog().as_dicts()
 
     def select_themes_for_seed(self, seed_data) -> List[dict]:
         """Ask the LLM to pick 1-3 themes that fit ``seed_data``.
@@ -53,18 +182,25 @@ class NameService:
         Returns the chosen list (possibly empty if no themes are available
         or the LLM call fails).
         """
-        available = self.list_available_themes()
-        if not available:
+        return self.choose_themes(seed_data, self.theme_catalog())
+
+    def choose_themes(self, seed_data, available) -> List[dict]:
+        """LLM half of ``select_themes_for_seed``: pick from ``available``.
+
+        ``available`` is a ``ThemeCatalog`` or a list of theme dicts.
+        Touches no session state, so world building can run it on a worker
+        thread after reading the catalog on its own.
+        """
+        if not isinstance(available, ThemeCatalog):
+            available = ThemeCatalog.from_themes(available or [],
+                                                 self._MAX_THEMES_IN_PROMPT)
+        if not available.pairs:
             return []
         if self.gpt_service is None:
             return []
 
-        catalog_lines = [f"- {p['source']}/{p['theme']}"
-                         for p in available[: self._MAX_THEMES_IN_PROMPT]]
-        catalog = "\n".join(catalog_lines)
-
         payload = self.gpt_service.get_structured(
-            WORLD_BUILDING['NAMING_THEME_SELECTION'].format(seed_data, catalog),
+            WORLD_BUILDING['NAMING_THEME_SELECTION'].format(seed_data, available.prompt),
             NamingThemeSelectionOut,
             max_attempts=2,
             temperature=0.4,
@@ -73,7 +209,7 @@ class NameService:
             return []
 
         # Drop any (source, theme) the LLM hallucinated that isn't in the DB.
-        available_set = {(p['source'], p['theme']) for p in available}
+        available_set = set(available.pairs)
         chosen = [
             {"source": c.source, "theme": c.theme}
             for c in payload.themes
@@ -88,17 +224,27 @@ class NameService:
         seed = self.session.query(Seed).filter(Seed.id == seed_id).one()
         seed.naming_themes = json.dumps(themes) if themes else None
         self.session.commit()
+        _seed_themes.set(bind_for(self.session), seed_id, list(themes or []))
 
     def get_themes_for_seed(self, seed_id) -> List[dict]:
+        bind = bind_for(self.session)
+        cached = _seed_themes.get(bind, seed_id)
+        if cached is not None:
+            return list(cached)
         seed = self.session.query(Seed).filter(Seed.id == seed_id).first()
-        if seed is None or not seed.naming_themes:
-            return []
-        try:
-            data = json.loads(seed.naming_themes)
-        except (TypeError, ValueError):
+        if seed is None:
             return []
-        return [t for t in data if isinstance(t, dict)
-                and 'source' in t and 'theme' in t]
+        themes = []
+        if seed.naming_themes:
+            try:
+                data = json.loads(seed.naming_themes)
+            except (TypeError, ValueError):
+                data = []
+            if isinstance(data, list):
+                themes = [t for t in data if isinstance(t, dict)
+                          and 'source' in t and 'theme' in t]
+        _seed_themes.set(bind, seed_id, themes)
+        return list(themes)
 
     # ------------------------------------------------------------------ #
     # Lookup                                                              #
@@ -108,47 +254,111 @@ class NameService:
         themes: List[dict],
         gender: Optional[str] = None,
         category: str = 'first',
+        seed_id=None,
     ) -> Optional[str]:
         """Return a random name matching ``themes`` (and optionally gender).
 
         Falls back progressively: drops the gender filter, then the category
-        filter, before giving up and returning ``None``.
+        filter, before giving up and returning ``None``. With ``seed_id``
+        the name is one this seed has not been given yet, as long as any
+        such name matches; otherwise any matching name may come back.
         """
         if not themes:
             return None
 
+        pools = self._pools_for(themes)
         gender_norm = self._normalize_gender(gender)
+        draws = self._draws_for(seed_id) if seed_id is not None else None
 
-        for current_gender, current_category in (
-            (gender_norm, category),
-            ('any', category),
-            (gender_norm, 'any'),
-            ('any', 'any'),
-            (None, None),
-        ):
-            row = self._query_random(themes, current_gender, current_category)
-            if row is not None:
-                return row.name
+        tiers = [self._tier_pools(pools, current_gender, current_category)
+                 for current_gender, current_category in (
+                     (gender_norm, category),
+                     ('any', category),
+                     (gender_norm, 'any'),
+                     ('any', 'any'),
+                     (None, None),
+                 )]
+        if draws is not None:
+            for tier in tiers:
+                name = draws.draw(tier)
+                if name is not None:
+                    return name
+        # No seed, or the seed has used up every matching name: draw with
+        # replacement from the first tier that has anything.
+        for tier in tiers:
+            total = sum(len(names) for _, names in tier)
+            if not total:
+                continue
+            pick = random.randrange(total)
+            for _, names in tier:
+                if pick < len(names):
+                    return names[pick]
+                pick -= len(names)
         return None
 
-    def _query_random(self, themes, gender, category):
-        from sqlalchemy import tuple_
+    def _draws_for(self, seed_id):
+        """Return the seed's ``_SeedDraws``, rebuilt from its characters on a miss."""
+        bind = bind_for(self.session)
+        if bind is None:
+            return _SeedDraws()
+        draws = _seed_draws.get(bind, seed_id)
+        if draws is not None:
+            return draws
+        used = set()
+        with self.session.no_autoflush:
+            names = (self.session.query(Character.name)
+                     .filter(Character.seed_id == seed_id).all())
+        for name, in names:
+            if name:
+                used.add(name)
+                used.update(name.split())
+        return _seed_draws.get_or_create(bind, seed_id, lambda: _SeedDraws(used))
 
-        q = self.session.query(NameLibrary).filter(
-            tuple_(NameLibrary.source, NameLibrary.theme).in_(
-                [(t['source'], t['theme']) for t in themes]))
+    def _pools_for(self, themes):
+        """Return ``{(source, theme, gender, category): names}`` for ``themes``.
 
-        if gender is not None:
-            q = q.filter(NameLibrary.gender.in_([gender, 'any']))
-        if category is not None:
-            q = q.filter(NameLibrary.category.in_([category, 'any']))
+        Themes not loaded yet are read in one query and kept in
+        ``_theme_pools`` for every later draw.
+        """
+        bind = bind_for(self.session)
+        wanted = list(dict.fromkeys((t['source'], t['theme']) for t in themes))
+        loaded = {key: _theme_pools.get(bind, key) for key in wanted}
+        missing = [key for key, pool in loaded.items() if pool is None]
+        if missing:
+            version = library_version()
+            grouped = {key: {} for key in missing}
+            rows = (
+                self.session.query(NameLibrary.source, NameLibrary.theme,
+                                   NameLibrary.gender, NameLibrary.category,
+                                   NameLibrary.name)
+                .filter(tuple_(NameLibrary.source, NameLibrary.theme).in_(missing))
+                .order_by(NameLibrary.id)
+                .all()
+            )
+            for source, theme, gender, category, name in rows:
+                grouped[(source, theme)].setdefault((gender, category), []).append(name)
+            for key, split in grouped.items():
+                pool = {subkey: tuple(names) for subkey, names in split.items()}
+                _store_if_current(_theme_pools, bind, key, pool, version)
+                loaded[key] = pool
+        return {
+            (source, theme, gender, category): names
+            for (source, theme), pool in loaded.items()
+            for (gender, category), names in pool.items()
+        }
 
-        # Portable random row: pick a random offset within the filtered set.
-        # Avoids dialect-specific RAND()/RANDOM() functions.
-        total = q.with_entities(func.count(NameLibrary.id)).scalar()
-        if not total:
-            return None
-        return q.offset(random.randint(0, total - 1)).first()
+    @staticmethod
+    def _tier_pools(pools, gender, category):
+        """The pools one fallback tier draws from, as ``[(key, names), ...]``.
+
+        Matches the old row filters: ``gender`` admits that gender and
+        ``any``, ``category`` likewise, and ``None`` admits everything.
+        """
+        return [
+            (key, names) for key, names in pools.items()
+            if (gender is None or key[2] in (gender, 'any'))
+            and (category is None or key[3] in (category, 'any'))
+        ]
 
     @staticmethod
     def _normalize_gender(gender) -> str:
@@ -0,0 +1,90 @@
+# seed_cache.py
+"""Process-local storage for per-seed derived data.
+
+Several read paths rebuild the same seed-scoped structures (turn context,
+rosters, lookup tables) on every request even though the underlying rows
+change rarely and only through a handful of write paths. ``SeedCache``
+gives those paths one place to keep the derived copy.
+
+Values are keyed by the SQLAlchemy engine as well as the seed id, so two
+databases living in one process (the test suite builds one per test) never
+see each other's entries; dropping an engine drops its entries with it.
+Caches of data every seed accumulates can pass ``max_seeds`` to keep only
+the most recently used seeds per engine.
+The app runs a single gunicorn worker (see ``gunicorn_config.py``), so a
+process-local cache observes every write the app makes.
+"""
+from __future__ import annotations
+
+import threading
+import weakref
+from collections import OrderedDict
+
+
+def bind_for(session):
+    """Return the engine ``session`` talks to, or ``None`` if unbound."""
+    try:
+        return session.get_bind()
+    except Exception:
+        return None
+
+
+class SeedCache:
+    """A ``(engine, seed_id) -> value`` map safe to share across threads.
+
+    A ``None`` bind disables caching for that call: reads miss and writes
+    are dropped, so callers never need a separate uncached code path.
+    With ``max_seeds`` set, storing a seed beyond that many per engine
+    evicts the least recently used one.
+    """
+
+    def __init__(self, max_seeds=None):
+        self._lock = threading.RLock()
+        self._by_bind = weakref.WeakKeyDictionary()
+        self._max_seeds = max_seeds
+
+    def get(self, bind, seed_id, default=None):
+        if bind is None:
+            return default
+        with self._lock:
+            per_seed = self._by_bind.get(bind)
+            if per_seed is None or seed_id not in per_seed:
+                return default
+            per_seed.move_to_end(seed_id)
+            return per_seed[seed_id]
+
+    def set(self, bind, seed_id, value):
+        if bind is None:
+            return
+        with self._lock:
+            self._store(self._by_bind.setdefault(bind, OrderedDict()), seed_id, value)
+
+    def get_or_create(self, bind, seed_id, factory):
+        """Return the cached value, storing ``factory()`` first on a miss."""
+        if bind is None:
+            return factory()
+        with self._lock:
+            per_seed = self._by_bind.setdefault(bind, OrderedDict())
+            if seed_id in per_seed:
+                per_seed.move_to_end(seed_id)
+                return per_seed[seed_id]
+            value = factory()
+            self._store(per_seed, seed_id, value)
+            return value
+
+    def _store(self, per_seed, seed_id, value):
+        per_seed[seed_id] = value
+        per_seed.move_to_end(seed_id)
+        if self._max_seeds is not None:
+            while len(per_seed) > self._max_seeds:
+                per_seed.popitem(last=False)
+
+    def pop(self, bind, seed_id):
+        if bind is None:
+            return None
+        with self._lock:
+            return self._by_bind.get(bind, OrderedDict()).pop(seed_id, None)
+
+    def clear(self):
+        with self._lock:
+            self._by_bind.clear()
@@ -17,6 +17,8 @@ import json
 from typing import Optional
 
 from app.orm import TranscriptEntry
+from app.services import context_cache
+from app.services.seed_cache import bind_for
 
 
 # Known transcript kinds. The set is intentionally open -- callers may pass
@@ -72,10 +74,7 @@ def add_entry(
         The persisted ``TranscriptEntry`` (detached from its session) on
         success, or ``None`` if the write failed.
     """
-    payload = dict(meta) if meta else {}
-    if status and status != 'info':
-        payload.setdefault('status', status)
-    meta_json = json.dumps(payload) if payload else None
+    meta_json = _meta_json(meta, status)
 
     try:
         session = session_factory()
@@ -94,7 +93,6 @@ def add_entry(
         session.commit()
         session.refresh(entry)
         session.expunge(entry)
-        return entry
     except Exception:
         try:
             session.rollback()
@@ -106,26 +104,187 @@ def add_entry(
             session.close()
         except Exception:
             pass
+    # Keep the cached turn-context tail current without a re-read.
+    try:
+        context_cache.note_transcript_entry(
+            bind_for(session), seed_id, entry.id, kind, speaker, text)
+    except Exception:
+        pass
+    return entry
+
+
+class TranscriptBatch:
+    """Buffer transcript entries and write them in one transaction.
+
+    A turn produces a handful of lines (Arbiter ruling, dice, narration
+    paragraphs, dialogue, news) that were each written by ``add_entry``
+    with their own session, commit and refresh. A batch collects them and
+    ``flush`` inserts them together: one connection checkout, one commit,
+    and the ORM's multi-row INSERT (``insertmanyvalues``) where the backend
+    can return the generated ids from it -- on MySQL the rows are still
+    inserted one statement at a time, but inside the single transaction.
+
+    ``add`` returns the JSON-friendly entry dict the routes hand back to
+    the frontend; its ``id`` is ``None`` until ``flush`` stamps it. Failure
+    semantics match ``add_entry``: a failed flush is swallowed, nothing is
+    written and the dicts keep ``id=None``.
+    """
+
+    def __init__(self, session_factory, seed_id, *, turn=None):
+        self.session_factory = session_factory
+        self.seed_id = seed_id
+        self.turn = turn
+        self._pending = []
+
+    def __len__(self):
+        return len(self._pending)
+
+    def add(self, kind, text, *, speaker=None, meta=None, status='info',
+            turn=None, view=None):
+        """Queue one entry; same arguments as ``add_entry``.
+
+        ``view`` is the dict to return (and stamp the id into); by default
+        it is ``{'id', 'kind', 'speaker', 'text'}``.
+        """
+        if view is None:
+            view = {'id': None, 'kind': kind, 'speaker': speaker, 'text': text}
+        row = TranscriptEntry(
+            seed_id=self.seed_id,
+            turn=self.turn if turn is None else turn,
+            kind=kind,
+            speaker=speaker,
+            text=text,
+            meta=_meta_json(meta, status),
+        )
+        self._pending.append((row, view))
+        return view
+
+    def flush(self):
+        """Write every queued entry; return the views that were persisted.
+
+        Views come back in the order they were added. The batch is empty
+        afterwards, so it can be reused for a later group of lines.
+        """
+        pending, self._pending = self._pending, []
+        if not pending:
+            return []
+        try:
+            session = self.session_factory()
+        except Exception:
+            return []
+        try:
+            session.add_all([row for row, _ in pending])
+            session.flush()
+            # Read what we need before commit expires the rows, otherwise
+            # each access would trigger its own refresh SELECT.
+            written = [(row.id, row.kind, row.speaker, row.text)
+                       for row, _ in pending]
+            session.commit()
+        except Exception as e:
+            print(f'Transcript batch flush failed for seed {self.seed_id}: {e}')
+            try:
+                session.rollback()
+            except Exception:
+                pass
+            return []
+        finally:
+            try:
+                session.close()
+            except Exception:
+                pass
+        bind = bind_for(session)
+        for (_, view), (entry_id, kind, speaker, text) in zip(pending, written):
+            view['id'] = entry_id
+            try:
+                context_cache.note_transcript_entry(
+                    bind, self.seed_id, entry_id, kind, speaker, text)
+            except Exception:
+                pass
+        return [view for _, view in pending]
+
 
+# Default window for paged reads: what the world payload ships on page
+# load and what ``/api/seed/<id>/transcript`` returns per request.
+TRANSCRIPT_PAGE_SIZE = 50
 
-def list_for_seed(session, seed_id):
-    """Return all transcript entries for ``seed_id`` in display order.
+
+def list_for_seed(session, seed_id, *, before_id=None, after_id=None, limit=None):
+    """Return transcript entries for ``seed_id`` in display order.
 
     Ordering is by primary key, which is monotonically increasing within a
     seed and so matches the order rows were written by ``add_entry``.
 
+    With no arguments every entry is returned. ``before_id`` / ``after_id``
+    are exclusive keyset cursors on the id and ``limit`` caps the window:
+    ``before_id`` (or ``limit`` alone) yields the newest ``limit`` entries
+    below the cursor, ``after_id`` alone yields the oldest ``limit`` entries
+    above it. Either way the rows come back oldest first and the read
+    walks ``idx_transcript_seed_id`` instead of scanning the whole seed.
+
     Each item is a plain dict suitable for direct JSON serialisation by the
     Flask routes; ``meta`` is decoded back into a dict when present.
     """
-    rows = (
+    query = (
         session.query(TranscriptEntry)
         .filter(TranscriptEntry.seed_id == seed_id)
-        .order_by(TranscriptEntry.id)
-        .all()
     )
+    if before_id is not None:
+        query = query.filter(TranscriptEntry.id < before_id)
+    if after_id is not None:
+        query = query.filter(TranscriptEntry.id > after_id)
+    if limit is None:
+        rows = query.order_by(TranscriptEntry.id).all()
+    elif after_id is not None and before_id is None:
+        rows = query.order_by(TranscriptEntry.id).limit(limit).all()
+    else:
+        rows = list(reversed(
+            query.order_by(TranscriptEntry.id.desc()).limit(limit).all()))
     return [_serialise(row) for row in rows]
 
 
+def page_for_seed(session, seed_id, *, before_id=None, after_id=None,
+                  limit=TRANSCRIPT_PAGE_SIZE):
+    """Keyset page of the transcript plus whether more lies beyond it.
+
+    Returns ``{'entries': [...], 'has_more': bool}``. ``has_more`` looks in
+    the direction being paged: newer entries for an ``after_id`` page,
+    older ones otherwise. One extra row is fetched to answer it, so no
+    COUNT query is needed.
+    """
+    entries = list_for_seed(session, seed_id, before_id=before_id,
+                            after_id=after_id, limit=limit + 1)
+    has_more = len(entries) > limit
+    if has_more:
+        forward = after_id is not None and before_id is None
+        entries = entries[:limit] if forward else entries[1:]
+    return {'entries': entries, 'has_more': has_more}
+
+
+def tail_for_seed(session, seed_id, kinds=None, limit=50):
+    """Return the newest ``limit`` entries of the given ``kinds``, oldest first.
+
+    Walks ``idx_transcript_seed_id`` (seed_id, id) backwards and filters
+    kinds in SQL, so the cost depends on how far back the last ``limit``
+    matching rows sit -- not on how long the campaign's transcript is.
+    ``kinds=None`` matches every kind.
+    """
+    query = (
+        session.query(TranscriptEntry)
+        .filter(TranscriptEntry.seed_id == seed_id)
+    )
+    if kinds is not None:
+        query = query.filter(TranscriptEntry.kind.in_(list(kinds)))
+    rows = query.order_by(TranscriptEntry.id.desc()).limit(limit).all()
+    return [_serialise(row) for row in reversed(rows)]
+
+
+def _meta_json(meta, status):
+    payload = dict(meta) if meta else {}
+    if status and status != 'info':
+        payload.setdefault('status', status)
+    return json.dumps(payload) if payload else None
+
+
 def _serialise(entry):
     return {
         'id': entry.id,
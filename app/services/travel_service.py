@@ -16,13 +16,20 @@ Distances are Euclidean across the lon/lat plane multiplied by
 constant is loose on purpose -- the LLM is not consistent enough about
 scale for higher-fidelity math to be worth it, and the travel prompt
 already gives the player a "feels right" estimate.
+
+Reachability and routing run against a per-seed ``TravelGraph`` built
+from one read of the seed's locations and connections and cached in
+process. The graph only changes when ``LocationBuilder`` persists the
+world, which calls ``invalidate_graph``.
 """
 from __future__ import annotations
 
+import heapq
 import math
 
 from app.orm import Character, Location, LocationConnection
 from app.services import time_service
+from app.services.seed_cache import SeedCache, bind_for
 
 
 # 1 lon/lat unit ~= 100 km. Tunable from a single place if the world
@@ -84,6 +91,136 @@ def travel_minutes(from_loc, to_loc):
     return max(INTRA_SETTLEMENT_MINUTES, minutes)
 
 
+class GraphLocation:
+    """Detached copy of the ``Location`` columns travel math needs.
+
+    Duck-types the ORM row for ``travel_minutes`` so the graph can be
+    shared across sessions and threads without touching the database.
+    """
+
+    __slots__ = ('id', 'name', 'type', 'terrain', 'parent_id',
+                 'longitude', 'latitude')
+
+    def __init__(self, loc):
+        self.id = loc.id
+        self.name = loc.name
+        self.type = loc.type
+        self.terrain = loc.terrain
+        self.parent_id = loc.parent_id
+        self.longitude = loc.longitude
+        self.latitude = loc.latitude
+
+
+class TravelGraph:
+    """Adjacency list of one seed's travel network.
+
+    ``edges[loc_id]`` maps every destination reachable in one hop from
+    ``loc_id`` to its ``travel_minutes`` cost, in the same near-to-far
+    order ``reachable_destinations`` returns. Edges are directed: a
+    sub-location can leave for its parent's neighbours, but those
+    neighbours only lead back to the settlement itself.
+    """
+
+    def __init__(self, locations, connections):
+        self.locations = {loc.id: GraphLocation(loc) for loc in locations}
+        children = {}
+        for loc in self.locations.values():
+            if loc.parent_id is not None:
+                children.setdefault(loc.parent_id, []).append(loc)
+        links = {}
+        for conn in connections:
+            links.setdefault(conn.from_location_id, []).append(conn.to_location_id)
+            links.setdefault(conn.to_location_id, []).append(conn.from_location_id)
+        self.edges = {
+            loc.id: self._hops_from(loc, children, links)
+            for loc in self.locations.values()
+        }
+
+    def _hops_from(self, from_loc, children, links):
+        # Same three buckets (and tie order) the per-request queries used:
+        # siblings + parent, or children, then connected settlements.
+        out = {}
+        if from_loc.parent_id is not None:
+            for loc in children.get(from_loc.parent_id, ()):
+                if loc.id != from_loc.id:
+                    out[loc.id] = travel_minutes(from_loc, loc)
+            if from_loc.parent_id in self.locations:
+                out[from_loc.parent_id] = INTRA_SETTLEMENT_MINUTES
+        else:
+            for loc in children.get(from_loc.id, ()):
+                out[loc.id] = INTRA_SETTLEMENT_MINUTES
+        anchor_id = from_loc.parent_id or from_loc.id
+        for other_id in links.get(anchor_id, ()):
+            other = self.locations.get(other_id)
+            if other is None or other_id == from_loc.id:
+                continue
+            out[other_id] = travel_minutes(from_loc, other)
+        return dict(sorted(out.items(), key=lambda kv: kv[1]))
+
+    def neighbours(self, loc_id):
+        """Return ``[(GraphLocation, minutes), ...]`` one hop from ``loc_id``."""
+        return [(self.locations[i], m)
+                for i, m in self.edges.get(loc_id, {}).items()]
+
+    def find_route(self, from_id, to_id):
+        """Fastest path between two locations (Dijkstra over ``edges``).
+
+        Returns ``(path, minutes)`` where ``path`` is the list of location
+        ids from ``from_id`` to ``to_id`` inclusive, or ``None`` when
+        ``to_id`` cannot be reached.
+        """
+        if from_id not in self.locations or to_id not in self.locations:
+            return None
+        best = {from_id: 0}
+        previous = {}
+        heap = [(0, from_id)]
+        while heap:
+            cost, loc_id = heapq.heappop(heap)
+            if loc_id == to_id:
+                path = [to_id]
+                while path[-1] != from_id:
+                    path.append(previous[path[-1]])
+                return list(reversed(path)), cost
+            if cost > best.get(loc_id, cost):
+                continue
+            for next_id, minutes in self.edges.get(loc_id, {}).items():
+                total = cost + minutes
+                if total < best.get(next_id, total + 1):
+                    best[next_id] = total
+                    previous[next_id] = loc_id
+                    heapq.heappush(heap, (total, next_id))
+        return None
+
+
+_graphs = SeedCache()
+
+
+def graph_for(db_session, seed_id):
+    """Return the seed's ``TravelGraph``, building it on first use."""
+    bind = bind_for(db_session)
+    graph = _graphs.get(bind, seed_id)
+    if graph is None:
+        graph = TravelGraph(
+            db_session.query(Location).filter(Location.seed_id == seed_id)
+            .order_by(Location.id).all(),
+            db_session.query(LocationConnection)
+            .filter(LocationConnection.seed_id == seed_id)
+            .order_by(LocationConnection.id).all(),
+        )
+        _graphs.set(bind, seed_id, graph)
+    return graph
+
+
+def invalidate_graph(bind, seed_id):
+    """Drop the cached graph so the next lookup re-reads the locations."""
+    _graphs.pop(bind, seed_id)
+
+
+def _destination(loc, minutes):
+    return {'id': loc.id, 'name': loc.name, 'type': loc.type,
+            'terrain': loc.terrain, 'minutes': minutes}
+
+
 def reachable_destinations(db_session, seed_id, from_loc):
     """Return the locations the character can travel to from ``from_loc``.
 
@@ -94,64 +231,35 @@ def reachable_destinations(db_session, seed_id, from_loc):
 
     Each entry is a dict with ``id``, ``name``, ``type``, ``terrain`` and
     ``minutes`` (the deterministic travel cost). Sorted by minutes so the
-    UI can render a near-to-far list without further work.
+    UI can render a near-to-far list without further work. Served from
+    the cached ``TravelGraph``; a location the graph has never seen forces
+    one rebuild.
     """
     if from_loc is None:
         return []
-    out = {}
+    graph = graph_for(db_session, seed_id)
+    if from_loc.id not in graph.locations:
+        invalidate_graph(bind_for(db_session), seed_id)
+        graph = graph_for(db_session, seed_id)
+    return [_destination(loc, minutes) for loc, minutes in graph.neighbours(from_loc.id)]
 
-    if from_loc.parent_id is not None:
-        siblings = (
-            db_session.query(Location)
-            .filter(Location.seed_id == seed_id,
-                    Location.parent_id == from_loc.parent_id,
-                    Location.id != from_loc.id)
-            .all()
-        )
-        for loc in siblings:
-            out[loc.id] = (loc, travel_minutes(from_loc, loc))
-        parent = (
-            db_session.query(Location)
-            .filter(Location.id == from_loc.parent_id).first()
-        )
-        if parent is not None:
-            out[parent.id] = (parent, INTRA_SETTLEMENT_MINUTES)
-    else:
-        # Standing at a top-level settlement -- the player can step into
-        # any of its sub-locations (shops, taverns, gates, etc.) for the
-        # flat in-settlement stroll cost.
-        children = (
-            db_session.query(Location)
-            .filter(Location.seed_id == seed_id,
-                    Location.parent_id == from_loc.id)
-            .all()
-        )
-        for loc in children:
-            out[loc.id] = (loc, INTRA_SETTLEMENT_MINUTES)
-
-    anchor_id = from_loc.parent_id or from_loc.id
-    edges = (
-        db_session.query(LocationConnection)
-        .filter(LocationConnection.seed_id == seed_id)
-        .filter((LocationConnection.from_location_id == anchor_id) |
-                (LocationConnection.to_location_id == anchor_id))
-        .all()
-    )
-    for edge in edges:
-        other_id = (edge.to_location_id if edge.from_location_id == anchor_id
-                    else edge.from_location_id)
-        if other_id == from_loc.id:
-            continue
-        loc = db_session.query(Location).filter(Location.id == other_id).first()
-        if loc is None:
-            continue
-        out[loc.id] = (loc, travel_minutes(from_loc, loc))
-
-    return [
-        {'id': loc.id, 'name': loc.name, 'type': loc.type,
-         'terrain': loc.terrain, 'minutes': minutes}
-        for loc, minutes in sorted(out.values(), key=lambda t: t[1])
-    ]
+
+def find_route(db_session, seed_id, from_loc, to_id):
+    """Fastest multi-hop route from ``from_loc`` to location ``to_id``.
+
+    Returns ``{'minutes': total, 'hops': [destination dicts]}`` where each
+    hop carries the leg's own ``minutes``, or ``None`` when no path exists.
+    """
+    if from_loc is None:
+        return None
+    graph = graph_for(db_session, seed_id)
+    found = graph.find_route(from_loc.id, to_id)
+    if found is None:
+        return None
+    path, minutes = found
+    hops = [_destination(graph.locations[b], graph.edges[a][b])
+            for a, b in zip(path, path[1:])]
+    return {'minutes': minutes, 'hops': hops}
 
 
 def resolve_current_location(db_session, seed_id, character):
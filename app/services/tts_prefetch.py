@@ -0,0 +1,136 @@
+# tts_prefetch.py
+"""Background TTS synthesis for freshly persisted narration and dialogue.
+
+Audio used to be rendered only when the browser asked ``tts_for_entry``
+for it, so the first playback of every paragraph paid the full
+ElevenLabs latency. The turn routes and world building now hand their new
+lines to ``prefetch`` as soon as they are persisted; a small worker pool
+renders them into the on-disk TTS cache so the later request is a cache
+hit.
+
+Jobs are deduplicated by the cache key (``audio_cache_key``): a line that
+is already cached or already being rendered is skipped. Each user may
+have at most ``MAX_PENDING_PER_USER`` jobs queued or running, so one busy
+campaign cannot drain the pool -- or the user's ElevenLabs quota -- ahead
+of what they will actually listen to. Like the rest of the TTS layer,
+failures are logged and swallowed.
+"""
+from __future__ import annotations
+
+import logging
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+from app.services import elevenlabs_service
+
+log = logging.getLogger(__name__)
+
+MAX_WORKERS = 2
+MAX_PENDING_PER_USER = 8
+
+_lock = threading.Lock()
+_executor = None
+# cache key -> _Job, from the moment it is queued until it has finished.
+_in_flight = {}
+_pending_per_user = Counter()
+
+
+class _Job:
+    """Progress of one queued render: ``started`` once a worker picks it
+    up, ``done`` once it finished (successfully or not)."""
+
+    __slots__ = ('started', 'done')
+
+    def __init__(self):
+        self.started = threading.Event()
+        self.done = threading.Event()
+
+
+def _pool():
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=MAX_WORKERS,
+                                           thread_name_prefix='tts-prefetch')
+        return _executor
+
+
+def prefetch(api_key, user_id, cache_dir, lines):
+    """Queue background renders for ``lines``; return how many were queued.
+
+    ``lines`` is an iterable of ``(voice_id, text)`` pairs, in the order
+    the player will hear them, so the per-user cap drops the tail rather
+    than the head.
+    """
+    if not api_key or not cache_dir:
+        return 0
+    queued = 0
+    for voice_id, text in lines:
+        if not text:
+            continue
+        voice_id = voice_id or elevenlabs_service.NARRATOR_VOICE_ID
+        key = elevenlabs_service.audio_cache_key(voice_id, text)
+        with _lock:
+            if key in _in_flight:
+                continue
+            if _pending_per_user[user_id] >= MAX_PENDING_PER_USER:
+                break
+        if elevenlabs_service.cached_audio_path(voice_id, text, cache_dir):
+            continue
+        with _lock:
+            if key in _in_flight:
+                continue
+            _in_flight[key] = _Job()
+            _pending_per_user[user_id] += 1
+        try:
+            _pool().submit(_render, api_key, user_id, key, voice_id, text, cache_dir)
+        except RuntimeError as e:
+            # Interpreter shutdown; the line is simply rendered on demand.
+            log.info("TTS prefetch could not be queued: %s", e)
+            _finish(user_id, key)
+            break
+        queued += 1
+    return queued
+
+
+def wait_for(voice_id, text, timeout):
+    """Block until a running prefetch of ``(voice_id, text)`` finishes.
+
+    Only renders a worker has already started are waited for: one still
+    queued behind other jobs could take many renders' time, and the
+    caller is better off streaming the line itself. Returns ``True`` when
+    a render was running and finished within ``timeout`` (the caller
+    should re-check the cache), ``False`` when there was nothing to wait
+    for or it took too long.
+    """
+    key = elevenlabs_service.audio_cache_key(
+        voice_id or elevenlabs_service.NARRATOR_VOICE_ID, text)
+    with _lock:
+        job = _in_flight.get(key)
+    if job is None or not job.started.is_set():
+        return False
+    return job.done.wait(timeout)
+
+
+def _render(api_key, user_id, key, voice_id, text, cache_dir):
+    with _lock:
+        job = _in_flight.get(key)
+    if job is not None:
+        job.started.set()
+    try:
+        elevenlabs_service.synthesize(api_key, voice_id, text, cache_dir=cache_dir)
+    except Exception as e:
+        log.info("TTS prefetch failed: %s", e)
+    finally:
+        _finish(user_id, key)
+
+
+def _finish(user_id, key):
+    with _lock:
+        job = _in_flight.pop(key, None)
+        _pending_per_user[user_id] -= 1
+        if _pending_per_user[user_id] <= 0:
+            del _pending_per_user[user_id]
+    if job is not None:
+        job.done.set()
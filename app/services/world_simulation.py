@@ -64,23 +64,42 @@ def maybe_simulate(db_session, seed_id, gpt_service, *, context,
     Always swallows exceptions: the caller doesn't need to wrap this in
     a try.
     """
+    seed, call = simulation_call(db_session, seed_id, context=context)
+    if call is None:
+        return [], []
+    try:
+        payload = gpt_service.get_structured(**call)
+    except Exception as e:
+        log.warning("world_simulation: LLM call failed on seed %s: %s", seed_id, e)
+        payload = None
+    return apply_simulation(db_session, seed_id, seed, payload,
+                            session_factory=session_factory)
+
+
+def simulation_call(db_session, seed_id, *, context):
+    """Return ``(seed, call)``: the tick's ``get_structured`` keyword
+    arguments, or ``call=None`` when no tick is due.
+
+    Split from ``maybe_simulate`` so the turn routes can send the prompt
+    alongside their other LLM calls and hand the result to
+    ``apply_simulation``.
+    """
     from app.orm import Seed  # local import to avoid circular at module load
     seed = db_session.query(Seed).filter(Seed.id == seed_id).first()
     if not should_simulate(seed):
-        return [], []
-
+        return seed, None
     try:
         prompt = BACKGROUND_EVENTS.format(**context)
-        payload = gpt_service.get_structured(
-            prompt, BackgroundEventsOut,
-            max_attempts=2, temperature=0.9,
-        )
     except Exception as e:
-        log.warning("world_simulation: LLM call failed on seed %s: %s", seed_id, e)
-        seed.last_event_sim_at = seed.current_date_time
-        db_session.commit()
-        return [], []
+        log.warning("world_simulation: could not build prompt on seed %s: %s", seed_id, e)
+        return seed, None
+    return seed, {'prompt': prompt, 'schema': BackgroundEventsOut,
+                  'max_attempts': 2, 'temperature': 0.9}
+
 
+def apply_simulation(db_session, seed_id, seed, payload, *, session_factory=None):
+    """Persist a tick's ``BackgroundEventsOut`` (``None`` when the call
+    failed) and mark the tick done; return ``(events, entry_dicts)``."""
     if payload is None:
         seed.last_event_sim_at = seed.current_date_time
         db_session.commit()
@@ -120,7 +139,11 @@ def _persist_events(db_session, seed_id, seed, events, *, session_factory):
         .all()
     }
     persisted = []
-    entry_dicts = []
+    # News lines share one transcript write instead of one per event.
+    batch = None
+    if session_factory is not None:
+        batch = transcript_service.TranscriptBatch(
+            session_factory, seed_id, turn=seed.current_turn)
     for draft in events:
         loc = locations_by_name.get((draft.location_name or '').strip().lower())
         if loc is None:
@@ -144,22 +167,14 @@ def _persist_events(db_session, seed_id, seed, events, *, session_factory):
                 role='participant',
             ))
         persisted.append(ev)
-        if session_factory is not None:
+        if batch is not None:
             text = f"[News from afar] {ev.name} at {loc.name}: {ev.description}"
-            entry = transcript_service.add_entry(
-                session_factory, seed_id,
+            batch.add(
                 transcript_service.KIND_SYSTEM, text,
-                turn=seed.current_turn,
                 meta={'kind': 'background_event', 'event_id': ev.id,
                       'location_id': loc.id, 'event_type': ev.type},
             )
-            if entry is not None:
-                entry_dicts.append({
-                    'id': entry.id,
-                    'kind': transcript_service.KIND_SYSTEM,
-                    'speaker': None,
-                    'text': text,
-                })
+    entry_dicts = batch.flush() if batch is not None else []
     return persisted, entry_dicts
 
 
@@ -7,15 +7,20 @@ Two responsibilities:
      already-existing tables). Safe on every restart.
 
   2. ``maybe_seed_name_library_async`` — if the ``NameLibrary`` table is
-     empty, kick off a background thread that populates it from the
-     procedural sources. Runs at most once per fresh deploy; never blocks
-     app startup; failures are logged and otherwise ignored.
+     empty, or an earlier seed run stopped part-way, kick off a background
+     thread that populates it: from the pre-built snapshot when one is
+     shipped (see ``scripts/name_library_snapshot``), otherwise from the
+     procedural sources, resuming from the seeder's checkpoints either
+     way. Never blocks app startup; failures are logged and otherwise
+     ignored.
 
 Both can be disabled via environment variable for ops who want to manage
 schema and data manually:
 
   AUTO_MIGRATE=0     skip ensure_schema_extras
   AUTO_SEED_NAMES=0  skip background seeding
+  NAME_LIBRARY_SNAPSHOT=path  snapshot file to load (default
+                     data/name_library.snapshot.json.gz, if present)
 """
 from __future__ import annotations
 
@@ -23,9 +28,9 @@ import logging
 import os
 import threading
 
-from sqlalchemy import inspect, text
+from sqlalchemy import inspect, or_, text
 
-from app.orm import NameLibrary, Seed
+from app.orm import NameLibrary, NameLibrarySeedProgress, Seed
 
 log = logging.getLogger(__name__)
 
@@ -35,6 +40,7 @@ def run_startup_tasks(engine, session_factory):
     if os.getenv("AUTO_MIGRATE", "1") != "0":
         ensure_schema_extras(engine)
         ensure_table_column_extras(engine)
+        ensure_table_index_extras(engine)
         rename_columns(engine)
         drop_retired_columns(engine)
     if os.getenv("AUTO_SEED_NAMES", "1") != "0":
@@ -72,6 +78,37 @@ _EXPECTED_TABLE_COLUMNS = {
     },
 }
 
+# Unique indexes added to existing tables, keyed by table then index name.
+# Each entry is ``(dedupe_sql, create_sql)``: rows that would violate the
+# index are removed first (keeping the oldest), since ``create_all`` only
+# declares the constraint on fresh tables. The derived table in the
+# DELETE keeps MySQL from rejecting a subquery on the target table.
+_EXPECTED_UNIQUE_INDEXES = {
+    "NameLibrary": {
+        "uq_namelibrary_entry": (
+            "DELETE FROM NameLibrary WHERE id NOT IN ("
+            "SELECT id FROM (SELECT MIN(id) AS id FROM NameLibrary "
+            "GROUP BY source, theme, gender, category, name) AS keep_rows)",
+            "CREATE UNIQUE INDEX uq_namelibrary_entry "
+            "ON NameLibrary (source, theme, gender, category, name)",
+        ),
+    },
+}
+
+# Columns the unique indexes above compare byte for byte. MySQL's default
+# collations are case- and accent-insensitive, so without this the dedupe
+# would delete "ael" as a duplicate of "Ael". Applied (MySQL only) before
+# the indexes, keyed by table then column: ``(collation, ddl)``.
+_BINARY_COLLATION_COLUMNS = {
+    "NameLibrary": {
+        "name": (
+            "utf8mb4_bin",
+            "ALTER TABLE NameLibrary MODIFY name VARCHAR(128) "
+            "CHARACTER SET utf8mb4 COLLATE utf8mb4_bin NOT NULL",
+        ),
+    },
+}
+
 # Columns that have been removed from the ORM and should be dropped from
 # pre-existing databases. Keyed by table; each entry maps the dropped
 # column name to the DDL used to remove it. SQLite >= 3.35 and MySQL both
@@ -150,6 +187,69 @@ def ensure_table_column_extras(engine):
                         )
 
 
+def _index_names(engine, table):
+    inspector = inspect(engine)
+    return ({i["name"] for i in inspector.get_indexes(table)}
+            | {c["name"] for c in inspector.get_unique_constraints(table)})
+
+
+def ensure_binary_collations(engine):
+    """Switch the columns in ``_BINARY_COLLATION_COLUMNS`` to their binary
+    collation on MySQL. Idempotent; a no-op on other dialects."""
+    if engine.dialect.name not in ("mysql", "mariadb"):
+        return
+    for table, columns in _BINARY_COLLATION_COLUMNS.items():
+        for column, (collation, ddl) in columns.items():
+            try:
+                with engine.begin() as conn:
+                    current = conn.execute(text(
+                        "SELECT COLLATION_NAME FROM information_schema.COLUMNS "
+                        "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table "
+                        "AND COLUMN_NAME = :column"),
+                        {"table": table, "column": column}).scalar()
+                    if current is None or current == collation:
+                        continue
+                    conn.execute(text(ddl))
+                log.info("ensure_binary_collations: %s.%s now uses %s",
+                         table, column, collation)
+            except Exception as e:
+                log.error("ensure_binary_collations: failed to convert %s.%s: %s",
+                          table, column, e)
+
+
+def ensure_table_index_extras(engine):
+    """Add unique indexes that ``create_all`` skips on existing tables."""
+    # Collations first: the dedupe below must compare the way the index will.
+    ensure_binary_collations(engine)
+    for table, indexes in _EXPECTED_UNIQUE_INDEXES.items():
+        try:
+            existing = _index_names(engine, table)
+        except Exception as e:
+            log.warning("ensure_table_index_extras: could not inspect %s: %s",
+                        table, e)
+            continue
+
+        for index, (dedupe_sql, create_sql) in indexes.items():
+            if index in existing:
+                continue
+            try:
+                with engine.begin() as conn:
+                    removed = conn.execute(text(dedupe_sql)).rowcount
+                    conn.execute(text(create_sql))
+                log.info("ensure_table_index_extras: added %s.%s (removed %s "
+                         "duplicate rows)", table, index, removed)
+            except Exception as e:
+                # Most often a parallel migration got there first; only
+                # report it if the index is really missing.
+                try:
+                    refreshed = _index_names(engine, table)
+                except Exception:
+                    refreshed = set()
+                if index not in refreshed:
+                    log.error("ensure_table_index_extras: failed to add %s.%s: %s",
+                              table, index, e)
+
+
 def rename_columns(engine):
     """Rename columns whose ORM name has changed, where the old name is
     still present and the new name is not. Idempotent; safe on every
@@ -206,24 +306,26 @@ def drop_retired_columns(engine):
 # Background NameLibrary seed                                            #
 # --------------------------------------------------------------------- #
 def maybe_seed_name_library_async(session_factory):
-    """Spawn a daemon thread that seeds NameLibrary if it's empty."""
+    """Spawn a daemon thread that seeds NameLibrary if it's empty or unfinished."""
     def _worker():
         try:
             session = session_factory()
             try:
                 count = session.query(NameLibrary).count()
+                unfinished = name_library_seed_unfinished(session)
             finally:
                 session.close()
-            if count > 0:
+            if count > 0 and not unfinished:
                 log.info("NameLibrary already populated (%d rows); skipping seed.",
                          count)
                 return
 
-            log.info("NameLibrary is empty; running background seed...")
-            # Lazy import to avoid pulling in optional packages at app boot.
-            from scripts.seed_name_library import main as seed_main
-            argv = _default_seed_argv()
-            seed_main(argv)
+            if count:
+                log.info("NameLibrary seed was interrupted (%s unfinished); "
+                         "resuming in the background...", ", ".join(unfinished))
+            else:
+                log.info("NameLibrary is empty; running background seed...")
+            seed_name_library(session_factory)
             log.info("Background NameLibrary seed complete.")
         except Exception as e:
             log.exception("Background NameLibrary seed failed: %s", e)
@@ -232,6 +334,60 @@ def maybe_seed_name_library_async(session_factory):
     t.start()
 
 
+def seed_name_library(session_factory):
+    """Fill NameLibrary from the snapshot file if there is one, else generate it.
+
+    Used by the startup thread and ``scripts/app_setup``. Both paths resume
+    from the seeder's checkpoints.
+    """
+    # Lazy imports to avoid pulling in optional packages at app boot.
+    from app.services.name_service import bump_library_version
+    from scripts.name_library_snapshot import load_snapshot, snapshot_path
+
+    try:
+        snapshot = snapshot_path()
+        if snapshot is not None:
+            log.info("Loading NameLibrary snapshot %s...", snapshot)
+            added = load_snapshot(session_factory, snapshot)
+            log.info("Loaded %d NameLibrary rows from the snapshot.", added)
+            return
+        from scripts.seed_name_library import main as seed_main
+        argv = _default_seed_argv()
+        log.info("Running seed_name_library with argv=%s", argv)
+        seed_main(argv)
+    finally:
+        # The seeder bumps as each source finishes; bump once more so
+        # a run that died mid-source still invalidates the catalog.
+        bump_library_version()
+
+
+def name_library_seed_unfinished(session):
+    """Default seed sources (or a snapshot load) a previous run did not finish."""
+    from scripts.name_library_snapshot import SNAPSHOT_SOURCE_PREFIX
+
+    try:
+        rows = (session.query(NameLibrarySeedProgress.source)
+                .filter(NameLibrarySeedProgress.completed.is_(False),
+                        or_(NameLibrarySeedProgress.source.in_(_default_seed_sources()),
+                            NameLibrarySeedProgress.source.like(
+                                SNAPSHOT_SOURCE_PREFIX + "%")))
+                .order_by(NameLibrarySeedProgress.source)
+                .all())
+    except Exception as e:
+        # Checkpoint table not created yet: nothing to resume.
+        log.info("Could not read NameLibrary seed progress: %s", e)
+        session.rollback()
+        return []
+    return [source for source, in rows]
+
+
+def _default_seed_sources():
+    sources = ["fantasynames", "pynames", "nomina"]
+    if os.getenv("SEED_INCLUDE_BABYNAMES", "0") == "1":
+        sources.append("babynames")
+    return sources
+
+
 def _default_seed_argv():
     """Conservative defaults for an in-process startup seed.
 
@@ -241,7 +397,4 @@ def _default_seed_argv():
     manually.
     """
     per_theme = os.getenv("SEED_PER_THEME", "200")
-    sources = ["fantasynames", "pynames", "nomina"]
-    if os.getenv("SEED_INCLUDE_BABYNAMES", "0") == "1":
-        sources.append("babynames")
-    return ["--only", *sources, "--per-theme", per_theme]
+    return ["--only", *_default_seed_sources(), "--per-theme", per_theme]
@@ -14,9 +14,15 @@ let narrativeTemplate;
 // canonical in-memory copy (chronological), narrativeVisibleCount is the
 // number of most-recent entries currently mounted in #narrativeList. A
 // "Show More" button at the top reveals the next older page on demand.
+// The world payload only carries the latest window of the transcript;
+// narrativeHasOlder says whether the server holds entries older than
+// narrativeEntries[0], which are fetched page by page as the player
+// scrolls up.
 const NARRATIVE_PAGE_SIZE = 25;
 let narrativeEntries = [];
 let narrativeVisibleCount = 0;
+let narrativeHasOlder = false;
+let narrativeLoadingOlder = false;
 
 // HTML-escape arbitrary values before interpolating them into a string of
 // markup. Uses the standard jQuery text-then-html idiom so callers can keep
@@ -1336,7 +1342,7 @@ $(document).ready(function () {
                 // story the user saw originally, with per-kind styling intact.
                 // Long histories are paginated: only the most recent page is
                 // mounted, with a "Show More" button revealing older entries.
-                renderNarrativeTranscript(world.transcript || []);
+                renderNarrativeTranscript(world.transcript || [], !!world.transcript_has_more);
                 Object.entries(ENTITY_RENDER_MAP).forEach(([key, cfg]) => {
                     const items = world[key] || [];
                     const filtered = cfg.filter ? items.filter(cfg.filter) : items;
@@ -1439,6 +1445,66 @@ $(document).ready(function () {
         refreshActionPanels();
     }
 
+    // Read a fetch() Response carrying Server-Sent Events and hand each
+    // decoded ``data:`` payload to ``onEvent``. Resolves once the stream
+    // closes.
+    function readEventStream(response, onEvent) {
+        const reader = response.body.getReader();
+        const decoder = new TextDecoder();
+        let buffer = '';
+
+        function dispatch(message) {
+            if (message.trim() === '' || message.startsWith(':')) return;
+            let data = '';
+            message.split('\n').forEach(line => {
+                if (line.startsWith('data: ')) data = line.substring(6);
+            });
+            if (!data) return;
+            try {
+                onEvent(JSON.parse(data));
+            } catch (e) {
+                console.error('Failed to handle SSE message:', e, data);
+            }
+        }
+
+        function pump() {
+            return reader.read().then(({ done, value }) => {
+                if (done) {
+                    if (buffer) dispatch(buffer);
+                    return;
+                }
+                buffer += decoder.decode(value, { stream: true });
+                const messages = buffer.split('\n\n');
+                buffer = messages.pop();
+                messages.forEach(dispatch);
+                return pump();
+            });
+        }
+        return pump();
+    }
+
+    // Collect a deferred turn's follow-up: off-screen news lands in the
+    // transcript and the refreshed suggestions replace the loading label.
+    function consumeTurnFollowup(followup) {
+        let gotSuggestions = false;
+        return fetch(followup.url, { headers: { 'X-CSRF-Token': getCsrfToken() } })
+            .then(response => {
+                if (!response.ok) throw new Error('Failed to load turn follow-up');
+                return readEventStream(response, event => {
+                    if (event.type === 'entries') {
+                        (event.entries || []).forEach(entry => updateNarrativeList(entry));
+                    } else if (event.type === 'suggestions') {
+                        gotSuggestions = true;
+                        if (!isScenarioActive()) renderSuggestions(event.suggestions || []);
+                    }
+                });
+            })
+            .catch(error => console.error('Turn follow-up failed:', error))
+            .finally(() => {
+                if (!gotSuggestions && !isScenarioActive()) renderSuggestions([]);
+            });
+    }
+
     // Submit the player's action to the backend, optimistically reflect it
     // in the transcript panel, then append the narrator's reply and refresh
     // suggestions. Disables the input controls for the duration so the
@@ -1476,11 +1542,36 @@ $(document).ready(function () {
         _activePanel = 'suggestions';
         refreshActionPanels();
 
+        const finish = function () {
+            $input.prop('disabled', false);
+            $submit.prop('disabled', false).text('Submit');
+            $input.trigger('focus');
+        };
+        const fail = function (body) {
+            $error.text(body?.message || 'Failed to advance the story.');
+            // A 409 from /turn carries the active scenario so the panel
+            // can resync if local state had drifted out of sync.
+            if (body?.scenario) {
+                mountScenario(body.scenario);
+            } else {
+                renderSuggestions([]);
+            }
+        };
+
+        // Stream the turn when the browser can read a response body
+        // incrementally, so narration appears while it is being written.
+        if (window.ReadableStream && window.TextDecoder) {
+            streamGameTurn(seedId, action, fail).finally(finish);
+            return;
+        }
+
         $.ajax({
             url: `/api/seed/${seedId}/turn`,
             type: 'POST',
             contentType: 'application/json',
-            data: JSON.stringify({ action: action }),
+            // The turn comes back as soon as the narration is persisted;
+            // news + suggestions follow over the follow-up stream.
+            data: JSON.stringify({ action: action, defer_followup: true }),
             success: function (response) {
                 // The turn returns an ordered list of new transcript entries
                 // (narration first, then per-character dialogue lines), each
@@ -1497,42 +1588,123 @@ $(document).ready(function () {
                         speaker: 'Narrator',
                     });
                 }
-                // Pull a fresh world payload whenever the LLM introduced new
-                // characters this turn so the NPC accordion reflects them
-                // (and TTS for their voice id is wired up on next playback).
-                if (Array.isArray(response.new_characters) && response.new_characters.length) {
-                    loadWorldData(seedId);
-                }
-                // The narrator may have handed off to a structured scenario
-                // this turn. Mounting hides the free-text input + suggestions
-                // so the player drives the scenario from its own panel.
-                if (response.scenario) {
-                    mountScenario(response.scenario);
-                }
-                if (response.clock) {
-                    renderClock(response.clock);
-                }
-                if (!isScenarioActive()) {
+                applyTurnState(seedId, response);
+                if (response.followup) {
+                    consumeTurnFollowup(response.followup);
+                } else if (!isScenarioActive()) {
                     renderSuggestions(response.suggestions || []);
                 }
                 $input.val('');
             },
             error: function (xhr) {
-                const msg = xhr.responseJSON?.message || 'Failed to advance the story.';
-                $error.text(msg);
-                // A 409 from /turn carries the active scenario so the panel
-                // can resync if local state had drifted out of sync.
-                if (xhr.responseJSON?.scenario) {
-                    mountScenario(xhr.responseJSON.scenario);
+                fail(xhr.responseJSON);
+            },
+            complete: finish
+        });
+    }
+
+    // Apply the non-transcript parts of a finished turn: refresh the world
+    // payload when new characters appeared, mount a scenario the narrator
+    // handed off to, and tick the clock.
+    function applyTurnState(seedId, turn) {
+        // Pull a fresh world payload whenever the LLM introduced new
+        // characters this turn so the NPC accordion reflects them
+        // (and TTS for their voice id is wired up on next playback).
+        if (Array.isArray(turn.new_characters) && turn.new_characters.length) {
+            loadWorldData(seedId);
+        }
+        // The narrator may have handed off to a structured scenario
+        // this turn. Mounting hides the free-text input + suggestions
+        // so the player drives the scenario from its own panel.
+        if (turn.scenario) {
+            mountScenario(turn.scenario);
+        }
+        if (turn.clock) {
+            renderClock(turn.clock);
+        }
+    }
+
+    // Drive a turn through /turn/stream. Narration deltas are typed into a
+    // draft line that each persisted paragraph entry replaces, so TTS and
+    // replay still work off real transcript ids.
+    function streamGameTurn(seedId, action, fail) {
+        let $draft = null;
+        let draftText = '';
+        let gotSuggestions = false;
+        let failed = false;
+
+        function renderDraft() {
+            if (!draftText.trim()) {
+                if ($draft) $draft.remove();
+                $draft = null;
+                return;
+            }
+            if (!$draft) {
+                $draft = $('<li class="nav-item narrative-narration narrative-draft"></li>');
+                $('#narrativeList').append($draft);
+            }
+            $draft.text(draftText);
+            if (isNarrativeAtBottom()) scrollNarrativeToBottom();
+        }
+
+        function onEvent(event) {
+            if (event.type === 'narration_delta') {
+                draftText += event.text;
+                renderDraft();
+            } else if (event.type === 'entry') {
+                const entry = event.entry;
+                if (entry.kind === 'narration') {
+                    const at = draftText.indexOf(entry.text);
+                    draftText = at >= 0
+                        ? draftText.slice(at + entry.text.length).replace(/^\s+/, '')
+                        : '';
+                    if ($draft) $draft.remove();
+                    $draft = null;
+                    updateNarrativeList(entry);
+                    renderDraft();
                 } else {
-                    renderSuggestions([]);
+                    updateNarrativeList(entry);
                 }
+            } else if (event.type === 'turn') {
+                draftText = '';
+                renderDraft();
+                applyTurnState(seedId, event);
+                $('#game-input').val('');
+            } else if (event.type === 'entries') {
+                (event.entries || []).forEach(entry => updateNarrativeList(entry));
+            } else if (event.type === 'suggestions') {
+                gotSuggestions = true;
+                if (!isScenarioActive()) renderSuggestions(event.suggestions || []);
+            } else if (event.type === 'error') {
+                failed = true;
+                draftText = '';
+                renderDraft();
+                fail(event);
+            }
+        }
+
+        return fetch(`/api/seed/${seedId}/turn/stream`, {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+                'X-CSRF-Token': getCsrfToken()
             },
-            complete: function () {
-                $input.prop('disabled', false);
-                $submit.prop('disabled', false).text('Submit');
-                $input.trigger('focus');
+            body: JSON.stringify({ action: action })
+        })
+        .then(response => {
+            if (!response.ok) {
+                failed = true;
+                return response.json().catch(() => ({})).then(fail);
             }
+            return readEventStream(response, onEvent);
+        })
+        .catch(error => {
+            console.error('Turn stream failed:', error);
+            failed = true;
+            fail({});
+        })
+        .finally(() => {
+            if (!failed && !gotSuggestions && !isScenarioActive()) renderSuggestions([]);
         });
     }
 
@@ -1903,15 +2075,18 @@ $(document).ready(function () {
         }
     }
 
-    // Replace the buffer with a full transcript and render only the most
-    // recent NARRATIVE_PAGE_SIZE entries. Older entries stay in memory and
-    // become visible one page at a time via the "Show More" button.
-    function renderNarrativeTranscript(entries) {
+    // Replace the buffer with the latest transcript window and render only
+    // the most recent NARRATIVE_PAGE_SIZE entries. Older entries stay in
+    // memory and become visible one page at a time via the "Show More"
+    // button; once those run out, ``hasOlder`` pages are fetched from the
+    // server.
+    function renderNarrativeTranscript(entries, hasOlder) {
         if (!narrativeTemplate) {
             console.error('Narrative item template not loaded');
             return;
         }
         narrativeEntries = (entries || []).map(normaliseNarrativeEntry);
+        narrativeHasOlder = !!hasOlder;
         narrativeVisibleCount = Math.min(narrativeEntries.length, NARRATIVE_PAGE_SIZE);
         const $list = $('#narrativeList');
         $list.empty();
@@ -1938,13 +2113,16 @@ $(document).ready(function () {
         const $list = $('#narrativeList');
         $list.find('.narrative-show-more').remove();
         const hidden = narrativeEntries.length - narrativeVisibleCount;
-        if (hidden <= 0) return;
+        if (hidden <= 0 && !narrativeHasOlder) return;
         const next = Math.min(NARRATIVE_PAGE_SIZE, hidden);
+        const label = hidden > 0
+            ? `Show ${next} more (${hidden} hidden)`
+            : 'Show older entries';
         const $li = $('<li>').addClass('nav-item narrative-show-more');
         const $btn = $('<button>')
             .attr('type', 'button')
             .addClass('btn btn-link narrative-show-more-btn')
-            .text(`Show ${next} more (${hidden} hidden)`)
+            .text(label)
             .on('click', showMoreNarrativeEntries);
         $li.append($btn);
         $list.prepend($li);
@@ -1955,7 +2133,10 @@ $(document).ready(function () {
     // afterwards so prepended history doesn't shove the current text out of
     // sight.
     function showMoreNarrativeEntries() {
-        if (narrativeVisibleCount >= narrativeEntries.length) return;
+        if (narrativeVisibleCount >= narrativeEntries.length) {
+            loadOlderNarrativeEntries();
+            return;
+        }
         const additional = Math.min(
             NARRATIVE_PAGE_SIZE,
             narrativeEntries.length - narrativeVisibleCount,
@@ -1983,6 +2164,46 @@ $(document).ready(function () {
         }
     }
 
+    // Fetch the page of transcript entries just older than the oldest one in
+    // memory, then reveal it through the normal "Show More" path so the
+    // viewport anchoring logic stays in one place.
+    function loadOlderNarrativeEntries() {
+        const seedId = getLocalStorageItem('current-seed-id');
+        const oldest = narrativeEntries.find(e => e.id != null);
+        if (!seedId || !oldest || !narrativeHasOlder || narrativeLoadingOlder) return;
+        narrativeLoadingOlder = true;
+        $.ajax({
+            url: `/api/seed/${seedId}/transcript`,
+            type: 'GET',
+            data: { before_id: oldest.id, limit: NARRATIVE_PAGE_SIZE },
+            success: function (page) {
+                const older = (page.entries || []).map(normaliseNarrativeEntry);
+                narrativeEntries = older.concat(narrativeEntries);
+                narrativeHasOlder = !!page.has_more;
+                if (older.length) {
+                    showMoreNarrativeEntries();
+                } else {
+                    refreshNarrativeShowMoreButton();
+                }
+            },
+            error: function () {
+                console.error('Failed to load older transcript entries');
+            },
+            complete: function () {
+                narrativeLoadingOlder = false;
+            }
+        });
+    }
+
+    // Reaching the top of the transcript pulls in the next older page.
+    const NARRATIVE_TOP_THRESHOLD_PX = 48;
+    $('#game-output').on('scroll', function () {
+        if (this.scrollTop > NARRATIVE_TOP_THRESHOLD_PX) return;
+        if (narrativeVisibleCount < narrativeEntries.length || narrativeHasOlder) {
+            showMoreNarrativeEntries();
+        }
+    });
+
     // === Header auto-collapse on hover leave ===
     // On mouseenter: cancel any pending collapse and restore the header.
     // On mouseleave: wait an exponentially growing delay (based on dwell time,
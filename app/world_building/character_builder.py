@@ -1,5 +1,5 @@
 # character_builder.py
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
 from datetime import datetime, timedelta
 import json
 import random
@@ -10,7 +10,8 @@ from app.orm import (
     Event, EventCharacter, CharacterRelationship, Item, CharacterItem, Seed,
 )
 from app.prompt_templates import WORLD_BUILDING
-from app.services import elevenlabs_service
+from app.services import character_index, elevenlabs_service
+from app.services.seed_cache import bind_for
 from app.world_building.schemas import (
     EventOut, MainCharacterOut, MainCharacterItemsOut, NPCListOut, RelationshipOut,
 )
@@ -34,6 +35,8 @@ class CharacterBuilder:
         # falls back to the narrator voice at playback time.
         self.elevenlabs_api_key = elevenlabs_api_key
         self.progress_callback = progress_callback or (lambda msg, status='info': None)
+        # Persisted NPCs as ``{'id', 'name', 'location_id'}`` dicts.
+        self.NPCs_data = []
 
     def _pick_voice_id(self, *, gender, date_of_birth, race, search_text=None):
         """Resolve a voice id for a character, or None if EL is unavailable."""
@@ -62,7 +65,8 @@ class CharacterBuilder:
         themes = self.name_service.get_themes_for_seed(self.seed_id)
         if not themes:
             return None
-        return self.name_service.random_name(themes, gender=gender, category=category)
+        return self.name_service.random_name(themes, gender=gender, category=category,
+                                             seed_id=self.seed_id)
 
     @staticmethod
     def _seed_data_name(seed_data):
@@ -90,15 +94,35 @@ class CharacterBuilder:
         """Detect a user-provided main-character name on the incoming seed."""
         return cls._seed_data_name(seed_data) is not None
 
+    # Each world-build phase is split into a ``fetch_*`` step (LLM / HTTP
+    # only, safe to run on a worker thread) and a ``persist_*`` step that
+    # writes through ``self.session`` on the orchestrating thread. The
+    # ``create_*`` methods chain the two for callers that run phases one
+    # at a time.
+
     def create_main_character(self):
         """Single batched call: core stats + skills + statuses in one LLM round-trip."""
+        return self.persist_main_character(self.fetch_main_character())
+
+    def fetch_main_character(self):
+        """LLM + voice search for the protagonist; returns ``(payload, voice_id)``."""
         payload = self.gpt_service.get_structured(
             WORLD_BUILDING['MAIN_CHARACTER_BATCH'].format(self.seed_data),
             MainCharacterOut,
             max_attempts=3,
             temperature=1.1,
         )
+        if payload is None:
+            return None, None
+        voice_id = self._pick_voice_id(
+            gender=payload.gender,
+            date_of_birth=payload.date_of_birth,
+            race=payload.race,
+        )
+        return payload, voice_id
 
+    def persist_main_character(self, fetched):
+        payload, voice_id = fetched or (None, None)
         if payload is None:
             print("No valid JSON data was extracted.")
             return {"message": "Failed to create main character due to invalid data",
@@ -119,12 +143,6 @@ class CharacterBuilder:
                 if seeded:
                     name = seeded
 
-            voice_id = self._pick_voice_id(
-                gender=payload.gender,
-                date_of_birth=payload.date_of_birth,
-                race=payload.race,
-            )
-
             new_character = Character(
                 seed_id=self.seed_id,
                 main_character=1,
@@ -174,10 +192,13 @@ class CharacterBuilder:
                     updated_at=datetime.now(),
                 ))
 
+            mc_ref = character_index.CharacterRef(new_character.id, name, voice_id)
             self.session.commit()
+            character_index.note_character_added(
+                bind_for(self.session), self.seed_id, mc_ref)
 
             self.character_data = {
-                'id': new_character.id,
+                'id': mc_ref.id,
                 'name': name,
                 'race': payload.race,
                 'gender': payload.gender,
@@ -213,19 +234,26 @@ class CharacterBuilder:
         capped value/weight so a fresh run never opens with overpowered gear.
         Failures here are non-fatal: the MC simply starts empty-handed.
         """
-        mc_payload = getattr(self, 'character_data', None) or {}
-        mc_id = mc_payload.get('id')
-        if not mc_id:
-            return {"message": "Main character not created; skipping starter items.",
-                    "status": "skipped"}
+        return self.persist_main_character_items(self.fetch_main_character_items())
 
-        payload = self.gpt_service.get_structured(
+    def fetch_main_character_items(self):
+        mc_payload = getattr(self, 'character_data', None) or {}
+        if not mc_payload.get('id'):
+            return None
+        return self.gpt_service.get_structured(
             WORLD_BUILDING['MAIN_CHARACTER_ITEMS_BATCH'].format(
                 character=mc_payload, seed_data=self.seed_data),
             MainCharacterItemsOut,
             max_attempts=2,
             temperature=0.9,
         )
+
+    def persist_main_character_items(self, payload):
+        mc_payload = getattr(self, 'character_data', None) or {}
+        mc_id = mc_payload.get('id')
+        if not mc_id:
+            return {"message": "Main character not created; skipping starter items.",
+                    "status": "skipped"}
         if payload is None or not payload.items:
             return {"message": "No starter items generated.", "status": "success"}
 
@@ -268,52 +296,93 @@ class CharacterBuilder:
 
         Each location triggers ONE batched LLM call that returns the NPC core
         data plus event, skills, statuses, and items. Workers only do LLM
-        work; database writes happen on the orchestrating thread.
+        and voice-search work; each location's NPCs are written on the
+        orchestrating thread as soon as that location is ready, so the
+        first settlement is populated while the rest are still generating.
+        """
+        self.NPCs_data = []
+        self.stream_npc_batches(self.persist_npc_batch)
+        return self.finish_surrounding_characters()
+
+    def stream_npc_batches(self, on_batch, voices_after=None):
+        """Fetch NPCs per location and hand each location over as it completes.
+
+        Every location's LLM call runs on one pool; when a location's NPCs
+        arrive, their voice searches are submitted to a second pool so they
+        never queue behind the remaining LLM calls. Once a location's last
+        voice lookup finishes, ``on_batch(location, npcs, voice_ids)`` is
+        called on the calling thread. Locations come back in completion
+        order, not declaration order.
+
+        ``voices_after`` is an optional ``threading.Event`` the voice
+        searches wait for: they age NPCs against the main character's
+        clock, which may still be being written when the LLM calls start.
         """
+        if not getattr(self, 'locations', None):
+            return
+
+        drafts = {}
+        voice_ids = {}
+        outstanding = {}
+        with ThreadPoolExecutor(max_workers=self._MAX_WORKERS) as llm_pool, \
+                ThreadPoolExecutor(max_workers=self._MAX_WORKERS) as voice_pool:
+            running = {
+                llm_pool.submit(self._fetch_npcs_for_location, loc): (loc, None)
+                for loc in self.locations
+            }
+            while running:
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    loc, idx = running.pop(future)
+                    key = loc['id']
+                    if idx is None:
+                        try:
+                            npcs = future.result() or []
+                        except Exception as e:
+                            print(f"NPC fetch failed for location {loc.get('name')}: {e}")
+                            npcs = []
+                        if not npcs or not self.elevenlabs_api_key:
+                            on_batch(loc, npcs, [None] * len(npcs))
+                            continue
+                        if voices_after is not None:
+                            voices_after.wait()
+                        drafts[key] = npcs
+                        voice_ids[key] = [None] * len(npcs)
+                        outstanding[key] = len(npcs)
+                        for i, npc in enumerate(npcs):
+                            running[voice_pool.submit(self._pick_npc_voice_id, npc)] = (loc, i)
+                        continue
+
+                    try:
+                        voice_ids[key][idx] = future.result()
+                    except Exception as e:
+                        print(f'NPC voice search failed: {e}')
+                    outstanding[key] -= 1
+                    if outstanding[key] == 0:
+                        del outstanding[key]
+                        on_batch(loc, drafts.pop(key), voice_ids.pop(key))
+
+    def persist_npc_batch(self, location, npcs, voice_ids):
+        """Write one location's NPCs in a single transaction and report it."""
+        persisted = self._persist_npcs([(location, npc) for npc in npcs], voice_ids)
+        self.NPCs_data.extend(persisted)
+        if persisted:
+            self.progress_callback(
+                f"Populated {location.get('name')} with {len(persisted)} characters.")
+        return persisted
+
+    def finish_surrounding_characters(self):
+        """Restore location order on ``NPCs_data`` once every batch is in."""
         if not getattr(self, 'locations', None):
             self.NPCs_data = []
             return {"message": "No locations available; nothing to populate.",
                     "status": "success"}
 
-        npcs_per_location = {}
-        with ThreadPoolExecutor(max_workers=self._MAX_WORKERS) as pool:
-            futures = {
-                pool.submit(self._fetch_npcs_for_location, loc): loc
-                for loc in self.locations
-            }
-            for future in as_completed(futures):
-                loc = futures[future]
-                try:
-                    npcs_per_location[loc['id']] = future.result() or []
-                except Exception as e:
-                    print(f"NPC fetch failed for location {loc.get('name')}: {e}")
-                    npcs_per_location[loc['id']] = []
-
-        # Flatten the per-location buckets so the voice-search pass can run
-        # one future per NPC across the whole world. Persistence is done on
-        # this thread (SQLAlchemy session is not safe to share), but voice
-        # search is pure HTTP and parallelises freely.
-        flat_npcs = [
-            (loc, npc)
-            for loc in self.locations
-            for npc in npcs_per_location.get(loc['id'], [])
-        ]
-        voice_ids = self._batch_resolve_npc_voices([npc for _, npc in flat_npcs])
-
-        all_npcs_data = []
-        for idx, (location, npc) in enumerate(flat_npcs):
-            try:
-                persisted = self._persist_npc(npc, location, voice_id=voice_ids[idx])
-                if persisted is not None:
-                    all_npcs_data.append(persisted)
-            except Exception as e:
-                self.session.rollback()
-                print(f"Failed to persist NPC '{getattr(npc, 'name', '?')}' "
-                      f"in {location.get('name')}: {e}")
-                continue
-
-        self.NPCs_data = all_npcs_data
-        print(f"Surrounding characters created: {len(all_npcs_data)} NPCs")
+        # Batches land in completion order; later phases pair NPCs up by
+        # index, so keep the list stable across runs.
+        order = {loc['id']: i for i, loc in enumerate(self.locations)}
+        self.NPCs_data.sort(key=lambda npc: order.get(npc['location_id'], len(order)))
+        print(f"Surrounding characters created: {len(self.NPCs_data)} NPCs")
         return {"message": "Surrounding characters and their events created successfully",
                 "status": "success"}
 
@@ -326,48 +395,106 @@ class CharacterBuilder:
         )
         return list(payload.npcs) if payload else []
 
-    def _batch_resolve_npc_voices(self, npcs):
-        """Run all NPC voice searches concurrently and return them in order.
+    def _pick_npc_voice_id(self, npc):
+        event_hint = getattr(getattr(npc, 'event', None), 'description', None)
+        return self._pick_voice_id(
+            gender=npc.gender,
+            date_of_birth=npc.date_of_birth,
+            race=npc.race,
+            search_text=event_hint,
+        )
 
-        Returns a list of voice ids (or ``None``) the same length as
-        ``npcs``. When no ElevenLabs key is configured the list is filled
-        with ``None`` without spawning any workers.
+    def _persist_npcs(self, flat_npcs, voice_ids):
+        """Persist every generated NPC (and its sub-rows) in one transaction.
+
+        All rows are built in memory and linked through their ORM
+        relationships, so a single flush lets the unit of work assign keys
+        table by table in multi-row INSERTs instead of flushing once per
+        row. If the batch fails (one malformed NPC poisons the whole
+        INSERT) the NPCs are retried one at a time so a single bad row
+        only costs that NPC, as before.
         """
-        n = len(npcs)
-        if n == 0:
+        built = []
+        for idx, (location, npc) in enumerate(flat_npcs):
+            try:
+                built.append((location, npc, self._build_npc_rows(
+                    npc, location, voice_id=voice_ids[idx])))
+            except Exception as e:
+                print(f"Failed to build NPC '{getattr(npc, 'name', '?')}' "
+                      f"in {location.get('name')}: {e}")
+        if not built:
             return []
-        if not self.elevenlabs_api_key:
-            return [None] * n
 
-        results = [None] * n
+        try:
+            for _, _, (character, rows) in built:
+                self.session.add_all(rows)
+            self.session.flush()
+            # Read the keys before commit expires the rows; afterwards each
+            # access would cost a refresh SELECT.
+            persisted = [
+                {'id': character.id, 'name': character.name,
+                 'location_id': location['id']}
+                for location, _, (character, _) in built
+            ]
+            refs = [character_index.CharacterRef(c.id, c.name, c.voice_id)
+                    for _, _, (c, _) in built]
+            self.session.commit()
+            self._note_characters(refs)
+            return persisted
+        except Exception as e:
+            self.session.rollback()
+            print(f"Bulk NPC persist failed, retrying one at a time: {e}")
 
-        def _resolve(idx, npc):
-            event_hint = getattr(getattr(npc, 'event', None), 'description', None)
-            return idx, self._pick_voice_id(
-                gender=npc.gender,
-                date_of_birth=npc.date_of_birth,
-                race=npc.race,
-                search_text=event_hint,
-            )
+        # Rebuild each NPC under the name it already drew, so the retry
+        # neither burns more of the seed's names nor renames anyone.
+        all_npcs_data = []
+        for location, npc, (character, _) in built:
+            try:
+                persisted = self._persist_npc(npc, location, voice_id=character.voice_id,
+                                              name=character.name)
+                if persisted is not None:
+                    all_npcs_data.append(persisted)
+            except Exception as e:
+                self.session.rollback()
+                print(f"Failed to persist NPC '{getattr(npc, 'name', '?')}' "
+                      f"in {location.get('name')}: {e}")
+                continue
+        return all_npcs_data
 
-        with ThreadPoolExecutor(max_workers=self._MAX_WORKERS) as pool:
-            futures = [pool.submit(_resolve, i, npc) for i, npc in enumerate(npcs)]
-            for future in as_completed(futures):
-                try:
-                    idx, vid = future.result()
-                    results[idx] = vid
-                except Exception as e:
-                    print(f'NPC voice search failed: {e}')
-        return results
+    def _persist_npc(self, npc, location, voice_id=None, name=None):
+        character, rows = self._build_npc_rows(npc, location, voice_id=voice_id,
+                                               name=name)
+        self.session.add_all(rows)
+        self.session.flush()
+        persisted = {'id': character.id, 'name': character.name,
+                     'location_id': location['id']}
+        ref = character_index.CharacterRef(character.id, character.name, character.voice_id)
+        self.session.commit()
+        self._note_characters([ref])
+        return persisted
+
+    def _note_characters(self, refs):
+        # Keep a speaker index that is already loaded for this seed current.
+        bind = bind_for(self.session)
+        for ref in refs:
+            character_index.note_character_added(bind, self.seed_id, ref)
 
-    def _persist_npc(self, npc, location, voice_id=None):
+    def _build_npc_rows(self, npc, location, voice_id=None, name=None):
+        """Build (but do not add) the Character row for ``npc`` and its sub-rows.
+
+        Returns ``(character, rows)``. Join rows reference their parents
+        through relationships rather than ids, so nothing needs a flush
+        until the caller persists the batch. ``name`` skips the name draw.
+        """
         level = random.randint(1, 3)
 
         # Override the LLM-generated NPC name with one drawn from the seed's
         # naming themes whenever the library has a match. NPCs always defer
         # to the library since the user only ever pre-names the protagonist.
-        seeded = self._seeded_name_or_none(npc.gender, category='first')
-        npc_name = seeded if seeded else npc.name
+        npc_name = name
+        if npc_name is None:
+            seeded = self._seeded_name_or_none(npc.gender, category='first')
+            npc_name = seeded if seeded else npc.name
 
         new_character = Character(
             seed_id=self.seed_id,
@@ -392,8 +519,7 @@ class CharacterBuilder:
             current_currency=random.randint(0, 1000),
             voice_id=voice_id,
         )
-        self.session.add(new_character)
-        self.session.flush()
+        rows = [new_character]
 
         current_dt = self.character_data.get('current_date_time') if hasattr(self, 'character_data') else None
         new_event = Event(
@@ -409,13 +535,12 @@ class CharacterBuilder:
             created_at=datetime.now(),
             updated_at=datetime.now(),
         )
-        self.session.add(new_event)
-        self.session.flush()
+        rows.append(new_event)
 
-        self.session.add(EventCharacter(
+        rows.append(EventCharacter(
             seed_id=self.seed_id,
-            character_id=new_character.id,
-            event_id=new_event.id,
+            character=new_character,
+            event=new_event,
             role=npc.event.role,
             created_at=datetime.now(),
             updated_at=datetime.now(),
@@ -424,11 +549,10 @@ class CharacterBuilder:
         for skill in npc.skills:
             new_skill = Skill(name=skill.name, description=skill.description,
                               created_at=datetime.now(), updated_at=datetime.now())
-            self.session.add(new_skill)
-            self.session.flush()
-            self.session.add(CharacterSkill(
-                seed_id=self.seed_id, character_id=new_character.id,
-                skill_id=new_skill.id,
+            rows.append(new_skill)
+            rows.append(CharacterSkill(
+                seed_id=self.seed_id, character=new_character,
+                skill=new_skill,
                 level=random.randint(1, 5), exp_points=random.randint(0, 100),
                 created_at=datetime.now(), updated_at=datetime.now(),
             ))
@@ -437,11 +561,10 @@ class CharacterBuilder:
             new_status = Status(name=st.name, description=st.description, type=st.type,
                                 duration=st.duration, created_at=datetime.now(),
                                 updated_at=datetime.now())
-            self.session.add(new_status)
-            self.session.flush()
-            self.session.add(CharacterStatus(
-                seed_id=self.seed_id, character_id=new_character.id,
-                status_id=new_status.id, active=True,
+            rows.append(new_status)
+            rows.append(CharacterStatus(
+                seed_id=self.seed_id, character=new_character,
+                status=new_status, active=True,
                 end_date_time=datetime.now() + timedelta(seconds=st.duration or 0),
                 created_at=datetime.now(), updated_at=datetime.now(),
             ))
@@ -450,17 +573,14 @@ class CharacterBuilder:
             new_item = Item(name=item.name, description=item.description, type=item.type,
                             value=item.value, weight=item.weight,
                             created_at=datetime.now(), updated_at=datetime.now())
-            self.session.add(new_item)
-            self.session.flush()
-            self.session.add(CharacterItem(
-                seed_id=self.seed_id, character_id=new_character.id,
-                item_id=new_item.id, quantity=item.quantity, condition=item.condition,
+            rows.append(new_item)
+            rows.append(CharacterItem(
+                seed_id=self.seed_id, character=new_character,
+                item=new_item, quantity=item.quantity, condition=item.condition,
                 created_at=datetime.now(), updated_at=datetime.now(),
             ))
 
-        self.session.commit()
-        return {'id': new_character.id, 'name': npc_name,
-                'location_id': location['id']}
+        return new_character, rows
 
     def create_surrounding_characters_skills(self):
         """No-op: skills are batched into create_surrounding_characters."""
@@ -478,9 +598,13 @@ class CharacterBuilder:
     # Relationships (parallelized across pairs)                           #
     # ------------------------------------------------------------------ #
     def create_surrounding_characters_relationships(self):
+        return self.persist_surrounding_characters_relationships(
+            self.fetch_surrounding_characters_relationships())
+
+    def fetch_surrounding_characters_relationships(self):
+        """Fetch up to 10 random NPC pair relationships; ``{(i, j): rel}``."""
         if not getattr(self, 'NPCs_data', None) or len(self.NPCs_data) < 2:
-            return {"message": "No NPC data available to form relationships.",
-                    "status": "success"}
+            return {}
 
         all_pairs = [(i, j) for i in range(len(self.NPCs_data))
                      for j in range(i + 1, len(self.NPCs_data))]
@@ -499,6 +623,12 @@ class CharacterBuilder:
                 except Exception as e:
                     print(f"Relationship fetch failed for pair {pair}: {e}")
                     results[pair] = None
+        return results
+
+    def persist_surrounding_characters_relationships(self, results):
+        if not getattr(self, 'NPCs_data', None) or len(self.NPCs_data) < 2:
+            return {"message": "No NPC data available to form relationships.",
+                    "status": "success"}
 
         persisted = 0
         for (i, j), rel in results.items():
@@ -550,19 +680,21 @@ class CharacterBuilder:
         the entire populated world. NPCs with no row keyed off the MC are
         treated as strangers (familiarity == 0) by the read path.
         """
-        if not getattr(self, 'NPCs_data', None):
-            return {"message": "No NPCs available; no MC relationships to form.",
-                    "status": "success"}
+        return self.persist_main_character_relationships(
+            self.fetch_main_character_relationships())
 
-        mc_payload = getattr(self, 'character_data', None) or {}
-        mc_id = mc_payload.get('id')
-        if not mc_id:
-            return {"message": "Main character not created; skipping MC relationships.",
-                    "status": "skipped"}
+    def fetch_main_character_relationships(self):
+        """Pick the MC's acquaintances and fetch each relationship.
 
+        Returns ``{npc_index: rel}``, or ``None`` when there is nobody to
+        fetch for.
+        """
+        mc_payload = getattr(self, 'character_data', None) or {}
+        if not getattr(self, 'NPCs_data', None) or not mc_payload.get('id'):
+            return None
         indices = self._pick_mc_acquaintance_indices()
         if not indices:
-            return {"message": "No MC acquaintances selected.", "status": "success"}
+            return None
 
         results = {}
         with ThreadPoolExecutor(max_workers=self._MAX_WORKERS) as pool:
@@ -576,6 +708,20 @@ class CharacterBuilder:
                 except Exception as e:
                     print(f"MC relationship fetch failed for NPC index {idx}: {e}")
                     results[idx] = None
+        return results
+
+    def persist_main_character_relationships(self, results):
+        if not getattr(self, 'NPCs_data', None):
+            return {"message": "No NPCs available; no MC relationships to form.",
+                    "status": "success"}
+
+        mc_payload = getattr(self, 'character_data', None) or {}
+        mc_id = mc_payload.get('id')
+        if not mc_id:
+            return {"message": "Main character not created; skipping MC relationships.",
+                    "status": "skipped"}
+        if results is None:
+            return {"message": "No MC acquaintances selected.", "status": "success"}
 
         persisted = 0
         for idx, rel in results.items():
@@ -645,6 +791,25 @@ class CharacterBuilder:
         the world is already fully persisted; the opening event is a UX
         sweetener on top.
         """
+        return self.persist_opening_event(self.fetch_opening_event())
+
+    def fetch_opening_event(self):
+        mc_payload = getattr(self, 'character_data', None) or {}
+        locations = list(getattr(self, 'locations', []) or [])
+        if not mc_payload.get('id') or not locations:
+            return None
+        return self.gpt_service.get_structured(
+            WORLD_BUILDING['OPENING_EVENT'].format(
+                seed_data=self.seed_data,
+                character=mc_payload,
+                starting_location=locations[0],
+            ),
+            EventOut,
+            max_attempts=2,
+            temperature=0.9,
+        )
+
+    def persist_opening_event(self, payload):
         mc_payload = getattr(self, 'character_data', None) or {}
         mc_id = mc_payload.get('id')
         if not mc_id:
@@ -657,16 +822,6 @@ class CharacterBuilder:
                     "status": "skipped"}
         starting_location = locations[0]
 
-        payload = self.gpt_service.get_structured(
-            WORLD_BUILDING['OPENING_EVENT'].format(
-                seed_data=self.seed_data,
-                character=mc_payload,
-                starting_location=starting_location,
-            ),
-            EventOut,
-            max_attempts=2,
-            temperature=0.9,
-        )
         if payload is None:
             return {"message": "Failed to generate opening event.",
                     "status": "failure"}
@@ -4,6 +4,9 @@ from datetime import datetime
 import traceback
 from app.orm import Location, LocationConnection, GeographicFeature
 from app.prompt_templates import WORLD_BUILDING
+from app.services import map_cache
+from app.services import travel_service
+from app.services.seed_cache import bind_for
 from app.world_building.schemas import LocationListOut
 
 # Light bounds on geometry: the prompt asks for up to ~10 polygon points,
@@ -37,13 +40,24 @@ class LocationBuilder:
         explicitly forbids.
         """
         try:
-            payload = self.gpt_service.get_structured(
-                WORLD_BUILDING['LOCATIONS_BATCH'].format(self.seed_data),
-                LocationListOut,
-                max_attempts=3,
-                temperature=0.8,
-            )
+            payload = self.fetch_locations()
+        except Exception as e:
+            print(f'Error during location generation: {e}')
+            payload = None
+        return self.persist_locations(payload)
+
+    def fetch_locations(self):
+        """LLM half of ``create_locations``; touches no session state."""
+        return self.gpt_service.get_structured(
+            WORLD_BUILDING['LOCATIONS_BATCH'].format(self.seed_data),
+            LocationListOut,
+            max_attempts=3,
+            temperature=0.8,
+        )
 
+    def persist_locations(self, payload):
+        """Write a ``LocationListOut`` payload; sets ``self.locations``."""
+        try:
             if payload is None:
                 return {"message": "Failed to generate location data", "status": "failure"}
 
@@ -157,6 +171,9 @@ class LocationBuilder:
                 ))
 
             self.session.commit()
+            bind = bind_for(self.session)
+            travel_service.invalidate_graph(bind, self.seed_id)
+            map_cache.invalidate(bind, self.seed_id)
             self.locations = locations
             print("Locations created successfully")
             return {"message": "Locations created successfully", "status": "success"}
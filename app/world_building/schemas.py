@@ -287,3 +287,12 @@ class BackgroundEventOut(BaseModel):
 class BackgroundEventsOut(BaseModel):
     """Container for the per-tick autonomous-events payload."""
     events: List[BackgroundEventOut] = Field(default_factory=list)
+
+
+class SuggestedActionsOut(BaseModel):
+    """Short next-action suggestions for the player (``SUGGEST_ACTIONS``).
+
+    Items are left loosely typed; ``routes._clean_suggestions`` stringifies
+    and trims them.
+    """
+    suggestions: list = Field(default_factory=list)
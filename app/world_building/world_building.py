@@ -1,13 +1,50 @@
 # world_builder.py
+import queue
+import threading
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 
 from app.prompt_templates import WORLD_BUILDING
+from app.services import context_cache
 from app.services.gpt_service import GPTService
 from app.services.name_service import NameService
+from app.services.seed_cache import bind_for
 from app.world_building.character_builder import CharacterBuilder
 from app.world_building.location_builder import LocationBuilder
 
 
+class _Phase:
+    """One node of the world-building DAG.
+
+    ``fetch`` does the LLM / HTTP work on a pool thread and must not touch
+    the session; ``persist`` receives its result on the orchestrating
+    thread and does every DB write. ``needs`` are the phases that must be
+    persisted before ``fetch`` may start (it reads their output);
+    ``persist_after`` are extra phases whose writes ``persist`` depends on.
+    Whatever ``persist`` returns is stored under ``result_key`` (the phase
+    name by default; ``None`` keeps the phase out of the results).
+
+    A phase with ``persist_item`` streams: ``fetch`` is called with an
+    ``emit`` callback, and every ``emit(*item)`` is handed to
+    ``persist_item(*item)`` on the orchestrating thread while the fetch is
+    still running. ``persist`` then runs once the fetch has returned and
+    every emitted item has been written.
+    """
+
+    _DEFAULT_KEY = object()
+
+    def __init__(self, name, fetch, persist, *, needs=(), persist_after=(),
+                 message=None, result_key=_DEFAULT_KEY, persist_item=None):
+        self.name = name
+        self.fetch = fetch
+        self.persist = persist
+        self.persist_item = persist_item
+        self.needs = frozenset(needs)
+        self.persist_after = frozenset(persist_after) | self.needs
+        self.message = message
+        self.result_key = name if result_key is _Phase._DEFAULT_KEY else result_key
+
+
 class WorldBuilder:
     """Orchestrates the world-building pipeline.
 
@@ -17,6 +54,14 @@ class WorldBuilder:
         statuses + items) and parallelizes both the per-location NPC fetch and
         the per-pair relationship fetch via ``ThreadPoolExecutor``.
 
+    Across builders, ``build_world`` runs the phases as a dependency graph:
+    every phase's LLM step starts as soon as the phases it reads from have
+    been persisted, so independent calls (theme selection, the main
+    character and the locations all need only ``seed_data``) overlap and the
+    build takes roughly its critical path instead of the sum of the
+    phases. DB writes stay on the calling thread, one at a time, in
+    declaration order whenever several are ready together.
+
     The orchestrator keeps the original result-key contract so the SSE route
     and existing tests remain unchanged.
     """
@@ -38,77 +83,214 @@ class WorldBuilder:
 
     def build_world(self):
         results = {}
+        cb = self.character_builder
+        lb = self.location_builder
 
         # Phase 0: pick the naming aesthetic ONCE per seed and persist it.
         # Subsequent character lookups (main + NPCs) draw names from the
         # NameLibrary subset matching this choice. If the table is empty or
         # the LLM returns nothing usable, character names fall back to the
-        # LLM-generated values.
-        self.progress_callback("Selecting theme for the world...")
-        chosen = self.name_service.select_themes_for_seed(self.seed_data)
-        self.name_service.assign_themes_to_seed(self.seed_id, chosen)
-        results['naming_themes'] = {
-            "themes": chosen,
-            "status": "success" if chosen else "skipped",
-            "message": (f"Selected {len(chosen)} naming theme(s)." if chosen
-                        else "No naming themes selected; using LLM names."),
-        }
-
-        # Phase 1 (sequential to keep the shared SQLAlchemy session safe):
-        # main character (now a single batched LLM call) + locations (also a
-        # single batched call returning every sub-location).
-        self.progress_callback("Creating main character...")
-        results['main_character'] = self.character_builder.create_main_character()
-        results['main_character_skills'] = self.character_builder.create_main_character_skills()
-        results['main_character_statuses'] = self.character_builder.create_main_character_statuses()
-
-        # Hand the protagonist a small, deliberately low-power starter kit so
-        # the opening scene has something to interact with without trivializing
-        # early encounters. The prompt caps quantity/value/weight; see
-        # WORLD_BUILDING['MAIN_CHARACTER_ITEMS_BATCH'].
-        self.progress_callback("Equipping main character with starter items...")
-        results['main_character_items'] = self.character_builder.create_main_character_items()
-
-        self.progress_callback("Creating locations...")
-        results['locations'] = self.location_builder.create_locations()
-
-        self.character_builder.locations = self.location_builder.locations
-
-        # Phase 2: NPC generation runs in parallel across locations internally.
-        self.progress_callback("Creating surrounding characters...")
-        results['surrounding_characters'] = self.character_builder.create_surrounding_characters()
-        results['surrounding_characters_skills'] = self.character_builder.create_surrounding_characters_skills()
-        results['surrounding_characters_statuses'] = self.character_builder.create_surrounding_characters_statuses()
-        results['surrounding_characters_items'] = self.character_builder.create_surrounding_characters_items()
-
-        # Phase 3: relationships run in parallel across pairs internally.
-        self.progress_callback("Creating surrounding characters relationships...")
-        results['surrounding_characters_relationships'] = (
-            self.character_builder.create_surrounding_characters_relationships())
-
-        # Phase 3b: seed a small handful of MC <-> NPC acquaintances so the
-        # protagonist starts the game knowing only a few locals; everyone
-        # else is rendered as an unknown stranger by the read path.
-        self.progress_callback("Creating main character relationships...")
-        results['main_character_relationships'] = (
-            self.character_builder.create_main_character_relationships())
-
-        # Phase 3c: anchor the protagonist to the starting location with a
-        # single MC-tagged event. The info-panel events/locations lists
-        # filter by EventCharacter membership, so without this the player
-        # opens onto empty accordions until gameplay produces an event.
-        self.progress_callback("Composing opening event...")
-        results['opening_event'] = self.character_builder.create_opening_event()
-
-        # Phase 4: a single narrator-style opening passage that introduces the
-        # world, the protagonist and the starting scene. Persisted by the
-        # caller as a 'narration' transcript entry so it survives reloads.
-        self.progress_callback("Composing story opening...")
-        results['intro_narration'] = self._create_intro_narration()
+        # LLM-generated values. The catalog is cached process-wide until
+        # the NameLibrary seeder runs again; a miss reads it here, on the
+        # session's thread, and only the LLM pick runs on the pool.
+        available_themes = self.name_service.theme_catalog()
+
+        def persist_themes(chosen):
+            chosen = chosen or []
+            self.name_service.assign_themes_to_seed(self.seed_id, chosen)
+            return {
+                "themes": chosen,
+                "status": "success" if chosen else "skipped",
+                "message": (f"Selected {len(chosen)} naming theme(s)." if chosen
+                            else "No naming themes selected; using LLM names."),
+            }
+
+        # Main character: a single batched LLM call. The name override
+        # reads the seed's themes, so the write waits for Phase 0.
+        # ``main_character_settled`` is set once the write is over, whether
+        # it worked or not, for NPC voice searches waiting on the MC clock.
+        main_character_settled = threading.Event()
+
+        def persist_main_character(fetched):
+            try:
+                result = cb.persist_main_character(fetched)
+            finally:
+                main_character_settled.set()
+            results['main_character_skills'] = cb.create_main_character_skills()
+            results['main_character_statuses'] = cb.create_main_character_statuses()
+            return result
+
+        def persist_locations(payload):
+            result = lb.persist_locations(payload)
+            cb.locations = getattr(lb, 'locations', [])
+            return result
+
+        # NPC generation runs in parallel across locations internally and
+        # streams: each location is written (and reported) as soon as its
+        # LLM batch and voice searches are done. Only the LLM batches start
+        # with the locations; voice searches need the MC's clock for ages
+        # and the writes need it (and the themes, for names) too, so both
+        # wait for the main character.
+        def persist_surrounding_characters(_):
+            result = cb.finish_surrounding_characters()
+            results['surrounding_characters_skills'] = cb.create_surrounding_characters_skills()
+            results['surrounding_characters_statuses'] = cb.create_surrounding_characters_statuses()
+            results['surrounding_characters_items'] = cb.create_surrounding_characters_items()
+            return result
+
+        phases = [
+            _Phase('naming_themes',
+                   lambda: self.name_service.choose_themes(self.seed_data, available_themes),
+                   persist_themes,
+                   message="Selecting theme for the world..."),
+            _Phase('main_character', cb.fetch_main_character, persist_main_character,
+                   persist_after=('naming_themes',),
+                   message="Creating main character..."),
+            # Hand the protagonist a small, deliberately low-power starter kit
+            # so the opening scene has something to interact with without
+            # trivializing early encounters. The prompt caps quantity/value/
+            # weight; see WORLD_BUILDING['MAIN_CHARACTER_ITEMS_BATCH'].
+            _Phase('main_character_items', cb.fetch_main_character_items,
+                   cb.persist_main_character_items,
+                   needs=('main_character',),
+                   message="Equipping main character with starter items..."),
+            _Phase('locations', lb.fetch_locations, persist_locations,
+                   message="Creating locations..."),
+            _Phase('surrounding_characters',
+                   lambda emit: cb.stream_npc_batches(
+                       emit, voices_after=main_character_settled),
+                   persist_surrounding_characters,
+                   persist_item=cb.persist_npc_batch,
+                   needs=('locations',),
+                   persist_after=('main_character',),
+                   message="Creating surrounding characters..."),
+            # Relationships run in parallel across pairs internally.
+            _Phase('surrounding_characters_relationships',
+                   cb.fetch_surrounding_characters_relationships,
+                   lambda rels: cb.persist_surrounding_characters_relationships(rels or {}),
+                   needs=('surrounding_characters',),
+                   message="Creating surrounding characters relationships..."),
+            # Seed a small handful of MC <-> NPC acquaintances so the
+            # protagonist starts the game knowing only a few locals; everyone
+            # else is rendered as an unknown stranger by the read path.
+            _Phase('main_character_relationships',
+                   cb.fetch_main_character_relationships,
+                   cb.persist_main_character_relationships,
+                   needs=('surrounding_characters', 'main_character'),
+                   message="Creating main character relationships..."),
+            # Anchor the protagonist to the starting location with a single
+            # MC-tagged event. The info-panel events/locations lists filter
+            # by EventCharacter membership, so without this the player opens
+            # onto empty accordions until gameplay produces an event.
+            _Phase('opening_event', cb.fetch_opening_event,
+                   cb.persist_opening_event,
+                   needs=('main_character', 'locations'),
+                   message="Composing opening event..."),
+            # A single narrator-style opening passage that introduces the
+            # world, the protagonist and the starting scene. Persisted by the
+            # caller as a 'narration' transcript entry so it survives reloads.
+            _Phase('intro_narration', self._create_intro_narration,
+                   lambda text: text,
+                   needs=('opening_event',),
+                   message="Composing story opening..."),
+        ]
+        self._run_phases(phases, results)
+
+        # Anything cached for this seed while the world was half-built is
+        # stale now that every row is in place.
+        context_cache.invalidate(bind_for(self.session), self.seed_id)
 
         self.progress_callback("World building complete!", "success")
         return results
 
+    def _run_phases(self, phases, results):
+        """Run ``phases`` as a DAG: fetches on a pool, persists on this thread.
+
+        Workers report back through one queue -- ``('item', phase, item)``
+        for each streamed item and ``('fetched', phase, value)`` when a
+        fetch returns -- so the orchestrator can write streamed items while
+        other fetches are still in flight.
+        """
+        order = {phase.name: i for i, phase in enumerate(phases)}
+        pending = list(phases)
+        events = queue.Queue()
+        items = {phase.name: [] for phase in phases}
+        fetched = {}
+        running = set()
+        done = set()
+        with ThreadPoolExecutor(max_workers=len(phases)) as pool:
+            while pending or running or fetched:
+                for phase in [p for p in pending if p.needs <= done]:
+                    pending.remove(phase)
+                    if phase.message:
+                        self.progress_callback(phase.message)
+                    running.add(phase.name)
+                    pool.submit(self._fetch_phase, phase, events)
+
+                # A phase's items are queued before its ``fetched`` event,
+                # so they are always drained before its final persist.
+                for phase in phases:
+                    if items[phase.name] and phase.persist_after <= done:
+                        streamed, items[phase.name] = items[phase.name], []
+                        for item in streamed:
+                            self._persist_item(phase, item)
+
+                ready = sorted((name for name in fetched
+                                if fetched[name][0].persist_after <= done),
+                               key=order.get)
+                if ready:
+                    phase, value = fetched.pop(ready[0])
+                    result = self._persist_phase(phase, value)
+                    if phase.result_key is not None:
+                        results[phase.result_key] = result
+                    done.add(phase.name)
+                    continue
+
+                if not running:
+                    # Only reachable with a dependency cycle or an unknown
+                    # phase name; fail loudly rather than spin.
+                    raise RuntimeError('World-building phases cannot make progress: '
+                                       + ', '.join(p.name for p in pending))
+                kind, phase, value = events.get()
+                if kind == 'item':
+                    items[phase.name].append(value)
+                else:
+                    running.discard(phase.name)
+                    fetched[phase.name] = (phase, value)
+
+    @staticmethod
+    def _fetch_phase(phase, events):
+        value = None
+        try:
+            if phase.persist_item is None:
+                value = phase.fetch()
+            else:
+                value = phase.fetch(lambda *item: events.put(('item', phase, item)))
+        except Exception as e:
+            print(f"World-building phase '{phase.name}' failed to fetch: {e}")
+            traceback.print_exc()
+        finally:
+            events.put(('fetched', phase, value))
+        return value
+
+    def _persist_item(self, phase, item):
+        try:
+            phase.persist_item(*item)
+        except Exception as e:
+            self.session.rollback()
+            print(f"World-building phase '{phase.name}' failed to persist an item: {e}")
+            traceback.print_exc()
+
+    def _persist_phase(self, phase, value):
+        try:
+            return phase.persist(value)
+        except Exception as e:
+            self.session.rollback()
+            print(f"World-building phase '{phase.name}' failed to persist: {e}")
+            traceback.print_exc()
+            return {"message": f"Failed to persist {phase.name}. {e}",
+                    "status": "failure"}
+
     def _create_intro_narration(self):
         """Produce a short second-person opening passage for the new world.
 
@@ -298,7 +298,7 @@ CREATE TABLE `NameLibrary` (
   `theme` varchar(64) NOT NULL,
   `gender` varchar(16) NOT NULL DEFAULT 'any',
   `category` varchar(16) NOT NULL DEFAULT 'first',
-  `name` varchar(128) NOT NULL,
+  `name` varchar(128) CHARACTER SET utf8mb4 COLLATE utf8mb4_bin NOT NULL,
   `meaning` text,
   `origin` varchar(64) DEFAULT NULL,
   `created_at` datetime DEFAULT NULL,
@@ -307,7 +307,18 @@ CREATE TABLE `NameLibrary` (
   KEY `idx_namelib_theme` (`theme`),
   KEY `idx_namelib_gender` (`gender`),
   KEY `idx_namelib_category` (`category`),
-  KEY `idx_namelib_lookup` (`source`, `theme`, `gender`, `category`)
+  KEY `idx_namelib_lookup` (`source`, `theme`, `gender`, `category`),
+  UNIQUE KEY `uq_namelibrary_entry` (`source`, `theme`, `gender`, `category`, `name`)
+);
+
+-- NameLibrarySeedProgress definition (seeder checkpoints)
+
+CREATE TABLE `NameLibrarySeedProgress` (
+  `source` varchar(32) NOT NULL,
+  `rows_done` bigint NOT NULL DEFAULT 0,
+  `completed` tinyint(1) NOT NULL DEFAULT 0,
+  `updated_at` datetime DEFAULT NULL,
+  PRIMARY KEY (`source`)
 );
 
 -- Skills definition
@@ -0,0 +1,33 @@
+-- Migration: database-side NameLibrary dedupe and seeder checkpoints.
+--
+-- scripts/seed_name_library.py now inserts batches that skip rows already
+-- present, relying on a unique key instead of an in-memory set of every
+-- existing name, and records per-source progress so interrupted runs
+-- resume. Existing duplicates (there should be none) are removed first,
+-- keeping the oldest row. app/startup.ensure_table_index_extras applies
+-- the same change automatically when AUTO_MIGRATE is on.
+--
+-- `name` switches to a binary collation first: under the default
+-- case- and accent-insensitive collation the dedupe (and the key) would
+-- treat "Ael", "ael" and "Aël" as one name.
+
+ALTER TABLE `NameLibrary`
+  MODIFY `name` varchar(128) CHARACTER SET utf8mb4 COLLATE utf8mb4_bin NOT NULL;
+
+DELETE FROM `NameLibrary` WHERE `id` NOT IN (
+  SELECT `id` FROM (
+    SELECT MIN(`id`) AS `id` FROM `NameLibrary`
+    GROUP BY `source`, `theme`, `gender`, `category`, `name`
+  ) AS `keep_rows`
+);
+
+ALTER TABLE `NameLibrary`
+  ADD UNIQUE KEY `uq_namelibrary_entry` (`source`, `theme`, `gender`, `category`, `name`);
+
+CREATE TABLE IF NOT EXISTS `NameLibrarySeedProgress` (
+  `source` varchar(32) NOT NULL,
+  `rows_done` bigint NOT NULL DEFAULT 0,
+  `completed` tinyint(1) NOT NULL DEFAULT 0,
+  `updated_at` datetime DEFAULT NULL,
+  PRIMARY KEY (`source`)
+);
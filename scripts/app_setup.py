@@ -9,18 +9,22 @@ idempotent so re-runs are safe.
 
 Steps:
   1. ``Base.metadata.create_all`` so any newly-defined tables exist.
-  2. Idempotent column adds on already-existing tables (delegated to
-     ``app/startup.ensure_schema_extras``).
+  2. Idempotent column and unique-index adds on already-existing tables
+     (delegated to ``app/startup.ensure_schema_extras`` and
+     ``ensure_table_index_extras``).
   3. Best-effort install of ``fantasynames`` (the post_compile hook
      already installs it in the slug; this is a fallback for ad-hoc
      environments that ran the script directly).
-  4. Seed ``NameLibrary`` synchronously when the table is empty.
+  4. Seed ``NameLibrary`` synchronously when the table is empty or an
+     earlier seed run stopped part-way (it resumes from its checkpoints),
+     loading the pre-built snapshot when one is present.
 
 Environment variables (all optional):
   AUTO_MIGRATE=0           skip step 2
   AUTO_SEED_NAMES=0        skip step 4
   SEED_PER_THEME=N         names per (theme, gender) for procedural sources
   SEED_INCLUDE_BABYNAMES=1 also fetch from the BabyNames REST API
+  NAME_LIBRARY_SNAPSHOT=path  snapshot to load instead of generating names
 """
 from __future__ import annotations
 
@@ -39,7 +43,10 @@ def main():
     from sqlalchemy.orm import sessionmaker
 
     from app.orm import Base, NameLibrary, engine
-    from app.startup import _default_seed_argv, ensure_schema_extras
+    from app.startup import (
+        ensure_schema_extras, ensure_table_index_extras,
+        name_library_seed_unfinished, seed_name_library,
+    )
 
     log.info("Step 1/4: Base.metadata.create_all")
     Base.metadata.create_all(engine)
@@ -47,6 +54,7 @@ def main():
     if os.getenv("AUTO_MIGRATE", "1") != "0":
         log.info("Step 2/4: ensure_schema_extras")
         ensure_schema_extras(engine)
+        ensure_table_index_extras(engine)
     else:
         log.info("Step 2/4: skipped (AUTO_MIGRATE=0)")
 
@@ -54,22 +62,20 @@ def main():
     _ensure_fantasynames()
 
     if os.getenv("AUTO_SEED_NAMES", "1") != "0":
-        log.info("Step 4/4: seed NameLibrary if empty")
+        log.info("Step 4/4: seed NameLibrary if empty or unfinished")
         Session = sessionmaker(bind=engine)
         session = Session()
         try:
             count = session.query(NameLibrary).count()
+            unfinished = name_library_seed_unfinished(session)
         finally:
             session.close()
 
-        if count > 0:
+        if count > 0 and not unfinished:
             log.info("NameLibrary already populated (%d rows); skipping seed.",
                      count)
         else:
-            from scripts.seed_name_library import main as seed_main
-            argv = _default_seed_argv()
-            log.info("Running seed_name_library with argv=%s", argv)
-            seed_main(argv)
+            seed_name_library(Session)
     else:
         log.info("Step 4/4: skipped (AUTO_SEED_NAMES=0)")
 
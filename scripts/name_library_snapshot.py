@@ -0,0 +1,188 @@
+"""Export and load pre-built ``NameLibrary`` snapshots.
+
+Generating the library procedurally takes minutes, and until it finishes
+world builds fall back to LLM names. A snapshot exported from a seeded
+database lets a fresh environment load the finished library in seconds
+instead: the startup seeding thread and ``scripts/app_setup`` load the
+file at ``NAME_LIBRARY_SNAPSHOT`` (default ``data/name_library.snapshot.json.gz``)
+when it exists, and only fall back to generating names when it does not.
+
+Format: gzip-compressed JSON lines. The first line is a header naming
+the format, the columns and a unique ``export_id``; each following line is one block of up to
+``BLOCK_ROWS`` rows stored column by column (``{"name": [...], ...}``),
+which keeps the repeated source/theme/gender/category strings adjacent
+so they compress to almost nothing. Export and load both stream block
+by block, so neither holds the whole library in memory.
+
+Loading goes through ``seed_name_library.seed`` as a source named after
+the export (``snapshot:`` plus its ``export_id``, see ``snapshot_source``):
+the same batched, duplicate-skipping inserts and the same checkpoints, so
+an interrupted load resumes and loading over an existing library only
+adds what is missing. Keying the checkpoint by the export means a newer
+snapshot is loaded rather than skipped as done, and never fast-forwards
+past rows using an older file's offset. MySQL's ``LOAD DATA LOCAL INFILE``
+is not used because it needs ``local_infile`` enabled on both the server
+and the client, which managed databases usually refuse.
+
+Usage:
+    python -m scripts.name_library_snapshot export data/name_library.snapshot.json.gz
+    python -m scripts.name_library_snapshot load data/name_library.snapshot.json.gz
+"""
+from __future__ import annotations
+
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import sys
+import time
+import uuid
+from pathlib import Path
+
+from sqlalchemy.orm import sessionmaker
+
+from app.orm import NameLibrary, NameLibrarySeedProgress, engine
+
+FORMAT = "namelibrary-snapshot"
+FORMAT_VERSION = 1
+COLUMNS = ("source", "theme", "gender", "category", "name", "meaning", "origin")
+BLOCK_ROWS = 10000
+# Checkpoint names are this prefix plus the export id, trimmed to fit
+# NameLibrarySeedProgress.source (String(32)).
+SNAPSHOT_SOURCE_PREFIX = "snapshot:"
+_SOURCE_LENGTH = 32
+DEFAULT_PATH = Path("data/name_library.snapshot.json.gz")
+
+
+def snapshot_path():
+    """The configured snapshot file, or ``None`` if there isn't one on disk."""
+    path = Path(os.getenv("NAME_LIBRARY_SNAPSHOT") or DEFAULT_PATH)
+    return path if path.is_file() else None
+
+
+def snapshot_source(path):
+    """Checkpoint name for the snapshot at ``path``.
+
+    Every export writes a fresh ``export_id`` into the header, so this only
+    reads the first line. Files without one (exported before the id was
+    added, or not snapshots at all) fall back to a digest of the whole file.
+    """
+    with gzip.open(path, "rb") as fh:
+        header = fh.readline()
+    try:
+        export_id = json.loads(header).get("export_id")
+    except (ValueError, AttributeError):
+        export_id = None
+    if not export_id:
+        digest = hashlib.sha256()
+        with open(path, "rb") as fh:
+            for chunk in iter(lambda: fh.read(1 << 20), b""):
+                digest.update(chunk)
+        export_id = digest.hexdigest()
+    return (SNAPSHOT_SOURCE_PREFIX + export_id)[:_SOURCE_LENGTH]
+
+
+def write_snapshot(session, path):
+    """Write every NameLibrary row to ``path``; return the row count."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    query = (session.query(*(getattr(NameLibrary, c) for c in COLUMNS))
+             .order_by(NameLibrary.id)
+             .yield_per(BLOCK_ROWS))
+    total = 0
+    # Write next to the target and rename, so a failed export never leaves
+    # a truncated snapshot where startup would load it.
+    partial = path.with_name(path.name + ".part")
+    with gzip.open(partial, "wt", encoding="utf-8") as fh:
+        fh.write(json.dumps({"format": FORMAT, "version": FORMAT_VERSION,
+                             "columns": list(COLUMNS),
+                             "export_id": uuid.uuid4().hex}) + "\n")
+        block = []
+        for row in query:
+            block.append(row)
+            if len(block) >= BLOCK_ROWS:
+                total += _write_block(fh, block)
+                block = []
+        total += _write_block(fh, block)
+    os.replace(partial, path)
+    return total
+
+
+def _write_block(fh, rows):
+    if not rows:
+        return 0
+    columns = {c: [row[i] for row in rows] for i, c in enumerate(COLUMNS)}
+    fh.write(json.dumps(columns, ensure_ascii=False, separators=(",", ":")) + "\n")
+    return len(rows)
+
+
+def iter_snapshot(path):
+    """Yield NameLibrary row dicts from the snapshot at ``path``."""
+    with gzip.open(path, "rt", encoding="utf-8") as fh:
+        header = json.loads(fh.readline() or "{}")
+        if header.get("format") != FORMAT or header.get("version") != FORMAT_VERSION:
+            raise ValueError(f"{path} is not a version {FORMAT_VERSION} "
+                             f"NameLibrary snapshot")
+        columns = header["columns"]
+        for line in fh:
+            block = json.loads(line)
+            for values in zip(*(block[c] for c in columns)):
+                yield dict(zip(columns, values))
+
+
+def load_snapshot(session_factory, path, *, restart=False):
+    """Insert the snapshot's rows that are not in NameLibrary yet.
+
+    Returns the number of new rows. Resumes an interrupted load of the
+    same file unless ``restart`` is set; checkpoints left by other
+    snapshot files are dropped, since they can never be resumed.
+    """
+    from scripts.seed_name_library import _ensure_schema, seed
+
+    source = snapshot_source(path)
+    session = session_factory()
+    try:
+        bind = session.get_bind()
+        _ensure_schema(bind)
+        (session.query(NameLibrarySeedProgress)
+         .filter(NameLibrarySeedProgress.source.like(SNAPSHOT_SOURCE_PREFIX + "%"),
+                 NameLibrarySeedProgress.source != source)
+         .delete(synchronize_session=False))
+        session.commit()
+    finally:
+        session.close()
+    return seed(session_factory, {source: lambda: iter_snapshot(path)},
+                restart=restart)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("action", choices=("export", "load"))
+    parser.add_argument("path", type=Path, nargs="?", default=DEFAULT_PATH,
+                        help=f"Snapshot file (default: {DEFAULT_PATH})")
+    parser.add_argument("--restart", action="store_true",
+                        help="load: ignore the checkpoint of an earlier load")
+    args = parser.parse_args(argv)
+
+    Session = sessionmaker(bind=engine)
+    started = time.time()
+    if args.action == "export":
+        session = Session()
+        try:
+            total = write_snapshot(session, args.path)
+        finally:
+            session.close()
+        print(f"Exported {total} rows to {args.path} "
+              f"({args.path.stat().st_size / 1024:.0f} KiB) in "
+              f"{time.time() - started:.1f}s")
+    else:
+        total = load_snapshot(Session, args.path, restart=args.restart)
+        print(f"Loaded {total} new rows from {args.path} in "
+              f"{time.time() - started:.1f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
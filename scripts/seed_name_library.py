@@ -1,14 +1,30 @@
-"""One-time NameLibrary seeder.
+"""NameLibrary seeder.
 
 Pulls names from four upstream sources and bulk-inserts them into the
 ``NameLibrary`` table. Each source is independent: missing dependencies or
 network failures only skip that source, never the whole run.
 
+Sources run in parallel, one producer thread each, feeding fixed-size
+batches through a bounded queue to a single writer. Deduplication happens
+in the database: ``NameLibrary`` has a unique key over (source, theme,
+gender, category, name) and every batch is one multi-row insert that skips
+rows already present, so memory stays flat however large the library is.
+
+Runs are resumable. Each batch commits together with its source's
+checkpoint in ``NameLibrarySeedProgress`` (rows of the source written so
+far); a re-run skips completed sources and fast-forwards the others past
+the rows they already wrote. The procedural sources (fantasynames,
+pynames) draw random names, so a re-run does not replay their rows and an
+offset means nothing: an unfinished one starts over instead, and the
+unique key drops the names it wrote last time. ``--restart`` ignores the
+checkpoints.
+
 Usage:
     python -m scripts.seed_name_library                # all sources
     python -m scripts.seed_name_library --only fantasynames pynames
     python -m scripts.seed_name_library --per-theme 500
     python -m scripts.seed_name_library --wipe         # clear table first
+    python -m scripts.seed_name_library --restart      # ignore checkpoints
 
 Sources:
     fantasynames   pip install fantasynames
@@ -20,14 +36,20 @@ Sources:
 from __future__ import annotations
 
 import argparse
+import queue
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
+from sqlalchemy import insert
 from sqlalchemy.orm import sessionmaker
 
-from app.orm import Base, NameLibrary, engine
+from app.orm import Base, NameLibrary, NameLibrarySeedProgress, engine
+from app.services.name_service import bump_library_version
+from app.startup import ensure_table_index_extras
 from scripts.name_sources import (
     iter_babynames,
     iter_fantasynames,
@@ -36,60 +58,180 @@ from scripts.name_sources import (
 )
 
 ALL_SOURCES = ("fantasynames", "pynames", "nomina", "babynames")
+# Sources whose rows differ from run to run; never fast-forwarded by offset.
+RANDOM_SOURCES = ("fantasynames", "pynames")
 BATCH_SIZE = 1000
+# Batches buffered between the producers and the writer. Producers block
+# once it is full, which bounds memory to a few batches per run.
+QUEUE_BATCHES = 8
+
+_COLUMNS = ('source', 'theme', 'gender', 'category', 'name', 'meaning',
+            'origin', 'created_at')
+
+
+def _ensure_schema(bind=engine):
+    """Create the tables (and the dedupe key) if the DB hasn't been migrated yet."""
+    Base.metadata.create_all(bind, tables=[NameLibrary.__table__,
+                                           NameLibrarySeedProgress.__table__])
+    ensure_table_index_extras(bind)
+
 
+def _insert_ignoring_duplicates(dialect_name):
+    """A NameLibrary INSERT that skips rows colliding with the unique key.
 
-def _ensure_schema():
-    """Create the table if a fresh DB hasn't been migrated yet."""
-    Base.metadata.create_all(engine, tables=[NameLibrary.__table__])
+    Executed with a list of rows; PyMySQL folds that into one multi-row
+    ``INSERT ... VALUES (...), (...) ON DUPLICATE KEY UPDATE`` statement.
+    The no-op update is used instead of ``INSERT IGNORE`` so data errors
+    (an over-long name, say) still fail loudly instead of becoming warnings.
+    """
+    table = NameLibrary.__table__
+    if dialect_name == 'sqlite':
+        from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+        return sqlite_insert(table).on_conflict_do_nothing()
+    if dialect_name in ('mysql', 'mariadb'):
+        from sqlalchemy.dialects.mysql import insert as mysql_insert
+        stmt = mysql_insert(table)
+        return stmt.on_duplicate_key_update(id=table.c.id)
+    return insert(table)
 
 
-def _bulk_insert(session, rows):
-    if not rows:
-        return 0
-    session.bulk_insert_mappings(NameLibrary, rows)
+def _write_batch(session, name, rows, rows_done):
+    """Insert ``rows`` and advance ``name``'s checkpoint in one transaction.
+
+    The rowcount is not returned: with ``ON DUPLICATE KEY UPDATE`` and
+    PyMySQL's ``CLIENT_FOUND_ROWS`` it counts skipped duplicates too.
+    """
+    stmt = _insert_ignoring_duplicates(session.get_bind().dialect.name)
+    session.execute(stmt, [{c: row.get(c) for c in _COLUMNS} for row in rows])
+    _save_progress(session, name, rows_done=rows_done)
     session.commit()
-    return len(rows)
 
 
-def _dedupe_key(row):
-    return (row['source'], row['theme'], row['gender'], row['category'], row['name'])
+def _save_progress(session, name, *, rows_done=None, completed=False):
+    progress = session.get(NameLibrarySeedProgress, name)
+    if progress is None:
+        progress = NameLibrarySeedProgress(source=name, rows_done=0)
+        session.add(progress)
+    if rows_done is not None:
+        progress.rows_done = rows_done
+    progress.completed = completed
+
+
+def _load_progress(session):
+    return {p.source: p for p in session.query(NameLibrarySeedProgress).all()}
+
+
+def _put(batches, item, stop):
+    while not stop.is_set():
+        try:
+            batches.put(item, timeout=0.5)
+            return True
+        except queue.Full:
+            continue
+    return False
+
 
+def _produce(name, iterator, skip, batches, stop):
+    """Producer: drain ``iterator`` into ``BATCH_SIZE``-row batches.
 
-def _seed_from(name, iterator, session, seen):
-    """Drain ``iterator``, dedupe against ``seen``, batch-insert, report."""
-    print(f"\n[{name}] starting...")
-    started = time.time()
-    buffer, total_new = [], 0
+    The first ``skip`` rows were written by an earlier run and are
+    discarded. Every batch carries the source offset it ends at, which is
+    what the writer checkpoints. Ends with a ``done`` or ``failed`` marker.
+    """
+    offset, buffer = 0, []
     try:
         for row in iterator:
-            row.setdefault('created_at', datetime.now())
-            key = _dedupe_key(row)
-            if key in seen:
+            if stop.is_set():
+                return
+            offset += 1
+            if offset <= skip:
                 continue
-            seen.add(key)
+            row.setdefault('created_at', datetime.now())
             buffer.append(row)
             if len(buffer) >= BATCH_SIZE:
-                total_new += _bulk_insert(session, buffer)
+                if not _put(batches, ('batch', name, buffer, offset), stop):
+                    return
                 buffer = []
-        total_new += _bulk_insert(session, buffer)
     except Exception as e:
-        session.rollback()
-        print(f"[{name}] aborted after {total_new} rows: {e}")
-        return 0
-    print(f"[{name}] inserted {total_new} new rows in "
-          f"{time.time() - started:.1f}s")
-    return total_new
+        print(f"[{name}] aborted after {offset} rows: {e}")
+        _put(batches, ('failed', name, buffer, offset), stop)
+        return
+    _put(batches, ('done', name, buffer, offset), stop)
+
 
+def seed(session_factory, sources, *, restart=False, random_sources=()):
+    """Seed from ``sources`` (``{name: iterator factory}``) in parallel.
+
+    Returns the number of rows the run added to NameLibrary. Sources that
+    raise are left unfinished in the checkpoint table so the next run
+    retries them; those named in ``random_sources`` retry from the start.
+    """
+    session = session_factory()
+    try:
+        progress = {} if restart else _load_progress(session)
+        jobs = {}
+        for name, make_iterator in sources.items():
+            checkpoint = progress.get(name)
+            if checkpoint is not None and checkpoint.completed:
+                print(f"[{name}] already complete; skipping.")
+                continue
+            skip = 0
+            if checkpoint is not None and name not in random_sources:
+                skip = checkpoint.rows_done
+            _save_progress(session, name, rows_done=skip)
+            jobs[name] = (make_iterator, skip)
+        session.commit()
+        if not jobs:
+            return 0
 
-def _load_existing_keys(session):
-    """Pre-load keys already in the DB so re-runs are idempotent."""
-    keys = set()
-    q = session.query(NameLibrary.source, NameLibrary.theme,
-                      NameLibrary.gender, NameLibrary.category, NameLibrary.name)
-    for row in q.yield_per(5000):
-        keys.add(tuple(row))
-    return keys
+        rows_before = session.query(NameLibrary).count()
+        batches = queue.Queue(maxsize=QUEUE_BATCHES)
+        stop = threading.Event()
+        started = {name: time.time() for name in jobs}
+        written = {name: 0 for name in jobs}
+        broken = set()
+        remaining = len(jobs)
+        with ThreadPoolExecutor(max_workers=len(jobs),
+                                thread_name_prefix='namelib-source') as pool:
+            for name, (make_iterator, skip) in jobs.items():
+                if skip:
+                    print(f"[{name}] resuming after {skip} rows...")
+                else:
+                    print(f"[{name}] starting...")
+                pool.submit(_produce, name, make_iterator(), skip, batches, stop)
+            try:
+                while remaining:
+                    kind, name, rows, offset = batches.get()
+                    if rows and name not in broken:
+                        try:
+                            _write_batch(session, name, rows, offset)
+                            written[name] += len(rows)
+                        except Exception as e:
+                            # Later batches would move the checkpoint past
+                            # these rows, so drop the rest of this source.
+                            session.rollback()
+                            broken.add(name)
+                            print(f"[{name}] write failed after {written[name]} "
+                                  f"rows: {e}")
+                    if kind == 'batch':
+                        continue
+                    remaining -= 1
+                    if kind == 'done' and name not in broken:
+                        _save_progress(session, name, rows_done=offset, completed=True)
+                        session.commit()
+                        print(f"[{name}] done: {written[name]} rows written in "
+                              f"{time.time() - started[name]:.1f}s")
+                    if written[name]:
+                        # When run in-process (the startup seeding thread),
+                        # let the app's cached theme catalog and name pools
+                        # pick up the source's rows.
+                        bump_library_version()
+            finally:
+                # On an interrupt, unblock producers waiting on a full queue.
+                stop.set()
+        return session.query(NameLibrary).count() - rows_before
+    finally:
+        session.close()
 
 
 def main(argv=None):
@@ -109,45 +251,39 @@ def main(argv=None):
                         help="BabyNames API base URL")
     parser.add_argument("--wipe", action="store_true",
                         help="Delete every existing NameLibrary row first")
+    parser.add_argument("--restart", action="store_true",
+                        help="Ignore checkpoints from earlier runs")
     args = parser.parse_args(argv)
 
     _ensure_schema()
     Session = sessionmaker(bind=engine)
-    session = Session()
 
     if args.wipe:
-        deleted = session.query(NameLibrary).delete()
-        session.commit()
+        session = Session()
+        try:
+            deleted = session.query(NameLibrary).delete()
+            session.query(NameLibrarySeedProgress).delete()
+            session.commit()
+        finally:
+            session.close()
+        bump_library_version()
         print(f"Wiped {deleted} existing NameLibrary rows.")
 
-    seen = _load_existing_keys(session)
-    print(f"Loaded {len(seen)} existing keys for dedupe.")
-
-    grand_total = 0
-    if "fantasynames" in args.only:
-        grand_total += _seed_from(
-            "fantasynames",
-            iter_fantasynames(per_theme=args.per_theme),
-            session, seen)
-    if "pynames" in args.only:
-        grand_total += _seed_from(
-            "pynames",
-            iter_pynames(per_theme=args.per_theme),
-            session, seen)
-    if "nomina" in args.only:
-        grand_total += _seed_from(
-            "nomina",
-            iter_nomina_names(args.nomina_path),
-            session, seen)
-    if "babynames" in args.only:
-        grand_total += _seed_from(
-            "babynames",
-            iter_babynames(args.babynames_base),
-            session, seen)
-
-    print(f"\nDone. Inserted {grand_total} new rows total. "
-          f"Library now has {session.query(NameLibrary).count()} rows.")
-    session.close()
+    iterators = {
+        "fantasynames": lambda: iter_fantasynames(per_theme=args.per_theme),
+        "pynames": lambda: iter_pynames(per_theme=args.per_theme),
+        "nomina": lambda: iter_nomina_names(args.nomina_path),
+        "babynames": lambda: iter_babynames(args.babynames_base),
+    }
+    grand_total = seed(Session, {name: iterators[name] for name in args.only},
+                       restart=args.restart, random_sources=RANDOM_SOURCES)
+
+    session = Session()
+    try:
+        print(f"\nDone. Inserted {grand_total} new rows total. "
+              f"Library now has {session.query(NameLibrary).count()} rows.")
+    finally:
+        session.close()
     return 0
 
 
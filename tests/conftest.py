@@ -12,13 +12,15 @@ Optional environment variables:
                         (default: grok-4-1-fast-non-reasoning).
 """
 import os
+from contextlib import contextmanager
 from datetime import datetime
 
 import pytest
 from dotenv import load_dotenv
+from flask import Flask
 from openai import OpenAI
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.pool import StaticPool
 
 from app.orm import Base, Seed
@@ -97,3 +99,40 @@ def seed_in_db(db_session):
     db_session.add(seed)
     db_session.commit()
     return seed
+
+
+@pytest.fixture
+def app_ctx():
+    """A bare Flask app context for helpers that log through ``current_app``."""
+    with Flask(__name__).app_context() as ctx:
+        yield ctx
+
+
+@pytest.fixture
+def count_queries():
+    """Record the SQL issued inside ``with count_queries(bind) as statements:``.
+
+    ``bind`` is a session, a session factory or an engine. ``match`` keeps
+    only statements containing that text (case-insensitive).
+    """
+    @contextmanager
+    def _count(bind, match=None):
+        if isinstance(bind, Session):
+            engine = bind.get_bind()
+        elif isinstance(bind, sessionmaker):
+            engine = bind.kw['bind']
+        else:
+            engine = bind
+        statements = []
+
+        def _record(conn, cursor, statement, *args):
+            if match is None or match.lower() in statement.lower():
+                statements.append(statement)
+
+        event.listen(engine, 'before_cursor_execute', _record)
+        try:
+            yield statements
+        finally:
+            event.remove(engine, 'before_cursor_execute', _record)
+
+    return _count
@@ -1,10 +1,17 @@
+import threading
+
 import pytest
 from unittest.mock import MagicMock
 
-from app.orm import Character, Event, EventCharacter, NameLibrary
+from sqlalchemy import event
+
+from app.orm import (
+    Character, CharacterItem, CharacterSkill, CharacterStatus, Event,
+    EventCharacter, Location, NameLibrary,
+)
 from app.services.name_service import NameService
 from app.world_building.character_builder import CharacterBuilder
-from app.world_building.schemas import EventOut, MainCharacterOut
+from app.world_building.schemas import EventOut, MainCharacterOut, NPCListOut
 
 
 @pytest.fixture
@@ -50,6 +57,119 @@ def test_create_surrounding_characters_no_locations(seed_data, db_session, seed_
     assert hasattr(builder, 'NPCs_data')
 
 
+def _npc_builder(seed_data, db_session, seed_id, npc_count):
+    town = Location(seed_id=seed_id, name='Town', type='city')
+    db_session.add(town)
+    db_session.commit()
+    service = MagicMock()
+    service.get_structured.return_value = NPCListOut.model_validate({'npcs': [
+        {
+            'name': f'NPC {i}', 'race': 'Elf', 'gender': 'female',
+            'event': {'name': f'Errand {i}'},
+            'skills': [{'name': 'Haggling'}, {'name': 'Tracking'}],
+            'statuses': [{'name': 'Rested', 'duration': 60}],
+            'items': [{'name': 'Lantern'}, {'name': 'Rope'}, {'name': 'Coin'}],
+        }
+        for i in range(npc_count)
+    ]})
+    builder = CharacterBuilder(seed_data, seed_id, db_session, service)
+    builder.locations = [{'id': town.id, 'name': 'Town'}]
+    return builder, town
+
+
+def test_create_surrounding_characters_persists_npcs_in_one_commit(
+        seed_data, db_session, seed_in_db):
+    builder, town = _npc_builder(seed_data, db_session, seed_in_db.id, npc_count=4)
+    commits = []
+    record = commits.append
+    event.listen(db_session, 'after_commit', record)
+    try:
+        result = builder.create_surrounding_characters()
+    finally:
+        event.remove(db_session, 'after_commit', record)
+
+    assert result['status'] == 'success'
+    assert len(commits) == 1
+    assert [n['name'] for n in builder.NPCs_data] == [f'NPC {i}' for i in range(4)]
+    assert all(n['location_id'] == town.id for n in builder.NPCs_data)
+    npc = db_session.query(Character).filter(Character.name == 'NPC 2').one()
+    assert db_session.query(CharacterSkill).filter_by(character_id=npc.id).count() == 2
+    assert db_session.query(CharacterStatus).filter_by(character_id=npc.id).count() == 1
+    assert db_session.query(CharacterItem).filter_by(character_id=npc.id).count() == 3
+    link = db_session.query(EventCharacter).filter_by(character_id=npc.id).one()
+    assert link.event.name == 'Errand 2'
+    assert link.event.location_id == town.id
+
+
+def test_create_surrounding_characters_falls_back_per_npc(
+        seed_data, db_session, seed_in_db, monkeypatch):
+    builder, _ = _npc_builder(seed_data, db_session, seed_in_db.id, npc_count=3)
+    real_flush = db_session.flush
+    calls = []
+
+    def flaky_flush(*args, **kwargs):
+        calls.append(1)
+        if len(calls) == 1:
+            raise RuntimeError('bulk insert rejected')
+        return real_flush(*args, **kwargs)
+
+    monkeypatch.setattr(db_session, 'flush', flaky_flush)
+    drawn = iter(['Aelin', 'Brisa', 'Caelu', 'Dorna', 'Evra', 'Fenna'])
+    draw = MagicMock(side_effect=lambda *args, **kwargs: next(drawn))
+    monkeypatch.setattr(builder, '_seeded_name_or_none', draw)
+    builder.create_surrounding_characters()
+
+    assert len(builder.NPCs_data) == 3
+    assert db_session.query(Character).filter(
+        Character.main_character == False).count() == 3  # noqa: E712
+    # The per-NPC retry keeps the names the bulk attempt drew.
+    assert draw.call_count == 3
+    assert [n['name'] for n in builder.NPCs_data] == ['Aelin', 'Brisa', 'Caelu']
+
+
+def test_create_surrounding_characters_persists_each_location_as_it_lands(
+        seed_data, db_session, seed_in_db):
+    town = Location(seed_id=seed_in_db.id, name='Town', type='city')
+    mill = Location(seed_id=seed_in_db.id, name='Mill', type='building')
+    db_session.add_all([town, mill])
+    db_session.commit()
+    mill_settled = threading.Event()
+
+    def get_structured(prompt, schema, **kwargs):
+        # Town's batch is held back until Mill's NPCs are already written,
+        # which only happens if each location persists on its own.
+        if 'Town' in prompt:
+            assert mill_settled.wait(timeout=5)
+        name = 'Tomas' if 'Town' in prompt else 'Mira'
+        return NPCListOut.model_validate({'npcs': [{'name': name}]})
+
+    progress = []
+
+    def callback(msg, status='info'):
+        progress.append(msg)
+        if 'Mill' in msg:
+            mill_settled.set()
+
+    service = MagicMock()
+    service.get_structured.side_effect = get_structured
+    builder = CharacterBuilder(seed_data, seed_in_db.id, db_session, service, callback)
+    builder.locations = [{'id': town.id, 'name': 'Town'}, {'id': mill.id, 'name': 'Mill'}]
+    commits = []
+    record = commits.append
+    event.listen(db_session, 'after_commit', record)
+    try:
+        result = builder.create_surrounding_characters()
+    finally:
+        event.remove(db_session, 'after_commit', record)
+
+    assert result['status'] == 'success'
+    assert len(commits) == 2
+    assert progress == ['Populated Mill with 1 characters.',
+                        'Populated Town with 1 characters.']
+    # Completion order is folded back into location order.
+    assert [n['name'] for n in builder.NPCs_data] == ['Tomas', 'Mira']
+
+
 # --------------------------------------------------------------------- #
 # _seed_data_has_name                                                    #
 # --------------------------------------------------------------------- #
@@ -0,0 +1,111 @@
+"""Tests for the per-seed character name index.
+
+TTS voice resolution and dialogue attribution read speaker names from
+``character_index`` instead of querying ``Character`` per line.
+"""
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app.orm import Character, Location, Seed
+from app.routes import (
+    _create_dynamic_character, _resolve_dialogue_speaker, _resolve_voice_id_for_speaker,
+)
+from app.scenarios.base import lookup_characters_by_name
+from app.services import character_index, elevenlabs_service
+from app.world_building.character_builder import CharacterBuilder
+from app.world_building.schemas import NPCOut
+
+
+@pytest.fixture
+def cast(db_session):
+    db_session.add(Seed(id=1, current_turn=1, created_at=datetime.now(),
+                        updated_at=datetime.now()))
+    db_session.commit()
+    db_session.add_all([
+        Character(seed_id=1, main_character=True, alive=True, name='Hero',
+                  race='Human', level=1),
+        Character(seed_id=1, main_character=False, alive=True, name='Lyra Aldun',
+                  race='Elf', level=1, voice_id='vid-lyra'),
+        Character(seed_id=1, main_character=False, alive=True, name='Lyra Venn',
+                  race='Elf', level=1, voice_id='vid-venn'),
+        Character(seed_id=1, main_character=False, alive=True, name='Marek',
+                  race='Dwarf', level=1, voice_id='vid-marek'),
+    ])
+    db_session.commit()
+
+
+def test_speaker_voices_resolve_from_the_index(db_session, cast, count_queries):
+    assert _resolve_voice_id_for_speaker(db_session, 1, 'Marek') == 'vid-marek'
+    with count_queries(db_session, match='from characters') as statements:
+        voices = [_resolve_voice_id_for_speaker(db_session, 1, speaker)
+                  for speaker in ['lyra aldun ', 'Lyra', 'Lyra the Bold', 'Lyra Venn',
+                                  'Hero', 'Stranger', 'Narrator'] * 3]
+    assert statements == []
+    narrator = elevenlabs_service.NARRATOR_VOICE_ID
+    assert voices[:7] == ['vid-lyra', 'vid-lyra', 'vid-lyra', 'vid-venn',
+                          narrator, narrator, narrator]
+
+
+def test_dialogue_speakers_resolve_without_queries(db_session, cast, count_queries):
+    character_index.for_seed(db_session, 1)
+    with count_queries(db_session, match='from characters') as statements:
+        assert _resolve_dialogue_speaker(db_session, 1, ' marek ') == 'Marek'
+        assert _resolve_dialogue_speaker(db_session, 1, 'lyra') == 'Lyra Aldun'
+        assert _resolve_dialogue_speaker(db_session, 1, 'Ghost') == 'Ghost'
+    assert statements == []
+
+
+def test_renamed_dynamic_character_keeps_its_llm_name_as_alias(app_ctx, db_session, cast, count_queries):
+    names = MagicMock()
+    names.get_themes_for_seed.return_value = [{'source': 's', 'theme': 't'}]
+    names.random_name.return_value = 'Aelar'
+    payload = SimpleNamespace(name='Bram Holt', gender=True, race='Human',
+                              date_of_birth=None, description=None)
+    char = _create_dynamic_character(db_session, 1, payload, name_service=names)
+    assert char.name == 'Aelar'
+    with count_queries(db_session, match='from characters') as statements:
+        assert _resolve_dialogue_speaker(db_session, 1, 'Bram Holt') == 'Aelar'
+        assert _resolve_dialogue_speaker(db_session, 1, 'bram') == 'Aelar'
+        # Same name again is recognised as an existing character.
+        assert _create_dynamic_character(db_session, 1, SimpleNamespace(
+            name='aelar', gender=True, race='Human', date_of_birth=None,
+            description=None)) is None
+    assert statements == []
+
+
+def test_scenario_lookup_loads_only_matched_rows(db_session, cast):
+    assert [c.name for c in lookup_characters_by_name(
+        db_session, 1, ['marek', 'Lyra Venn', 'Nobody', 'Marek'])] == ['Marek', 'Lyra Venn']
+    # No full-name match: fall back to first names.
+    assert [c.name for c in lookup_characters_by_name(
+        db_session, 1, ['Lyra the Bold'])] == ['Lyra Aldun']
+    assert lookup_characters_by_name(db_session, 1, ['', None]) == []
+
+
+def test_world_built_npcs_join_a_loaded_index(db_session, cast, count_queries):
+    character_index.for_seed(db_session, 1)
+    builder = CharacterBuilder({}, 1, db_session, MagicMock())
+    npc = NPCOut.model_validate({'name': 'Odo Brisk', 'race': 'Halfling'})
+    town = Location(seed_id=1, name='Town', type='city')
+    db_session.add(town)
+    db_session.commit()
+    builder._persist_npcs([({'id': town.id, 'name': 'Town'}, npc)], ['vid-odo'])
+    with count_queries(db_session, match='from characters') as statements:
+        assert _resolve_voice_id_for_speaker(db_session, 1, 'Odo') == 'vid-odo'
+    assert statements == []
+
+
+def test_dynamic_characters_join_the_cached_index(app_ctx, db_session, cast, count_queries):
+    assert _resolve_voice_id_for_speaker(db_session, 1, 'Ilsa') == \
+        elevenlabs_service.NARRATOR_VOICE_ID
+    payload = SimpleNamespace(name='Ilsa Thorn', gender=False, race='Elf',
+                              date_of_birth=None, description=None)
+    with patch.object(elevenlabs_service, 'find_voice_for_character',
+                      return_value='vid-ilsa'):
+        _create_dynamic_character(db_session, 1, payload, elevenlabs_api_key='k')
+    with count_queries(db_session, match='from characters') as statements:
+        assert _resolve_voice_id_for_speaker(db_session, 1, 'Ilsa') == 'vid-ilsa'
+    assert statements == []
@@ -0,0 +1,79 @@
+"""Tests for the per-seed turn-context cache.
+
+``routes._build_turn_context`` serves the character, locations, roster and
+transcript tail from ``context_cache`` after the first build; the write
+paths patch or invalidate those parts so repeat builds stay cheap and
+correct.
+"""
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from app.orm import Character, Location, Seed
+from app.routes import _build_turn_context, _create_dynamic_character
+from app.services import context_cache, transcript_service
+
+
+@pytest.fixture
+def world(db_session):
+    db_session.add(Seed(id=1, current_turn=1, created_at=datetime.now(),
+                        updated_at=datetime.now()))
+    db_session.commit()
+    hamlet = Location(seed_id=1, name='Hamlet', type='village', terrain='plains')
+    keep = Location(seed_id=1, name='Keep', type='fortress', terrain='hills')
+    db_session.add_all([hamlet, keep])
+    db_session.flush()
+    db_session.add(Character(seed_id=1, main_character=True, alive=True,
+                             name='Hero', race='Human', level=1,
+                             current_health=10, max_health=10,
+                             current_location_id=hamlet.id))
+    db_session.add(Character(seed_id=1, main_character=False, alive=True,
+                             name='Marek', race='Dwarf', gender=True, level=1))
+    db_session.commit()
+    return {'hamlet': hamlet, 'keep': keep}
+
+
+def test_repeat_build_only_reads_clock_and_news(app_ctx, db_session, world, count_queries):
+    first = _build_turn_context(db_session, 1)
+    with count_queries(db_session) as statements:
+        second = _build_turn_context(db_session, 1)
+    assert second == first
+    # Seed row for the clock + the off-screen events query, nothing else.
+    assert len(statements) == 2
+
+
+def test_transcript_writes_patch_the_cached_tail(app_ctx, db_session, session_factory, world,
+                                                 count_queries):
+    _build_turn_context(db_session, 1)
+    transcript_service.add_entry(session_factory, 1, transcript_service.KIND_NARRATION,
+                                 'Rain falls.', speaker='Narrator')
+    transcript_service.add_entry(session_factory, 1, transcript_service.KIND_SYSTEM,
+                                 'Autosaved.')
+    with count_queries(db_session) as statements:
+        context = _build_turn_context(db_session, 1)
+    assert context['transcript'] == '[Narrator] Rain falls.'
+    assert not any('transcriptentries' in s.lower() for s in statements)
+
+
+def test_dynamic_character_is_appended_to_roster(app_ctx, db_session, world):
+    _build_turn_context(db_session, 1)
+    payload = SimpleNamespace(name='Ilsa', gender=False, race='Elf',
+                              date_of_birth=None, description=None)
+    _create_dynamic_character(db_session, 1, payload)
+    context = _build_turn_context(db_session, 1)
+    assert 'Ilsa, Elf, female' in context['existing_characters']
+    assert 'Marek, Dwarf, male' in context['existing_characters']
+
+
+def test_invalidating_location_rereads_current_location(app_ctx, db_session, world):
+    assert _build_turn_context(db_session, 1)['starting_location']['name'] == 'Hamlet'
+    mc = db_session.query(Character).filter(Character.main_character == True).one()  # noqa: E712
+    mc.current_location_id = world['keep'].id
+    db_session.commit()
+    context_cache.invalidate(db_session.get_bind(), 1,
+                             context_cache.PART_CHARACTER,
+                             context_cache.PART_CURRENT_LOCATION)
+    context = _build_turn_context(db_session, 1)
+    assert context['starting_location']['name'] == 'Keep'
+    assert [l['name'] for l in context['other_locations']] == ['Hamlet']
@@ -5,6 +5,9 @@ real ElevenLabs calls. The route is mounted on a bare Flask app (mirroring
 the other route tests) and the underlying service is stubbed so each test
 asserts a single behaviour.
 """
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from unittest.mock import MagicMock, patch
 
@@ -18,6 +21,14 @@ from app.routes import main as main_blueprint
 from app.services import elevenlabs_service
 
 
+@pytest.fixture(autouse=True)
+def _fresh_voice_library_cache():
+    # Each test stubs ``requests.get`` with its own library for key 'k'.
+    elevenlabs_service.clear_voice_library_cache()
+    yield
+    elevenlabs_service.clear_voice_library_cache()
+
+
 # --- Service: helpers --------------------------------------------------------
 
 def test_gender_label_maps_legacy_boolean():
@@ -166,6 +177,74 @@ def test_find_voice_spreads_voices_across_characters_with_distinct_traits():
     assert len(chosen) > 1
 
 
+def test_voice_index_matches_terms_inside_words():
+    index = elevenlabs_service._VoiceIndex([
+        {'voice_id': 'smith', 'labels': {'gender': 'male', 'descriptive': 'Blacksmith, gruff'}},
+        {'voice_id': 'bard', 'labels': {'gender': 'male', 'descriptive': 'lilting'}},
+    ])
+    assert index.term_mask('smith') == 0b01
+    assert index.term_mask('gruff') == 0b01
+    assert index.term_mask('harp') == 0
+    assert index.best_candidates('male', None, ['smith'])[0] == (110, 0)
+
+
+def test_voice_index_relaxes_tier_when_penalties_sink_every_voice():
+    """Penalties can push every voice below zero; the pick must fall
+    through to the first tier that still has a candidate."""
+    index = elevenlabs_service._VoiceIndex([
+        {'voice_id': 'mystery', 'labels': {'age': 'old'}},
+        {'voice_id': 'woman', 'labels': {'gender': 'female', 'age': 'young'}},
+    ])
+    # Gender mismatch rules out 'woman' and 'mystery' scores -5 even on the
+    # gender-only tier, so only the trait-free tier is left.
+    assert index.best_candidates('male', 'young', []) == [(0, 0), (0, 1)]
+    index = elevenlabs_service._VoiceIndex([
+        {'voice_id': 'mystery', 'labels': {'age': 'old'}},
+    ])
+    assert index.best_candidates(None, 'young', ['elf']) == [(0, 0)]
+
+
+def test_find_voice_fetches_library_once_per_key():
+    voices = [{'voice_id': f'male-{i}', 'labels': {'gender': 'male'}} for i in range(3)]
+    with patch.object(elevenlabs_service.requests, 'get',
+                      return_value=_voices_response(voices)) as get:
+        for race in ('elf', 'dwarf', 'human'):
+            assert elevenlabs_service.find_voice_for_character(
+                'k', gender=True, race=race) is not None
+        assert get.call_count == 1
+        elevenlabs_service.find_voice_for_character('other-key', gender=True)
+        assert get.call_count == 2
+
+
+def test_find_voice_refetches_library_after_ttl(monkeypatch):
+    voices = [{'voice_id': 'male-1', 'labels': {'gender': 'male'}}]
+    now = [1000.0]
+    monkeypatch.setattr(elevenlabs_service.time, 'monotonic', lambda: now[0])
+    with patch.object(elevenlabs_service.requests, 'get',
+                      return_value=_voices_response(voices)) as get:
+        elevenlabs_service.find_voice_for_character('k', gender=True)
+        now[0] += elevenlabs_service._LIBRARY_TTL_SECONDS + 1
+        elevenlabs_service.find_voice_for_character('k', gender=True)
+    assert get.call_count == 2
+
+
+def test_find_voice_concurrent_lookups_share_one_fetch():
+    voices = [{'voice_id': 'male-1', 'labels': {'gender': 'male'}}]
+    release = threading.Event()
+
+    def slow_get(*args, **kwargs):
+        release.wait(timeout=5)
+        return _voices_response(voices)
+
+    with patch.object(elevenlabs_service.requests, 'get', side_effect=slow_get) as get:
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            futures = [pool.submit(elevenlabs_service.find_voice_for_character,
+                                   'k', gender=True) for _ in range(4)]
+            release.set()
+            assert [f.result() for f in futures] == ['male-1'] * 4
+    assert get.call_count == 1
+
+
 # --- Service: synthesize -----------------------------------------------------
 
 def test_synthesize_returns_none_for_empty_text():
@@ -197,6 +276,43 @@ def test_synthesize_calls_api_and_writes_cache(tmp_path):
         assert fh.read() == b'audio-bytes'
 
 
+def test_synthesize_evicts_least_recently_used_without_rescanning(tmp_path):
+    cache_dir = str(tmp_path)
+    fake = MagicMock(ok=True, content=b'12345')
+    with patch.object(elevenlabs_service.requests, 'post', return_value=fake):
+        for text in ('one', 'two'):
+            elevenlabs_service.synthesize('k', 'v', text, cache_dir=cache_dir,
+                                          cache_max_files=2)
+        # Replaying 'one' makes 'two' the eviction candidate.
+        elevenlabs_service.synthesize('k', 'v', 'one', cache_dir=cache_dir)
+        with patch.object(elevenlabs_service.os, 'listdir',
+                          side_effect=AssertionError('directory rescanned')):
+            elevenlabs_service.synthesize('k', 'v', 'three', cache_dir=cache_dir,
+                                          cache_max_files=2)
+
+    def cached(text):
+        return os.path.exists(elevenlabs_service._cache_path(cache_dir, 'v', text))
+
+    assert cached('one') and cached('three') and not cached('two')
+    index = elevenlabs_service._cache_index_for(cache_dir)
+    assert len(index) == 2
+    assert index.total_bytes == 10
+
+
+def test_cache_index_rebuilds_recency_from_file_mtimes(tmp_path):
+    for age, name in enumerate(('newest', 'middle', 'oldest')):
+        path = tmp_path / f'{name}.mp3'
+        path.write_bytes(b'x' * 4)
+        os.utime(path, (1000 - age, 1000 - age))
+    (tmp_path / 'notes.txt').write_text('keep me')
+
+    index = elevenlabs_service._TTSCacheIndex(str(tmp_path))
+    assert index.total_bytes == 12
+    index.evict(max_bytes=8, max_files=10)
+    assert sorted(p.name for p in tmp_path.iterdir()) == ['middle.mp3', 'newest.mp3',
+                                                           'notes.txt']
+
+
 # --- Route: /api/tts/<seed_id>/<entry_id> -----------------------------------
 
 @pytest.fixture
@@ -207,8 +323,8 @@ def session_factory():
 
 
 @pytest.fixture
-def client(session_factory):
-    flask_app = Flask(__name__)
+def client(session_factory, tmp_path):
+    flask_app = Flask(__name__, instance_path=str(tmp_path))
     flask_app.config['SESSION_FACTORY'] = session_factory
     flask_app.register_blueprint(main_blueprint)
     return flask_app.test_client()
@@ -237,14 +353,15 @@ def test_tts_route_returns_404_for_unknown_entry(client):
 
 def test_tts_route_returns_503_when_synthesis_fails(client, session_factory):
     _seed_with_entry(session_factory, speaker='Narrator')
-    with patch.object(elevenlabs_service, 'synthesize', return_value=None):
+    with patch.object(elevenlabs_service, 'stream_synthesis', return_value=None):
         resp = client.get('/api/tts/1/42')
     assert resp.status_code == 503
 
 
 def test_tts_route_uses_narrator_voice_for_narrator(client, session_factory):
     _seed_with_entry(session_factory, speaker='Narrator')
-    with patch.object(elevenlabs_service, 'synthesize', return_value=b'mp3') as syn:
+    with patch.object(elevenlabs_service, 'stream_synthesis',
+                      return_value=iter([b'm', b'p3'])) as syn:
         resp = client.get('/api/tts/1/42')
     assert resp.status_code == 200
     assert resp.data == b'mp3'
@@ -254,7 +371,88 @@ def test_tts_route_uses_narrator_voice_for_narrator(client, session_factory):
 
 def test_tts_route_resolves_character_voice_for_named_speaker(client, session_factory):
     _seed_with_entry(session_factory, speaker='Marlow', character_voice_id='vid-marlow')
-    with patch.object(elevenlabs_service, 'synthesize', return_value=b'ok') as syn:
+    with patch.object(elevenlabs_service, 'stream_synthesis',
+                      return_value=iter([b'ok'])) as syn:
         resp = client.get('/api/tts/1/42')
     assert resp.status_code == 200
     assert syn.call_args.args[1] == 'vid-marlow'
+
+
+def _streaming_post(chunks, *, fail_after=None):
+    fake = MagicMock(ok=True)
+
+    def iter_content(chunk_size=None):
+        for i, chunk in enumerate(chunks):
+            if fail_after is not None and i == fail_after:
+                raise elevenlabs_service.requests.ConnectionError('reset')
+            yield chunk
+
+    fake.iter_content.side_effect = iter_content
+    return fake
+
+
+def test_tts_route_streams_miss_and_tees_it_into_the_cache(client, session_factory, tmp_path):
+    _seed_with_entry(session_factory, speaker='Narrator')
+    with patch('app.routes._extract_elevenlabs_api_key', return_value='k'), \
+            patch.object(elevenlabs_service.requests, 'post',
+                         return_value=_streaming_post([b'abc', b'def'])) as post:
+        resp = client.get('/api/tts/1/42')
+        assert resp.status_code == 200
+        assert resp.data == b'abcdef'
+    assert post.call_args.kwargs['stream'] is True
+    assert 'ETag' not in resp.headers
+    assert resp.headers['Cache-Control'] == 'no-store'
+    cached = elevenlabs_service._cache_path(str(tmp_path / 'tts_cache'),
+                                            elevenlabs_service.NARRATOR_VOICE_ID,
+                                            'Hello there.')
+    with open(cached, 'rb') as fh:
+        assert fh.read() == b'abcdef'
+
+
+def test_stream_synthesis_discards_partial_audio(tmp_path):
+    with patch.object(elevenlabs_service.requests, 'post',
+                      return_value=_streaming_post([b'abc', b'def'], fail_after=1)):
+        chunks = list(elevenlabs_service.stream_synthesis(
+            'k', 'v', 'hello', cache_dir=str(tmp_path)))
+    assert chunks == [b'abc']
+    assert os.listdir(tmp_path) == []
+
+
+def test_tts_route_serves_cache_hits_with_etag_and_ranges(client, session_factory, tmp_path):
+    _seed_with_entry(session_factory, speaker='Narrator')
+    cache_dir = tmp_path / 'tts_cache'
+    cache_dir.mkdir()
+    voice = elevenlabs_service.NARRATOR_VOICE_ID
+    with open(elevenlabs_service._cache_path(str(cache_dir), voice, 'Hello there.'), 'wb') as fh:
+        fh.write(b'0123456789')
+
+    with patch.object(elevenlabs_service.requests, 'post') as post:
+        full = client.get('/api/tts/1/42')
+        partial = client.get('/api/tts/1/42', headers={'Range': 'bytes=2-5'})
+        revalidated = client.get('/api/tts/1/42',
+                                 headers={'If-None-Match': full.headers['ETag']})
+    assert not post.called
+    assert full.status_code == 200 and full.data == b'0123456789'
+    assert full.headers['ETag'] == '"%s"' % elevenlabs_service.audio_cache_key(
+        voice, 'Hello there.')
+    assert full.headers['Cache-Control'] == 'private, max-age=86400'
+    assert partial.status_code == 206 and partial.data == b'2345'
+    assert revalidated.status_code == 304
+
+
+def test_tts_route_waits_for_an_in_flight_prefetch(client, session_factory, tmp_path):
+    _seed_with_entry(session_factory, speaker='Narrator')
+    voice = elevenlabs_service.NARRATOR_VOICE_ID
+    cached = elevenlabs_service._cache_path(str(tmp_path / 'tts_cache'), voice, 'Hello there.')
+
+    def finish_prefetch(voice_id, text, timeout):
+        with open(cached, 'wb') as fh:
+            fh.write(b'prefetched')
+        return True
+
+    with patch('app.routes.tts_prefetch.wait_for', side_effect=finish_prefetch), \
+            patch.object(elevenlabs_service, 'stream_synthesis') as stream:
+        resp = client.get('/api/tts/1/42')
+    assert resp.status_code == 200
+    assert resp.data == b'prefetched'
+    assert not stream.called
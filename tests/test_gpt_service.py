@@ -0,0 +1,97 @@
+"""Tests for GPTService's async mode and concurrent structured fan-out.
+
+The async client is faked with a tiny object exposing the same
+``chat.completions.create`` coroutine surface as ``AsyncOpenAI``.
+"""
+import asyncio
+import json
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from pydantic import BaseModel
+
+from app.services import gpt_service
+from app.services.gpt_service import GPTService
+
+
+class _Out(BaseModel):
+    value: int
+
+
+def _completion(text):
+    return SimpleNamespace(choices=[SimpleNamespace(
+        message=SimpleNamespace(content=text))])
+
+
+class _FakeAsyncClient:
+    """Answers each prompt with ``{"value": <len(prompt)>}``.
+
+    ``gate`` makes every call wait until ``expected`` calls are in flight at
+    once, which only succeeds if the caller really fans them out.
+    """
+
+    def __init__(self, expected=1):
+        self.expected = expected
+        self.in_flight = 0
+        self.calls = []
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+        self._gate = None
+
+    async def _create(self, **kwargs):
+        if self._gate is None:
+            self._gate = asyncio.Event()
+        prompt = kwargs['messages'][0]['content']
+        self.calls.append(kwargs)
+        self.in_flight += 1
+        if self.in_flight >= self.expected:
+            self._gate.set()
+        await asyncio.wait_for(self._gate.wait(), timeout=2)
+        if prompt == 'bad':
+            return _completion('not json')
+        return _completion(json.dumps({'value': len(prompt)}))
+
+
+def test_get_structured_many_runs_calls_concurrently():
+    fake = _FakeAsyncClient(expected=3)
+    service = GPTService(MagicMock(), 'm', async_openai=fake)
+    results = service.run_structured_many([
+        {'prompt': 'a', 'schema': _Out},
+        {'prompt': 'bb', 'schema': _Out},
+        {'prompt': 'ccc', 'schema': _Out, 'temperature': 0.5},
+    ], timeout=5)
+    assert [r.value for r in results] == [1, 2, 3]
+    assert fake.calls[2]['temperature'] == 0.5
+    assert all(c['response_format'] == {'type': 'json_object'} for c in fake.calls)
+
+
+def test_get_structured_many_isolates_failures():
+    fake = _FakeAsyncClient(expected=1)
+    service = GPTService(MagicMock(), 'm', async_openai=fake)
+    results = service.run_structured_many([
+        {'prompt': 'bad', 'schema': _Out, 'max_attempts': 1},
+        {'prompt': 'ok', 'schema': _Out},
+    ], timeout=5)
+    assert results[0] is None
+    assert results[1].value == 2
+
+
+def test_async_mode_falls_back_to_sync_client_on_worker_thread():
+    sync_client = MagicMock()
+    sync_client.chat.completions.create.return_value = _completion('{"value": 7}')
+    service = GPTService(sync_client, 'm')
+    result = gpt_service.run_coroutine(service.aget_structured('p', _Out), timeout=5)
+    assert result.value == 7
+    assert sync_client.chat.completions.create.called
+
+
+def test_pooled_async_client_is_shared_per_key():
+    first = gpt_service.pooled_async_client('key-a', 'https://example.invalid/v1')
+    again = gpt_service.pooled_async_client('key-a', 'https://example.invalid/v1')
+    other = gpt_service.pooled_async_client('key-b', 'https://example.invalid/v1')
+    assert first is again
+    assert first is not other
+    assert all('key-a' not in str(k) for k in gpt_service._async_clients)
+
+
+def test_pooled_async_client_requires_key():
+    assert gpt_service.pooled_async_client(None, 'https://example.invalid/v1') is None
@@ -0,0 +1,43 @@
+"""Tests for the incremental JSON string-field extractor."""
+import json
+
+from app.services.json_stream import StringFieldStream
+
+
+def _feed_all(field, text, size):
+    stream = StringFieldStream(field)
+    out = ''.join(stream.feed(text[i:i + size]) for i in range(0, len(text), size))
+    return stream, out
+
+
+def test_extracts_top_level_field_across_any_chunking():
+    value = 'First "quoted" line.\n\nSecond \\ line é \U0001F409 end.'
+    text = '```json\n' + json.dumps({
+        'dialogue': [{'speaker': 'A', 'narration': 'nested, ignore me'}],
+        'narration': value,
+        'time_cost_minutes': 5,
+    }) + '\n```'
+    for size in (1, 2, 3, 7, len(text)):
+        stream, out = _feed_all('narration', text, size)
+        assert out == value
+        assert stream.text == value
+        assert stream.done
+
+
+def test_emits_text_before_the_object_closes():
+    stream = StringFieldStream('narration')
+    assert stream.feed('{"narration": "The gate') == 'The gate'
+    assert stream.feed(' creaks') == ' creaks'
+    assert not stream.done
+
+
+def test_ignores_matching_string_values_and_other_fields():
+    text = json.dumps({'title': 'narration', 'count': 3, 'narration': 'ok'})
+    _, out = _feed_all('narration', text, 4)
+    assert out == 'ok'
+
+
+def test_missing_field_yields_nothing():
+    stream, out = _feed_all('narration', '{"dialogue": []}', 3)
+    assert out == ''
+    assert not stream.done
@@ -0,0 +1,112 @@
+"""Tests for exporting and loading NameLibrary snapshots."""
+import gzip
+import json
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.orm import NameLibrary, NameLibrarySeedProgress
+from scripts import name_library_snapshot
+from app.startup import name_library_seed_unfinished
+from scripts.name_library_snapshot import load_snapshot, snapshot_source, write_snapshot
+
+
+def _library(session, count):
+    session.add_all(NameLibrary(source='fantasynames', theme='elf',
+                                gender='female' if i % 2 else 'male',
+                                category='first', name=f'Ael{i}',
+                                meaning='star' if i == 0 else None)
+                    for i in range(count))
+    session.commit()
+
+
+def _rows(session):
+    return sorted((r.source, r.theme, r.gender, r.category, r.name, r.meaning)
+                  for r in session.query(NameLibrary))
+
+
+def _empty_target():
+    return sessionmaker(bind=create_engine(
+        'sqlite:///:memory:', connect_args={'check_same_thread': False},
+        poolclass=StaticPool))
+
+
+def test_snapshot_round_trips_into_an_empty_library(tmp_path, db_session, monkeypatch):
+    monkeypatch.setattr(name_library_snapshot, 'BLOCK_ROWS', 4)
+    _library(db_session, 10)
+    path = tmp_path / 'names.json.gz'
+    assert write_snapshot(db_session, path) == 10
+
+    with gzip.open(path, 'rt', encoding='utf-8') as fh:
+        lines = fh.read().splitlines()
+    assert json.loads(lines[0])['format'] == name_library_snapshot.FORMAT
+    # Header plus three column-oriented blocks of 4, 4 and 2 rows.
+    assert [len(json.loads(line)['name']) for line in lines[1:]] == [4, 4, 2]
+
+    target = _empty_target()
+    assert load_snapshot(target, path) == 10
+    session = target()
+    assert _rows(session) == _rows(db_session)
+    assert session.get(NameLibrarySeedProgress, snapshot_source(path)).completed
+    # Loading again is a no-op.
+    assert load_snapshot(target, path, restart=True) == 0
+
+
+def test_load_rejects_foreign_files(tmp_path, session_factory):
+    path = tmp_path / 'other.json.gz'
+    with gzip.open(path, 'wt') as fh:
+        fh.write(json.dumps({'format': 'something-else'}) + '\n')
+    load_snapshot(session_factory, path)
+    session = session_factory()
+    assert session.query(NameLibrary).count() == 0
+    assert not session.get(NameLibrarySeedProgress, snapshot_source(path)).completed
+
+
+def test_checkpoints_are_keyed_by_snapshot_file(tmp_path, db_session):
+    _library(db_session, 3)
+    first, second = tmp_path / 'first.json.gz', tmp_path / 'second.json.gz'
+    write_snapshot(db_session, first)
+    db_session.add(NameLibrary(source='fantasynames', theme='elf', gender='any',
+                               category='first', name='Brynn'))
+    db_session.commit()
+    write_snapshot(db_session, second)
+    assert snapshot_source(first) != snapshot_source(second)
+    assert snapshot_source(first).startswith('snapshot:')
+    assert len(snapshot_source(first)) <= 32
+
+    target = _empty_target()
+    load_snapshot(target, first)
+    session = target()
+    session.get(NameLibrarySeedProgress, snapshot_source(first)).completed = False
+    session.commit()
+    assert name_library_seed_unfinished(session) == [snapshot_source(first)]
+
+    # A newer file is loaded rather than skipped, and the older file's
+    # checkpoint, which can never be resumed, is dropped.
+    assert load_snapshot(target, second) == 1
+    session.expire_all()
+    assert session.get(NameLibrarySeedProgress, snapshot_source(first)) is None
+    assert session.get(NameLibrarySeedProgress, snapshot_source(second)).completed
+    assert name_library_seed_unfinished(session) == []
+
+
+def test_every_export_gets_its_own_checkpoint(tmp_path, db_session):
+    _library(db_session, 3)
+    first, second = tmp_path / 'first.json.gz', tmp_path / 'second.json.gz'
+    write_snapshot(db_session, first)
+    write_snapshot(db_session, second)
+    # Same rows, same size: only the export id tells them apart.
+    assert snapshot_source(first) != snapshot_source(second)
+    assert snapshot_source(first) == snapshot_source(first)
+
+
+def test_files_without_an_export_id_are_keyed_by_their_contents(tmp_path):
+    older, newer = tmp_path / 'older.json.gz', tmp_path / 'newer.json.gz'
+    header = json.dumps({'format': name_library_snapshot.FORMAT,
+                         'version': name_library_snapshot.FORMAT_VERSION,
+                         'columns': ['name']})
+    for path, name in ((older, 'Ael'), (newer, 'Bry')):
+        with gzip.open(path, 'wt') as fh:
+            fh.write(header + '\n' + json.dumps({'name': [name]}) + '\n')
+    assert snapshot_source(older) != snapshot_source(newer)
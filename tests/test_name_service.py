@@ -3,7 +3,8 @@ from unittest.mock import MagicMock
 
 import pytest
 
-from app.orm import NameLibrary
+from app.orm import Character, NameLibrary
+from app.services import name_service
 from app.services.name_service import NameService
 from app.world_building.schemas import NamingThemeChoice, NamingThemeSelectionOut
 
@@ -47,6 +48,19 @@ def test_list_available_themes_empty_table(db_session):
     assert service.list_available_themes() == []
 
 
+def test_theme_catalog_is_cached_until_the_library_changes(populated_library, count_queries):
+    first = NameService(populated_library).theme_catalog()
+    assert first.prompt == "- fantasynames/elf\n- pynames/scandinavian"
+    with count_queries(populated_library) as statements:
+        assert NameService(populated_library).theme_catalog() is first
+    assert statements == []
+
+    _add(populated_library, source='nomina', theme='dwarf', name='Thorin')
+    populated_library.commit()
+    name_service.bump_library_version()
+    assert ('nomina', 'dwarf') in NameService(populated_library).theme_catalog().pairs
+
+
 def test_select_themes_for_seed_no_gpt_returns_empty(populated_library):
     service = NameService(populated_library, gpt_service=None)
     assert service.select_themes_for_seed({'theme': 'fantasy'}) == []
@@ -153,9 +167,68 @@ def test_random_name_returns_none_when_themes_unmatched(populated_library):
     assert name is None
 
 
+def test_random_name_draws_from_memory_without_repeats(db_session, seed_in_db, count_queries):
+    for i in range(5):
+        _add(db_session, theme='orc', gender='male', name=f'Grosh{i}')
+    db_session.commit()
+    themes = [{'source': 'fantasynames', 'theme': 'orc'}]
+    service = NameService(db_session)
+    assert service.random_name(themes, gender='male', seed_id=seed_in_db.id)
+
+    with count_queries(db_session) as statements:
+        drawn = [service.random_name(themes, gender='male', seed_id=seed_in_db.id)
+                 for _ in range(4)]
+        # A fresh service (another request) shares the loaded pools.
+        extra = NameService(db_session).random_name(
+            themes, gender='male', seed_id=seed_in_db.id)
+    assert statements == []
+    assert len(set(drawn)) == 4
+    # The seed has used every name; draws fall back to repeats, not None.
+    assert extra.startswith('Grosh')
+
+
+def test_seed_draws_exhaust_a_pool_without_repeats(db_session, seed_in_db):
+    for i in range(60):
+        _add(db_session, theme='orc', gender='male', name=f'Grosh{i}')
+    db_session.commit()
+    themes = [{'source': 'fantasynames', 'theme': 'orc'}]
+    service = NameService(db_session)
+
+    drawn = [service.random_name(themes, gender='male', seed_id=seed_in_db.id)
+             for _ in range(60)]
+
+    # Near the end most picks are taken; the leftover scan still finds
+    # every remaining name, and the seed only remembers what it drew.
+    assert sorted(drawn) == sorted(f'Grosh{i}' for i in range(60))
+    draws = name_service._seed_draws.get(db_session.get_bind(), seed_in_db.id)
+    assert draws.used == set(drawn)
+
+
 def test_normalize_gender_handles_bool_and_strings():
     assert NameService._normalize_gender(True) == 'male'
     assert NameService._normalize_gender(False) == 'female'
     assert NameService._normalize_gender('Male') == 'male'
     assert NameService._normalize_gender('nonbinary') == 'any'
     assert NameService._normalize_gender(None) == 'any'
+
+
+def test_evicted_seed_draws_are_rebuilt_from_its_characters(db_session, seed_in_db,
+                                                            monkeypatch):
+    monkeypatch.setattr(name_service, '_seed_draws', name_service.SeedCache(max_seeds=1))
+    for name in ('Grosh', 'Durz', 'Mak'):
+        _add(db_session, theme='orc', gender='male', name=name)
+    db_session.commit()
+    themes = [{'source': 'fantasynames', 'theme': 'orc'}]
+    service = NameService(db_session)
+    first = service.random_name(themes, gender='male', seed_id=seed_in_db.id)
+    db_session.add(Character(seed_id=seed_in_db.id, main_character=False, alive=True,
+                             name=f'{first} Ironhand', race='Orc', level=1))
+    db_session.commit()
+
+    # Another seed's draws push this seed's out of the bounded cache...
+    service.random_name(themes, gender='male', seed_id=999)
+    assert name_service._seed_draws.get(db_session.get_bind(), seed_in_db.id) is None
+    # ...and the rebuilt draws still skip the name its character carries.
+    rest = {service.random_name(themes, gender='male', seed_id=seed_in_db.id)
+            for _ in range(2)}
+    assert rest == {'Grosh', 'Durz', 'Mak'} - {first}
@@ -0,0 +1,93 @@
+"""Tests for the parallel, resumable NameLibrary seeder.
+
+Sources are plain generators; the writer runs against the in-memory
+SQLite database, which enforces the same unique key as MySQL.
+"""
+import pytest
+
+from app.orm import NameLibrary, NameLibrarySeedProgress
+from scripts import seed_name_library
+from scripts.seed_name_library import seed
+
+
+def _rows(source, names, theme='elf'):
+    for name in names:
+        yield {'source': source, 'theme': theme, 'gender': 'any',
+               'category': 'first', 'name': name}
+
+
+@pytest.fixture
+def small_batches(monkeypatch):
+    monkeypatch.setattr(seed_name_library, 'BATCH_SIZE', 2)
+
+
+def _names(session):
+    return sorted(name for name, in session.query(NameLibrary.name))
+
+
+def test_sources_are_deduplicated_by_the_database(session_factory, small_batches):
+    inserted = seed(session_factory, {
+        'alpha': lambda: _rows('alpha', ['Ael', 'Bryn', 'Ael', 'Cora', 'Dain']),
+        'beta': lambda: _rows('beta', ['Ael', 'Eryn']),
+    })
+    session = session_factory()
+    assert inserted == 6
+    assert _names(session) == ['Ael', 'Ael', 'Bryn', 'Cora', 'Dain', 'Eryn']
+    progress = {p.source: (p.rows_done, p.completed)
+                for p in session.query(NameLibrarySeedProgress)}
+    assert progress == {'alpha': (5, True), 'beta': (2, True)}
+
+    # A second run skips completed sources; a restart re-reads them but
+    # the unique key keeps the table unchanged.
+    assert seed(session_factory, {'alpha': lambda: pytest.fail('re-read')}) == 0
+    assert seed(session_factory, {'alpha': lambda: _rows('alpha', ['Ael', 'Bryn'])},
+                restart=True) == 0
+    assert len(_names(session)) == 6
+
+
+def test_failed_source_resumes_after_its_checkpoint(session_factory, small_batches):
+    def flaky():
+        yield from _rows('alpha', ['Ael', 'Bryn', 'Cora'])
+        raise ConnectionError('upstream went away')
+
+    seed(session_factory, {'alpha': flaky,
+                           'beta': lambda: _rows('beta', ['Eryn'])})
+    session = session_factory()
+    assert _names(session) == ['Ael', 'Bryn', 'Cora', 'Eryn']
+    checkpoint = session.get(NameLibrarySeedProgress, 'alpha')
+    assert (checkpoint.rows_done, checkpoint.completed) == (3, False)
+
+    resumed = lambda: _rows('alpha', ['Ael', 'Bryn', 'Cora', 'Dain'])  # noqa: E731
+    assert seed(session_factory, {'alpha': resumed,
+                                  'beta': lambda: pytest.fail('re-read')}) == 1
+    session.expire_all()
+    assert _names(session) == ['Ael', 'Bryn', 'Cora', 'Dain', 'Eryn']
+    assert session.get(NameLibrarySeedProgress, 'alpha').completed
+
+
+def test_random_sources_start_over_instead_of_skipping(session_factory, small_batches):
+    def flaky():
+        yield from _rows('alpha', ['Ael', 'Bryn', 'Cora'])
+        raise ConnectionError('upstream went away')
+
+    seed(session_factory, {'alpha': flaky}, random_sources=('alpha',))
+    # A rerun draws different names; none of them may be skipped as
+    # "already written" by the old offset.
+    redrawn = lambda: _rows('alpha', ['Dain', 'Eryn', 'Ael', 'Fenn'])  # noqa: E731
+    assert seed(session_factory, {'alpha': redrawn}, random_sources=('alpha',)) == 3
+    session = session_factory()
+    assert _names(session) == ['Ael', 'Bryn', 'Cora', 'Dain', 'Eryn', 'Fenn']
+    assert session.get(NameLibrarySeedProgress, 'alpha').completed
+
+
+def test_library_version_is_bumped_once_per_source(session_factory, small_batches,
+                                                   monkeypatch):
+    bumps = []
+    monkeypatch.setattr(seed_name_library, 'bump_library_version',
+                        lambda: bumps.append(1))
+    seed(session_factory, {
+        'alpha': lambda: _rows('alpha', ['Ael', 'Bryn', 'Cora', 'Dain', 'Eryn']),
+        'beta': lambda: _rows('beta', ['Fenn']),
+        'empty': lambda: iter(()),
+    })
+    assert len(bumps) == 2
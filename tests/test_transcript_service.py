@@ -4,7 +4,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 from flask import Flask
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
@@ -62,6 +62,40 @@ def test_add_entry_swallows_errors_and_returns_none():
     assert result is None
 
 
+def test_batch_flush_writes_all_entries_in_one_transaction(factory):
+    batch = transcript_service.TranscriptBatch(factory, 1, turn=4)
+    first = batch.add('arbiter', 'Roll it.', speaker='Arbiter', meta={'dc': 12})
+    batch.add('narration', 'The door gives.', speaker='Narrator')
+    batch.add('dialogue', 'Well done.', speaker='Marek', turn=5)
+    assert first['id'] is None and len(batch) == 3
+
+    commits = []
+    engine = factory().get_bind()
+    event.listen(engine, 'commit', lambda conn: commits.append(conn))
+    views = batch.flush()
+
+    assert len(commits) == 1
+    assert len(batch) == 0
+    assert [v['text'] for v in views] == ['Roll it.', 'The door gives.', 'Well done.']
+    assert views[0] is first and all(v['id'] is not None for v in views)
+    s = factory()
+    out = transcript_service.list_for_seed(s, 1)
+    s.close()
+    assert [e['id'] for e in out] == [v['id'] for v in views]
+    assert [e['turn'] for e in out] == [4, 4, 5]
+    assert out[0]['meta'] == {'dc': 12}
+
+
+def test_batch_flush_swallows_errors(factory):
+    batch = transcript_service.TranscriptBatch(factory, 1)
+    view = batch.add('system', 'fine')
+    # A NOT NULL violation on one row fails the whole flush.
+    batch.add('system', None)
+    assert batch.flush() == []
+    assert view['id'] is None
+    assert transcript_service.TranscriptBatch(factory, 1).flush() == []
+
+
 def test_list_for_seed_returns_entries_in_insertion_order(factory):
     for text in ('first', 'second', 'third'):
         transcript_service.add_entry(
@@ -87,6 +121,62 @@ def test_list_for_seed_isolates_by_seed(factory):
     assert [e['text'] for e in out] == ['two']
 
 
+def test_tail_for_seed_returns_latest_matching_kinds_oldest_first(factory):
+    for i in range(6):
+        transcript_service.add_entry(factory, 1, 'narration', f'beat {i}')
+        transcript_service.add_entry(factory, 1, 'world_building', f'progress {i}')
+    s = factory()
+    out = transcript_service.tail_for_seed(s, 1, {'narration'}, limit=3)
+    everything = transcript_service.tail_for_seed(s, 1, limit=2)
+    s.close()
+    assert [e['text'] for e in out] == ['beat 3', 'beat 4', 'beat 5']
+    assert [e['text'] for e in everything] == ['beat 5', 'progress 5']
+
+
+def test_tail_for_seed_filters_kinds_in_sql(factory, count_queries):
+    transcript_service.add_entry(factory, 1, 'narration', 'keep')
+    s = factory()
+    try:
+        with count_queries(s) as statements:
+            transcript_service.tail_for_seed(s, 1, {'narration', 'dialogue'}, limit=30)
+    finally:
+        s.close()
+    sql = statements[-1].upper()
+    assert 'KIND IN' in sql and 'ORDER BY' in sql and 'DESC' in sql and 'LIMIT' in sql
+
+
+def test_list_for_seed_keyset_cursors(factory):
+    for i in range(5):
+        transcript_service.add_entry(factory, 1, 'narration', f'beat {i}')
+    s = factory()
+    ids = [e['id'] for e in transcript_service.list_for_seed(s, 1)]
+    older = transcript_service.list_for_seed(s, 1, before_id=ids[3], limit=2)
+    newer = transcript_service.list_for_seed(s, 1, after_id=ids[0], limit=2)
+    between = transcript_service.list_for_seed(s, 1, before_id=ids[4], after_id=ids[1])
+    s.close()
+    assert [e['text'] for e in older] == ['beat 1', 'beat 2']
+    assert [e['text'] for e in newer] == ['beat 1', 'beat 2']
+    assert [e['text'] for e in between] == ['beat 2', 'beat 3']
+
+
+def test_page_for_seed_reports_has_more(factory):
+    for i in range(5):
+        transcript_service.add_entry(factory, 1, 'narration', f'beat {i}')
+    s = factory()
+    latest = transcript_service.page_for_seed(s, 1, limit=3)
+    oldest = transcript_service.page_for_seed(
+        s, 1, before_id=latest['entries'][0]['id'], limit=3)
+    forward = transcript_service.page_for_seed(
+        s, 1, after_id=oldest['entries'][0]['id'], limit=3)
+    s.close()
+    assert [e['text'] for e in latest['entries']] == ['beat 2', 'beat 3', 'beat 4']
+    assert latest['has_more'] is True
+    assert [e['text'] for e in oldest['entries']] == ['beat 0', 'beat 1']
+    assert oldest['has_more'] is False
+    assert [e['text'] for e in forward['entries']] == ['beat 1', 'beat 2', 'beat 3']
+    assert forward['has_more'] is True
+
+
 def _make_app(factory):
     app = Flask(__name__)
     app.config['SESSION_FACTORY'] = factory
@@ -210,3 +300,34 @@ def test_world_builder_intro_narration_returns_none_without_locations(factory):
         wb = WorldBuilder({}, 1, MagicMock(), MagicMock(), 'm')
         wb.location_builder.locations = []
         assert wb._create_intro_narration() is None
+
+
+def test_get_world_ships_only_the_latest_transcript_page(factory):
+    total = transcript_service.TRANSCRIPT_PAGE_SIZE + 5
+    for i in range(total):
+        transcript_service.add_entry(factory, 1, 'narration', f'beat {i}')
+
+    client = _make_app(factory).test_client()
+    payload = client.get('/api/world/1').get_json()
+
+    assert len(payload['transcript']) == transcript_service.TRANSCRIPT_PAGE_SIZE
+    assert payload['transcript'][-1]['text'] == f'beat {total - 1}'
+    assert payload['transcript_has_more'] is True
+
+
+def test_transcript_endpoint_pages_backwards(factory):
+    for i in range(5):
+        transcript_service.add_entry(factory, 1, 'narration', f'beat {i}')
+    client = _make_app(factory).test_client()
+
+    latest = client.get('/api/seed/1/transcript?limit=2').get_json()
+    older = client.get(
+        f"/api/seed/1/transcript?limit=2&before_id={latest['entries'][0]['id']}"
+    ).get_json()
+
+    assert [e['text'] for e in latest['entries']] == ['beat 3', 'beat 4']
+    assert [e['text'] for e in older['entries']] == ['beat 1', 'beat 2']
+    assert older['has_more'] is True
+    assert client.get('/api/seed/99/transcript').status_code == 404
+    assert client.get('/api/seed/1/transcript?limit=abc').status_code == 400
+    assert client.get('/api/seed/1/transcript?before_id=x').status_code == 400
@@ -115,6 +115,45 @@ def test_reachable_handles_no_anchor():
     assert tr.reachable_destinations(None, 1, None) == []
 
 
+def test_reachable_is_served_from_the_cached_graph(db_session, seeded_world, count_queries):
+    first = tr.reachable_destinations(db_session, 1, seeded_world['tavern'])
+    with count_queries(db_session) as statements:
+        second = tr.reachable_destinations(db_session, 1, seeded_world['tavern'])
+        tr.reachable_destinations(db_session, 1, seeded_world['keep'])
+    assert second == first
+    assert statements == []
+
+
+def test_find_route_takes_fastest_multi_hop_path(db_session, seeded_world):
+    keep = seeded_world['keep']
+    fort = Location(seed_id=1, name='Fort', type='fortress', terrain='plains',
+                    longitude=0.2, latitude=0.0)
+    island = Location(seed_id=1, name='Island', type='village', terrain='coast',
+                      longitude=5.0, latitude=5.0)
+    db_session.add_all([fort, island])
+    db_session.flush()
+    db_session.add(LocationConnection(seed_id=1, from_location_id=fort.id,
+                                      to_location_id=keep.id, name='Ridge'))
+    db_session.commit()
+    tr.invalidate_graph(db_session.get_bind(), 1)
+
+    route = tr.find_route(db_session, 1, seeded_world['tavern'], fort.id)
+    assert [hop['name'] for hop in route['hops']] == ['Keep', 'Fort']
+    assert route['minutes'] == sum(hop['minutes'] for hop in route['hops'])
+    assert route['hops'][0]['minutes'] == tr.travel_minutes(seeded_world['tavern'], keep)
+    assert tr.find_route(db_session, 1, seeded_world['tavern'], island.id) is None
+
+
+def test_unknown_location_rebuilds_the_graph(db_session, seeded_world):
+    tr.reachable_destinations(db_session, 1, seeded_world['hamlet'])
+    cellar = Location(seed_id=1, name='Cellar', type='cellar', terrain='plains',
+                      longitude=0.0, latitude=0.0, parent_id=seeded_world['hamlet'].id)
+    db_session.add(cellar)
+    db_session.commit()
+    names = {d['name'] for d in tr.reachable_destinations(db_session, 1, cellar)}
+    assert {'Tavern', 'Smithy', 'Hamlet', 'Keep'} <= names
+
+
 def test_resolve_current_location_uses_character_pointer(db_session, seeded_world):
     char = (db_session.query(Character)
             .filter(Character.seed_id == 1).first())
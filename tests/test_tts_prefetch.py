@@ -0,0 +1,92 @@
+"""Tests for background TTS prefetching.
+
+``elevenlabs_service.synthesize`` is stubbed with a fake that blocks until
+released, so each test controls exactly when renders are in flight.
+"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+
+from app.services import elevenlabs_service, tts_prefetch
+
+
+@pytest.fixture
+def gated_synthesize():
+    release = threading.Event()
+    calls = []
+
+    def synthesize(api_key, voice_id, text, *, cache_dir=None, **kwargs):
+        calls.append((voice_id, text))
+        release.wait(timeout=5)
+        with open(elevenlabs_service._cache_path(cache_dir, voice_id, text), 'wb') as fh:
+            fh.write(b'mp3')
+        return b'mp3'
+
+    with patch.object(elevenlabs_service, 'synthesize', side_effect=synthesize):
+        yield release, calls
+    release.set()
+
+
+def _drain():
+    deadline = time.monotonic() + 5
+    while tts_prefetch._in_flight and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert not tts_prefetch._in_flight
+
+
+def test_prefetch_renders_each_line_once(tmp_path, gated_synthesize):
+    release, calls = gated_synthesize
+    lines = [('v', 'Rain falls.'), ('v', 'Rain falls.'), (None, 'The door creaks.')]
+    assert tts_prefetch.prefetch('k', 1, str(tmp_path), lines) == 2
+    # Already in flight: queued again by a second turn, still skipped.
+    assert tts_prefetch.prefetch('k', 1, str(tmp_path), lines[:1]) == 0
+    release.set()
+    assert tts_prefetch.wait_for('v', 'Rain falls.', timeout=5)
+    _drain()
+    assert elevenlabs_service.cached_audio_path('v', 'Rain falls.', str(tmp_path))
+    # Cached now, so nothing is queued.
+    assert tts_prefetch.prefetch('k', 1, str(tmp_path), lines[:1]) == 0
+    assert sorted(calls) == [(elevenlabs_service.NARRATOR_VOICE_ID, 'The door creaks.'),
+                             ('v', 'Rain falls.')]
+
+
+def test_prefetch_caps_pending_jobs_per_user(tmp_path, gated_synthesize, monkeypatch):
+    release, calls = gated_synthesize
+    monkeypatch.setattr(tts_prefetch, 'MAX_PENDING_PER_USER', 2)
+    lines = [('v', f'Line {i}.') for i in range(4)]
+    assert tts_prefetch.prefetch('k', 1, str(tmp_path), lines) == 2
+    # Another user's quota is separate.
+    assert tts_prefetch.prefetch('k', 2, str(tmp_path), lines[2:3]) == 1
+    release.set()
+    _drain()
+    assert tts_prefetch._pending_per_user == {}
+    assert not elevenlabs_service.cached_audio_path('v', 'Line 3.', str(tmp_path))
+
+
+def test_prefetch_without_key_is_a_no_op(tmp_path, gated_synthesize):
+    _, calls = gated_synthesize
+    assert tts_prefetch.prefetch(None, 1, str(tmp_path), [('v', 'Hello.')]) == 0
+    assert calls == []
+    assert tts_prefetch.wait_for('v', 'Hello.', timeout=0) is False
+
+
+def test_wait_for_skips_renders_still_queued(tmp_path, gated_synthesize, monkeypatch):
+    release, calls = gated_synthesize
+    monkeypatch.setattr(tts_prefetch, '_executor', ThreadPoolExecutor(max_workers=1))
+    assert tts_prefetch.prefetch('k', 1, str(tmp_path),
+                                 [('v', 'First.'), ('v', 'Second.')]) == 2
+    deadline = time.monotonic() + 5
+    while not calls and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    # 'Second.' is queued behind 'First.': no point blocking on it.
+    started = time.monotonic()
+    assert tts_prefetch.wait_for('v', 'Second.', timeout=5) is False
+    assert time.monotonic() - started < 1
+    release.set()
+    assert tts_prefetch.wait_for('v', 'First.', timeout=5)
+    _drain()
+    tts_prefetch._executor.shutdown()
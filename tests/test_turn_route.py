@@ -7,6 +7,8 @@ single ``@pytest.mark.llm`` smoke test still drives both endpoints against
 the real Grok API to catch prompt-format regressions end-to-end.
 """
 import json
+import threading
+import time
 from datetime import datetime
 from unittest.mock import MagicMock, patch
 
@@ -18,10 +20,11 @@ from sqlalchemy.orm import sessionmaker
 from app.orm import (
     Base, Seed, Character, CharacterRelationship, Location, TranscriptEntry,
 )
+from app import routes
 from app.routes import main as main_blueprint
 from app.services import transcript_service
 from app.world_building.schemas import (
-    ActionAdjudicationOut, BackgroundEventsOut,
+    ActionAdjudicationOut, BackgroundEventsOut, SuggestedActionsOut,
     TurnDialogueLineOut, TurnNewCharacterOut, TurnResponseOut,
 )
 
@@ -70,11 +73,11 @@ def _fake_gpt_service(narration='You step forward.', suggestions=None,
                       ruling=None):
     """Return a MagicMock that mimics GPTService for both endpoints.
 
-    ``get_structured`` is called multiple times per turn -- the arbiter
-    adjudication pass, the narration pass, and (when the in-world clock
-    has advanced enough) the autonomous-events pass. The mock dispatches
-    by schema so each call gets a payload of the correct shape.
-    ``get_response`` is called once afterwards for the suggestions JSON.
+    ``get_structured`` is called for the arbiter adjudication pass and the
+    narration pass; the follow-up sends the autonomous-events pass (when
+    the in-world clock has advanced enough) and the suggestions through
+    ``run_structured_many``. The mock dispatches by schema so each call
+    gets a payload of the correct shape.
     """
     if suggestions is None:
         suggestions = ['Look around', 'Talk to a villager', 'Head north', 'Rest']
@@ -97,11 +100,14 @@ def _fake_gpt_service(narration='You step forward.', suggestions=None,
             return ruling
         if schema is BackgroundEventsOut:
             return BackgroundEventsOut(events=[])
+        if schema is SuggestedActionsOut:
+            return SuggestedActionsOut(suggestions=suggestions)
         return turn_payload
 
     svc = MagicMock()
     svc.get_structured.side_effect = _dispatch
-    svc.get_response.return_value = json.dumps({'suggestions': suggestions})
+    svc.run_structured_many.side_effect = (
+        lambda calls, **kwargs: [_dispatch(**call) for call in calls])
     return svc
 
 
@@ -512,9 +518,8 @@ def test_submit_turn_skips_duplicate_new_character(mock_make, client, session_fa
 def test_get_suggestions_returns_list(mock_make, client, session_factory):
     _seed_ready_world(session_factory)
     svc = MagicMock()
-    svc.get_response.return_value = json.dumps({
-        'suggestions': ['Open the door', 'Search the desk', 'Leave', 'Wait'],
-    })
+    svc.get_structured.return_value = SuggestedActionsOut(
+        suggestions=['Open the door', 'Search the desk', 'Leave', 'Wait'])
     mock_make.return_value = svc
 
     response = client.get('/api/seed/1/suggestions')
@@ -541,7 +546,7 @@ def test_get_suggestions_tolerates_llm_failure(mock_make, client, session_factor
     # empty list instead of surfacing an error to the player.
     _seed_ready_world(session_factory)
     svc = MagicMock()
-    svc.get_response.side_effect = RuntimeError('boom')
+    svc.get_structured.side_effect = RuntimeError('boom')
     mock_make.return_value = svc
 
     response = client.get('/api/seed/1/suggestions')
@@ -549,6 +554,275 @@ def test_get_suggestions_tolerates_llm_failure(mock_make, client, session_factor
     assert response.get_json()['suggestions'] == []
 
 
+# ---- Deferred turn follow-up ----
+
+
+def _sse_events(response):
+    return [json.loads(chunk[len('data: '):])
+            for chunk in response.get_data(as_text=True).split('\n\n')
+            if chunk.startswith('data: ')]
+
+
+@pytest.fixture
+def shared_client(tmp_path):
+    """Client whose DB is visible to the follow-up worker thread.
+
+    A file rather than a shared in-memory connection, so a follow-up and
+    the next turn can use the database at the same time.
+    """
+    engine = create_engine(f"sqlite:///{tmp_path / 'turns.db'}")
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine)
+    flask_app = Flask(__name__)
+    flask_app.config['SESSION_FACTORY'] = factory
+    flask_app.config['min_grok'] = 'mock-model'
+    flask_app.register_blueprint(main_blueprint)
+    return flask_app.test_client(), factory
+
+
+@patch('app.routes._make_gpt_service')
+def test_submit_turn_defers_suggestions_to_followup_stream(mock_make, shared_client):
+    client, factory = shared_client
+    _seed_ready_world(factory)
+    mock_make.return_value = _fake_gpt_service(
+        narration='The lane is quiet.',
+        suggestions=['Knock', 'Listen', 'Leave', 'Wait'],
+    )
+
+    response = client.post('/api/seed/1/turn',
+                           data=json.dumps({'action': 'Look around',
+                                            'defer_followup': True}),
+                           content_type='application/json')
+
+    assert response.status_code == 200
+    body = response.get_json()
+    assert body['narration'] == 'The lane is quiet.'
+    assert body['suggestions'] == []
+    assert body['followup']['url'].startswith('/api/seed/1/turn/followup/')
+
+    stream = client.get(body['followup']['url'])
+    assert stream.mimetype == 'text/event-stream'
+    events = _sse_events(stream)
+    assert {'type': 'suggestions',
+            'suggestions': ['Knock', 'Listen', 'Leave', 'Wait']} in events
+    assert events[-1] == {'type': 'complete'}
+    # Simulation and suggestions went out as one concurrent fan-out.
+    fanned_out = mock_make.return_value.run_structured_many.call_args[0][0]
+    assert SuggestedActionsOut in [call['schema'] for call in fanned_out]
+    # A follow-up token is single-use.
+    assert body['followup']['token'] not in routes.turn_followups
+    assert client.get(body['followup']['url']).status_code == 404
+
+
+def test_followup_stream_rejects_unknown_token(client, session_factory):
+    _seed_ready_world(session_factory)
+    assert client.get('/api/seed/1/turn/followup/nope').status_code == 404
+
+
+def test_followup_stream_drops_expired_tokens(client, session_factory):
+    _seed_ready_world(session_factory)
+    routes.turn_followups['stale'] = {
+        'seed_id': 1, 'queue': None,
+        'created': time.monotonic() - routes.TURN_FOLLOWUP_TTL_SECONDS - 1,
+    }
+    assert client.get('/api/seed/1/turn/followup/stale').status_code == 404
+    assert 'stale' not in routes.turn_followups
+
+
+@patch('app.routes._make_gpt_service')
+def test_submit_turn_waits_for_the_seeds_running_followup(mock_make, shared_client):
+    client, factory = shared_client
+    _seed_ready_world(factory)
+    mock_make.return_value = _fake_gpt_service(narration='The lane is quiet.')
+    responses = []
+
+    def post_turn():
+        responses.append(client.post('/api/seed/1/turn',
+                                     data=json.dumps({'action': 'Look around'}),
+                                     content_type='application/json'))
+
+    # Stand in for a follow-up still writing to seed 1.
+    lock = routes._seed_turn_lock(1)
+    lock.acquire()
+    try:
+        worker = threading.Thread(target=post_turn)
+        worker.start()
+        worker.join(0.3)
+        assert worker.is_alive()
+    finally:
+        lock.release()
+    worker.join(5)
+    assert responses[0].status_code == 200
+
+
+@patch('app.routes._make_gpt_service')
+def test_next_turn_does_not_wait_for_followup_llm_calls(mock_make, shared_client):
+    client, factory = shared_client
+    _seed_ready_world(factory)
+    svc = _fake_gpt_service()
+    release = threading.Event()
+    dispatch = svc.run_structured_many.side_effect
+
+    def slow_first_fan_out(calls, **kwargs):
+        if svc.run_structured_many.call_count == 1:
+            release.wait(5)
+        return dispatch(calls, **kwargs)
+
+    svc.run_structured_many.side_effect = slow_first_fan_out
+    mock_make.return_value = svc
+    try:
+        first = client.post('/api/seed/1/turn',
+                            data=json.dumps({'action': 'Look', 'defer_followup': True}),
+                            content_type='application/json')
+        started = time.monotonic()
+        second = client.post('/api/seed/1/turn',
+                             data=json.dumps({'action': 'Wait'}),
+                             content_type='application/json')
+        assert time.monotonic() - started < 2
+        assert second.get_json()['turn'] == 3
+    finally:
+        release.set()
+    assert _sse_events(client.get(first.get_json()['followup']['url']))[-1] == \
+        {'type': 'complete'}
+
+
+def test_seed_locks_are_dropped_when_unused():
+    lock = routes._seed_turn_lock(424242)
+    assert routes._seed_turn_lock(424242) is lock
+    del lock
+    assert 424242 not in routes._seed_turn_locks
+
+
+def _chunked(text, size=5):
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+@patch('app.routes._make_gpt_service')
+def test_turn_stream_emits_paragraphs_as_they_complete(mock_make, shared_client):
+    client, factory = shared_client
+    _seed_ready_world(factory)
+    svc = _fake_gpt_service(suggestions=['Run', 'Hide', 'Fight', 'Talk'])
+    raw = json.dumps({
+        'narration': 'Rain hammers the roof.\n\nA door bangs open.',
+        'dialogue': [{'speaker': 'hero', 'text': 'Who goes there?'}],
+    })
+    svc.stream_response.side_effect = lambda *a, **k: iter(_chunked(raw))
+    mock_make.return_value = svc
+
+    response = client.post('/api/seed/1/turn/stream',
+                           data=json.dumps({'action': 'Listen'}),
+                           content_type='application/json')
+
+    assert response.mimetype == 'text/event-stream'
+    events = _sse_events(response)
+    deltas = ''.join(e['text'] for e in events if e['type'] == 'narration_delta')
+    assert deltas == 'Rain hammers the roof.\n\nA door bangs open.'
+    entries = [e['entry'] for e in events if e['type'] == 'entry']
+    assert [(e['kind'], e['text']) for e in entries] == [
+        ('narration', 'Rain hammers the roof.'),
+        ('narration', 'A door bangs open.'),
+        ('dialogue', 'Who goes there?'),
+    ]
+    assert entries[2]['speaker'] == 'Hero'
+    # The first paragraph is announced before the narration stream ends.
+    first_entry = next(i for i, e in enumerate(events) if e['type'] == 'entry')
+    last_delta = max(i for i, e in enumerate(events) if e['type'] == 'narration_delta')
+    assert first_entry < last_delta
+    turn_event = next(e for e in events if e['type'] == 'turn')
+    assert turn_event['turn'] == 2
+    assert {'type': 'suggestions', 'suggestions': ['Run', 'Hide', 'Fight', 'Talk']} in events
+    assert events[-1] == {'type': 'complete'}
+    # Narration came from the stream, not a buffered structured call.
+    assert all(c.args[1] is not TurnResponseOut
+               for c in svc.get_structured.call_args_list)
+
+    s = factory()
+    kinds = [r.kind for r in s.query(TranscriptEntry).order_by(TranscriptEntry.id)]
+    s.close()
+    assert kinds == ['player_input', 'narration', 'narration', 'dialogue']
+
+
+@patch('app.routes._make_gpt_service')
+def test_turn_stream_holds_the_seed_until_its_turn_is_closed(mock_make, shared_client):
+    client, factory = shared_client
+    _seed_ready_world(factory)
+    svc = _fake_gpt_service()
+    svc.stream_response.side_effect = lambda *a, **k: iter(
+        _chunked(json.dumps({'narration': 'Thunder rolls.'})))
+    mock_make.return_value = svc
+    other_client = client.application.test_client()
+    responses = []
+
+    def post_turn():
+        responses.append(other_client.post(
+            '/api/seed/1/turn', data=json.dumps({'action': 'Wait'}),
+            content_type='application/json'))
+
+    # The stream has opened its turn but not been read yet.
+    stream = client.post('/api/seed/1/turn/stream',
+                         data=json.dumps({'action': 'Listen'}),
+                         content_type='application/json')
+    worker = threading.Thread(target=post_turn)
+    worker.start()
+    worker.join(0.3)
+    assert worker.is_alive()
+    _sse_events(stream)
+    worker.join(5)
+    assert responses[0].get_json()['turn'] == 3
+
+    s = factory()
+    turns = [(r.turn, r.text) for r in s.query(TranscriptEntry)
+             .filter(TranscriptEntry.kind == 'player_input')
+             .order_by(TranscriptEntry.id)]
+    s.close()
+    assert turns == [(1, 'Listen'), (2, 'Wait')]
+
+
+@patch('app.routes._make_gpt_service')
+def test_unread_turn_stream_releases_the_seed_on_close(mock_make, shared_client):
+    client, factory = shared_client
+    _seed_ready_world(factory)
+    mock_make.return_value = _fake_gpt_service()
+
+    stream = client.post('/api/seed/1/turn/stream',
+                         data=json.dumps({'action': 'Listen'}),
+                         content_type='application/json')
+    stream.close()
+    lock = routes._seed_turn_lock(1)
+    assert lock.acquire(timeout=1)
+    lock.release()
+
+
+@patch('app.routes._make_gpt_service')
+def test_turn_stream_falls_back_to_buffered_call_when_stream_fails(mock_make, shared_client):
+    client, factory = shared_client
+    _seed_ready_world(factory)
+    svc = _fake_gpt_service(narration='Quiet settles in.')
+
+    def _broken_stream(*args, **kwargs):
+        raise RuntimeError('stream dropped')
+        yield  # pragma: no cover
+
+    svc.stream_response.side_effect = _broken_stream
+    mock_make.return_value = svc
+
+    response = client.post('/api/seed/1/turn/stream',
+                           data=json.dumps({'action': 'Wait'}),
+                           content_type='application/json')
+
+    events = _sse_events(response)
+    entries = [e['entry'] for e in events if e['type'] == 'entry']
+    assert [e['text'] for e in entries] == ['Quiet settles in.']
+    assert events[-1] == {'type': 'complete'}
+
+
+def test_turn_stream_rejects_unknown_seed_before_streaming(client):
+    response = client.post('/api/seed/99/turn/stream',
+                           data=json.dumps({'action': 'Wait'}),
+                           content_type='application/json')
+    assert response.status_code == 404
+
+
 # ---- Live LLM smoke test ----
 
 
@@ -1,5 +1,13 @@
+import threading
+from unittest.mock import MagicMock
+
 import pytest
 
+from app.orm import Character, NameLibrary
+from app.world_building.schemas import (
+    EventOut, LocationListOut, MainCharacterItemsOut, MainCharacterOut,
+    NamingThemeSelectionOut, NPCListOut, RelationshipOut,
+)
 from app.world_building.world_building import WorldBuilder
 
 
@@ -43,3 +51,102 @@ def test_build_world(db_session, openai_client, grok_model, seed_in_db):
     # Progress callback is invoked for every stage and ends with a success message.
     assert len(progress_messages) > 0
     assert progress_messages[-1] == ("World building complete!", "success")
+
+
+def _fake_structured(barrier):
+    """Schema-dispatching stand-in for ``GPTService.get_structured``.
+
+    The three seed-only phases wait on ``barrier`` so the test fails (with
+    a BrokenBarrierError swallowed into a failed phase) unless they run
+    concurrently.
+    """
+
+    def get_structured(prompt, schema, max_attempts=2, temperature=None):
+        if schema in (NamingThemeSelectionOut, MainCharacterOut, LocationListOut):
+            barrier.wait()
+        if schema is NamingThemeSelectionOut:
+            return schema.model_validate(
+                {'themes': [{'source': 'fantasynames', 'theme': 'elf'}]})
+        if schema is MainCharacterOut:
+            return schema.model_validate({'name': 'Hero', 'race': 'Human',
+                                          'gender': 'male'})
+        if schema is LocationListOut:
+            return schema.model_validate({'locations': [
+                {'name': 'Hamlet', 'sub_locations': [{'name': 'Inn'}]},
+                {'name': 'Keep'},
+            ]})
+        if schema is NPCListOut:
+            return schema.model_validate({'npcs': [
+                {'name': 'Marek', 'gender': 'male'},
+                {'name': 'Ilsa', 'gender': 'female'},
+            ]})
+        if schema is MainCharacterItemsOut:
+            return schema.model_validate({'items': [{'name': 'Lantern'}]})
+        if schema is RelationshipOut:
+            return schema.model_validate({'type': 'friend', 'familiarity': 4})
+        if schema is EventOut:
+            return schema.model_validate({'name': 'Arrival'})
+        raise AssertionError(f'unexpected schema {schema}')
+
+    return get_structured
+
+
+def test_build_world_overlaps_independent_phases(db_session, seed_in_db):
+    db_session.add(NameLibrary(source='fantasynames', theme='elf', gender='any',
+                               category='first', name='Aelar'))
+    db_session.commit()
+    progress = []
+    builder = WorldBuilder({'theme': 'fantasy'}, seed_in_db.id, db_session,
+                           MagicMock(), 'mock-model',
+                           lambda msg, status='info': progress.append((msg, status)))
+    builder.gpt_service.get_structured = _fake_structured(threading.Barrier(3, timeout=5))
+    builder.gpt_service.get_response = lambda prompt, **kw: 'Dawn breaks.'
+
+    results = builder.build_world()
+
+    assert results['naming_themes']['themes'] == [{'source': 'fantasynames', 'theme': 'elf'}]
+    assert results['main_character']['status'] == 'success'
+    assert results['locations']['status'] == 'success'
+    assert results['surrounding_characters']['status'] == 'success'
+    assert results['opening_event']['status'] == 'success'
+    assert results['intro_narration'] == 'Dawn breaks.'
+    assert 'npc_drafts' not in results
+    assert progress[0][0] in {"Selecting theme for the world...",
+                              "Creating main character...", "Creating locations..."}
+    assert progress[-1] == ("World building complete!", "success")
+    # Each settlement fetched its NPCs, and names came from the library
+    # once the theme landed.
+    npcs = db_session.query(Character).filter(Character.main_character == False).all()  # noqa: E712
+    assert len(npcs) == 4
+    assert {c.name for c in npcs} == {'Aelar'}
+
+
+def test_npc_batches_start_before_the_main_character_lands(db_session, seed_in_db):
+    db_session.add(NameLibrary(source='fantasynames', theme='elf', gender='any',
+                               category='first', name='Aelar'))
+    db_session.commit()
+    builder = WorldBuilder({'theme': 'fantasy'}, seed_in_db.id, db_session,
+                           MagicMock(), 'mock-model')
+    fake = _fake_structured(threading.Barrier(3, timeout=5))
+    npc_fetch_started = threading.Event()
+    overlapped = []
+
+    def get_structured(prompt, schema, **kwargs):
+        if schema is NPCListOut:
+            npc_fetch_started.set()
+        result = fake(prompt, schema, **kwargs)
+        if schema is MainCharacterOut:
+            # Hold the MC back until the NPC batches are under way.
+            overlapped.append(npc_fetch_started.wait(5))
+        return result
+
+    builder.gpt_service.get_structured = get_structured
+    builder.gpt_service.get_response = lambda prompt, **kw: 'Dawn breaks.'
+
+    results = builder.build_world()
+
+    assert overlapped == [True]
+    assert results['surrounding_characters']['status'] == 'success'
+    # The writes still waited for the themes, so names came from the library.
+    npcs = db_session.query(Character).filter(Character.main_character == False).all()  # noqa: E712
+    assert {c.name for c in npcs} == {'Aelar'}
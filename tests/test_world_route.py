@@ -7,9 +7,10 @@ from sqlalchemy.orm import sessionmaker
 from app.orm import (
     Base, Seed, Character, Location, Event, EventCharacter, Item, CharacterItem,
     Skill, CharacterSkill, Status, CharacterStatus, CharacterRelationship,
-    Quest,
+    Quest, LocationConnection, GeographicFeature,
 )
 from app.routes import main as main_blueprint
+from app.services import map_cache
 
 
 @pytest.fixture
@@ -160,6 +161,32 @@ def test_list_seeds_returns_all(client, session_factory):
     assert seeds[0]['current_turn'] == 3
 
 
+def test_list_seeds_is_one_query_and_supports_paging(client, session_factory, count_queries):
+    s = session_factory()
+    for seed_id in range(1, 6):
+        s.add(Seed(id=seed_id, current_turn=seed_id, created_at=datetime(2024, 1, seed_id),
+                   updated_at=datetime(2024, 2, 6 - seed_id)))
+        if seed_id != 3:
+            s.add(Character(seed_id=seed_id, main_character=True, alive=True,
+                            name=f'Hero {seed_id}', race='Human', level=1))
+        s.add(Character(seed_id=seed_id, main_character=False, alive=True,
+                        name=f'Side {seed_id}', race='Elf', level=1))
+    s.commit()
+    s.close()
+
+    with count_queries(session_factory) as statements:
+        seeds = client.get('/api/seeds').get_json()['seeds']
+    assert len(statements) == 1
+    assert [x['seed_id'] for x in seeds] == [5, 4, 3, 2, 1]
+    assert seeds[2]['main_character_name'] is None
+    assert seeds[0]['main_character_name'] == 'Hero 5'
+
+    page = client.get('/api/seeds?sort=updated_at&order=asc&limit=2&offset=1').get_json()
+    assert [x['seed_id'] for x in page['seeds']] == [4, 3]
+    assert client.get('/api/seeds?sort=name').status_code == 400
+    assert client.get('/api/seeds?limit=0').status_code == 400
+    assert client.get('/api/seeds?limit=abc').status_code == 400
+
 
 def test_get_world_marks_unmet_npcs_as_strangers(client, session_factory):
     # Seed an NPC with no MC<->NPC relationship row so the read path must
@@ -195,3 +222,123 @@ def test_get_world_marks_unmet_npcs_as_strangers(client, session_factory):
     assert 'Level' not in stranger['description']
 
     assert payload['relationships'] == []
+
+
+def _seed_sized_world(session_factory, seed_id, npc_count, item_count):
+    s = session_factory()
+    s.add(Seed(id=seed_id, current_turn=1, created_at=datetime.now(),
+               updated_at=datetime.now()))
+    s.commit()
+    town = Location(seed_id=seed_id, name='Town', type='city')
+    s.add(town)
+    s.flush()
+    mc = Character(seed_id=seed_id, main_character=True, alive=True, name='Hero',
+                   race='Human', level=1, current_location_id=town.id)
+    s.add(mc)
+    s.flush()
+    for i in range(npc_count):
+        npc = Character(seed_id=seed_id, main_character=False, alive=True,
+                        name=f'NPC {i}', race='Elf', level=1)
+        s.add(npc)
+        s.flush()
+        s.add(CharacterRelationship(seed_id=seed_id, character_id=mc.id,
+                                    related_character_id=npc.id,
+                                    relationship_type='friend', familiarity=5))
+    for i in range(item_count):
+        # Distinct catalog rows so a lazy load could not be served from
+        # the identity map.
+        item = Item(name=f'Item {i}', description='thing', type='misc')
+        skill = Skill(name=f'Skill {i}', description='knack')
+        status = Status(name=f'Status {i}', description='state', type='buff')
+        s.add_all([item, skill, status])
+        s.flush()
+        s.add(CharacterItem(seed_id=seed_id, character_id=mc.id, item_id=item.id,
+                            quantity=1))
+        s.add(CharacterSkill(seed_id=seed_id, character_id=mc.id, skill_id=skill.id,
+                             level=1))
+        s.add(CharacterStatus(seed_id=seed_id, character_id=mc.id,
+                              status_id=status.id, active=True))
+    s.commit()
+    s.close()
+
+
+def test_get_world_query_count_does_not_grow_with_world_size(client, session_factory,
+                                                             count_queries):
+    _seed_sized_world(session_factory, 10, npc_count=2, item_count=2)
+    _seed_sized_world(session_factory, 11, npc_count=60, item_count=120)
+
+    with count_queries(session_factory) as small_statements:
+        client.get('/api/world/10')
+    with count_queries(session_factory) as large_statements:
+        large = client.get('/api/world/11').get_json()
+    small_queries, large_queries = len(small_statements), len(large_statements)
+
+    assert len(large['characters']) == 60
+    assert len(large['items']) == 120
+    assert len(large['skills']) == 120
+    assert len(large['statuses']) == 120
+    assert len(large['relationships']) == 60
+    assert large['items'][0]['description'].startswith('thing')
+    assert large_queries == small_queries
+
+
+def _seed_geography(session_factory, user_id=None):
+    s = session_factory()
+    s.add(Seed(id=5, user_id=user_id, current_turn=1,
+               created_at=datetime.now(), updated_at=datetime.now()))
+    s.commit()
+    town = Location(seed_id=5, name='Town', type='city', longitude=1.0, latitude=2.0)
+    port = Location(seed_id=5, name='Port', type='city')
+    s.add_all([town, port])
+    s.commit()
+    s.add_all([
+        LocationConnection(seed_id=5, from_location_id=town.id,
+                           to_location_id=port.id, name='Coast Road'),
+        GeographicFeature(seed_id=5, name='Deepwood', type='forest',
+                          geometry='[[0, 0], [1, 1], [1, 0]]', closed=True),
+        GeographicFeature(seed_id=5, name='Broken', type='river', geometry='{oops'),
+    ])
+    s.commit()
+    s.close()
+
+
+def test_world_map_is_cached_and_revalidated_by_etag(client, session_factory, count_queries):
+    _seed_geography(session_factory)
+    first = client.get('/api/world/5/map')
+    assert first.status_code == 200
+    data = first.get_json()
+    assert [loc['name'] for loc in data['locations']] == ['Town', 'Port']
+    assert data['connections'][0]['name'] == 'Coast Road'
+    assert [f['name'] for f in data['features']] == ['Deepwood']
+    etag = first.headers['ETag']
+
+    with count_queries(session_factory) as statements:
+        again = client.get('/api/world/5/map')
+        revalidated = client.get('/api/world/5/map', headers={'If-None-Match': etag})
+    assert statements == []
+    assert again.get_data() == first.get_data()
+    assert revalidated.status_code == 304
+    assert revalidated.headers['ETag'] == etag
+
+    # A geography write invalidates the payload and changes the ETag.
+    s = session_factory()
+    s.add(Location(seed_id=5, name='Keep', type='castle'))
+    s.commit()
+    map_cache.invalidate(s.get_bind(), 5)
+    s.close()
+    fresh = client.get('/api/world/5/map', headers={'If-None-Match': etag})
+    assert fresh.status_code == 200
+    assert fresh.headers['ETag'] != etag
+    assert len(fresh.get_json()['locations']) == 3
+
+
+def test_cached_world_map_still_checks_ownership(client, session_factory):
+    _seed_geography(session_factory, user_id=7)
+    client.application.config['LOGIN_REQUIRED'] = True
+    client.application.secret_key = 'test'
+    with client.session_transaction() as sess:
+        sess['user_id'] = 7
+    assert client.get('/api/world/5/map').status_code == 200
+    with client.session_transaction() as sess:
+        sess['user_id'] = 8
+    assert client.get('/api/world/5/map').status_code == 404